@@ -23,6 +23,49 @@ class Settings(BaseSettings):
 
     # Gemini API for AI classification and summarization
     gemini_api_key: str = ""
+    # Point at a local stand-in (scripts/fake_gemini_server.py) for offline runs
+    gemini_api_base: str = "https://generativelanguage.googleapis.com"
+
+    # Digest summarization: one concurrent Gemini request per segment instead of
+    # a single call for the whole digest
+    digest_parallel_segments: bool = False
+    digest_segment_concurrency: int = 4
+
+    # Client-side Gemini rate limits, applied per model across all shows
+    gemini_requests_per_minute: int = 300
+    gemini_tokens_per_minute: int = 1_000_000
+    gemini_max_concurrency: int = 8
+    # Shared circuit breaker: fail fast after this many consecutive Gemini failures,
+    # then let one probe through every reset period
+    gemini_breaker_failures: int = 5
+    gemini_breaker_reset_seconds: int = 60
+    # Race a second request once classification/compile calls pass their p95 latency
+    gemini_hedge_requests: bool = False
+
+    # Upload a 16 kHz mono Opus rendition for audio analysis instead of the published MP3
+    audio_analysis_rendition: bool = True
+    # Analyze overlapping time windows in parallel instead of one call per episode
+    audio_analysis_windows: bool = False
+    audio_window_seconds: int = 600
+    audio_window_overlap_seconds: int = 30
+    audio_window_concurrency: int = 4
+
+    # Gemini response cache (mode is set with NOCTUA_LLM_CACHE, see src/llm_cache.py)
+    llm_cache_path: str = "output/llm_cache.db"
+    llm_cache_max_mb: int = 200
+
+    # Persistent background jobs (see src/job_queue.py). A job's lease is renewed by
+    # heartbeats while it runs; one left behind by a dead process is reclaimed at startup
+    job_queue_path: str = "output/jobs.db"
+    job_lease_seconds: int = 300
+    job_max_attempts: int = 3
+    # Workers per job type (weekly trends and GCS sync always run one at a time)
+    transcription_workers: int = 1
+    learning_analysis_workers: int = 2
+    # Show DB uploads to GCS: writes within this window share one upload, and pending
+    # uploads get up to the flush timeout to finish at shutdown
+    db_sync_debounce_seconds: int = 30
+    db_sync_flush_timeout_seconds: int = 60
 
     # NotebookLM
     notebooklm_notebook_url: str = ""
@@ -35,9 +78,24 @@ class Settings(BaseSettings):
     # Secret for external cron trigger (e.g. cron-job.org)
     cron_secret: str = ""
 
+    # Object storage for episode MP3s and DB sync (src/storage_backend.py): "gcs" or "local"
+    storage_backend: str = "gcs"
+    # Local backend: object directory, and the key for its signed URLs (random per process if
+    # empty)
+    storage_local_dir: str = "output/storage"
+    storage_signing_key: str = ""
+
     # Google Cloud Storage (for permanent episode MP3 hosting)
     gcs_bucket_name: str = ""
     gcs_credentials_json: str = ""
+    # Replicate show DBs as a base snapshot plus changed-page deltas (src/db_replication.py)
+    # instead of uploading the whole file on every sync
+    db_replication: bool = False
+    # Upload a VACUUM INTO copy (compacted, smaller) instead of a plain backup snapshot
+    db_snapshot_vacuum: bool = False
+
+    # Shows initialized in parallel at startup (DB download, catalog sync)
+    startup_concurrency: int = 4
 
     # Serving
     base_url: str = "http://localhost:8000"
@@ -59,6 +117,9 @@ settings = Settings()
 
 NOCTUA_ENV = os.environ.get("NOCTUA_ENV", "dev").lower()
 
+# Gemini response cache mode: off (default), readonly or readwrite
+NOCTUA_LLM_CACHE = os.environ.get("NOCTUA_LLM_CACHE", "off").lower()
+
 
 def is_prod() -> bool:
     """True when running in the production environment (NOCTUA_ENV=prod)."""
@@ -166,12 +227,16 @@ class ShowConfig:
 
 def _get_env(key: str, default: str = "") -> str:
     """Get an env var from os.environ first, then .env file."""
+    global _dotenv_vars
+    if _dotenv_vars is None:
+        # Read on first lookup: single-show mode never needs it
+        _dotenv_vars = dotenv_values(".env")
     return os.environ.get(key, _dotenv_vars.get(key, default))
 
 
-# Load .env file values for SHOW_* vars (pydantic-settings doesn't export
+# .env file values for SHOW_* vars (pydantic-settings doesn't export
 # unknown vars to os.environ, so we read the .env file directly).
-_dotenv_vars = dotenv_values(".env")
+_dotenv_vars: dict[str, str | None] | None = None
 
 
 def load_shows() -> dict[str, ShowConfig]:
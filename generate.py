@@ -4,6 +4,7 @@ import asyncio
 import logging
 import sys
 import uuid
+from collections.abc import Callable
 
 from config import ShowConfig
 from src import (
@@ -11,6 +12,7 @@ from src import (
     database,
     digest_compiler,
     email_fetcher,
+    http_client,
 )
 from src.exceptions import (
     ContentParseError,
@@ -27,6 +29,7 @@ logger = logging.getLogger(__name__)
 async def generate_digest_only(
     show: ShowConfig | None = None,
     save_to_db: bool = True,
+    on_segment: Callable[[str, str], None] | None = None,
 ) -> CompiledDigest | None:
     """Run steps 1-3 of the pipeline: fetch emails, parse, compile digest.
 
@@ -34,73 +37,87 @@ async def generate_digest_only(
         show: Show-specific config. When None, uses legacy defaults.
         save_to_db: Whether to persist the digest to the database.
             Set to False for preparation mode (in-memory preview).
+        on_segment: Optional callback receiving (topic, text) as each
+            segment summary streams in.
 
     Returns:
         The compiled digest, or None if no emails/articles were found.
     """
     db_path = show.db_path if show else None
     run_id = uuid.uuid4().hex[:12]
-    database.start_run(run_id, db_path=db_path)
+
+    # Run bookkeeping is sqlite; keep it off the event loop like the rest of preparation
+    async def log_step(step: str, status: str, message: str = "") -> None:
+        await asyncio.to_thread(database.log_step, run_id, step, status, message,
+                                db_path=db_path)
+
+    async def finish_run(status: str, error_message: str = "") -> None:
+        await asyncio.to_thread(database.finish_run, run_id, status, error_message,
+                                db_path=db_path)
+
+    await asyncio.to_thread(database.start_run, run_id, db_path=db_path)
 
     try:
         # 1. Fetch emails
         logger.info("Step 1/3: Fetching today's emails...")
-        database.log_step(run_id, "1. Fetch emails", "running", db_path=db_path)
+        await log_step("1. Fetch emails", "running")
         try:
-            emails = email_fetcher.fetch_todays_emails(show=show)
+            # The Gmail client is blocking; keep it off the event loop
+            emails = await asyncio.to_thread(email_fetcher.fetch_todays_emails, show=show)
 
             if not emails:
                 logger.info("No emails found. Skipping.")
-                database.log_step(run_id, "1. Fetch emails", "skipped", "No emails found", db_path=db_path)
-                database.finish_run(run_id, "success", db_path=db_path)
+                await log_step("1. Fetch emails", "skipped", "No emails found")
+                await finish_run("success")
                 return None
             msg = f"Fetched {len(emails)} emails"
             logger.info(msg)
-            database.log_step(run_id, "1. Fetch emails", "success", msg, db_path=db_path)
+            await log_step("1. Fetch emails", "success", msg)
         except EmailFetchError as e:
             logger.error("Email fetch failed: %s", e)
-            database.log_step(run_id, "1. Fetch emails", "failed", str(e), db_path=db_path)
-            database.finish_run(run_id, "failed", str(e), db_path=db_path)
+            await log_step("1. Fetch emails", "failed", str(e))
+            await finish_run("failed", str(e))
             raise
 
         # 2. Parse content
         logger.info("Step 2/3: Parsing and classifying email content (AI-assisted)...")
-        database.log_step(run_id, "2. Parse content", "running", db_path=db_path)
+        await log_step("2. Parse content", "running")
         try:
-            digest = content_parser.parse_emails(emails)
+            digest = await content_parser.parse_emails_async(emails, db_path=db_path)
             if not digest.articles:
                 logger.info("No articles extracted. Skipping.")
-                database.log_step(
-                    run_id, "2. Parse content", "skipped", "No articles extracted", db_path=db_path
-                )
-                database.finish_run(run_id, "success", db_path=db_path)
+                await log_step("2. Parse content", "skipped", "No articles extracted")
+                await finish_run("success")
                 return None
             msg = f"Parsed {len(digest.articles)} articles, {digest.total_words} words"
             logger.info(msg)
-            database.log_step(run_id, "2. Parse content", "success", msg, db_path=db_path)
+            await log_step("2. Parse content", "success", msg)
         except ContentParseError as e:
             logger.error("Content parsing failed: %s", e)
-            database.log_step(run_id, "2. Parse content", "failed", str(e), db_path=db_path)
-            database.finish_run(run_id, "failed", str(e), db_path=db_path)
+            await log_step("2. Parse content", "failed", str(e))
+            await finish_run("failed", str(e))
             raise
 
         # 3. Compile digest and save to database
         logger.info("Step 3/3: Compiling AI-summarized digest...")
-        database.log_step(run_id, "3. Compile digest", "running", db_path=db_path)
+        await log_step("3. Compile digest", "running")
         try:
-            compiled = digest_compiler.compile(digest, show=show)
+            compiled = await digest_compiler.compile_async(
+                digest, show=show, on_segment=on_segment,
+            )
             compiled.email_count = len(emails)
 
             if save_to_db:
                 # Check if this date's digest is locked (episode already uploaded)
-                if database.has_episode(compiled.date, db_path=db_path):
+                if await asyncio.to_thread(database.has_episode, compiled.date, db_path=db_path):
                     msg = f"Digest for {compiled.date} is locked (episode exists) — skipping save"
                     logger.info(msg)
-                    database.log_step(run_id, "3. Compile digest", "skipped", msg, db_path=db_path)
-                    database.finish_run(run_id, "success", db_path=db_path)
+                    await log_step("3. Compile digest", "skipped", msg)
+                    await finish_run("success")
                     return compiled
 
-                database.save_digest(
+                await asyncio.to_thread(
+                    database.save_digest,
                     date=compiled.date,
                     markdown_text=compiled.text,
                     article_count=compiled.article_count,
@@ -118,25 +135,32 @@ async def generate_digest_only(
                 f"{compiled.total_words} words, saved to DB"
             )
             logger.info(msg)
-            database.log_step(run_id, "3. Compile digest", "success", msg, db_path=db_path)
+            await log_step("3. Compile digest", "success", msg)
         except DigestCompileError as e:
             logger.error("Digest compilation failed: %s", e)
-            database.log_step(run_id, "3. Compile digest", "failed", str(e), db_path=db_path)
-            database.finish_run(run_id, "failed", str(e), db_path=db_path)
+            await log_step("3. Compile digest", "failed", str(e))
+            await finish_run("failed", str(e))
             raise
 
-        database.finish_run(run_id, "success", db_path=db_path)
+        await finish_run("success")
         logger.info("Digest ready for %s. Upload MP3 after NotebookLM.", compiled.date)
         return compiled
 
     except NoctuaError:
         raise
     except Exception as e:
-        database.log_step(run_id, "Unexpected error", "failed", str(e), db_path=db_path)
-        database.finish_run(run_id, "failed", str(e), db_path=db_path)
+        await log_step("Unexpected error", "failed", str(e))
+        await finish_run("failed", str(e))
         raise
 
 
+async def _generate_cli(show: ShowConfig | None) -> None:
+    try:
+        await generate_digest_only(show=show)
+    finally:
+        await http_client.aclose_async_client()
+
+
 def main() -> None:
     """Entry point for digest preparation (steps 1-3)."""
     from config import shows
@@ -144,7 +168,7 @@ def main() -> None:
     # Use the first configured show for CLI invocation
     show = next(iter(shows.values())) if shows else None
     try:
-        asyncio.run(generate_digest_only(show=show))
+        asyncio.run(_generate_cli(show))
     except NoctuaError as e:
         logger.error("Pipeline failed: %s", e)
         sys.exit(1)
@@ -2,16 +2,16 @@
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 
 from config import LOCAL_TZ, ShowConfig, is_dev, is_prod, settings, shows
-from src import database, feed_builder, gcs_storage
+from src import database, feed_builder, gcs_storage, job_queue
 from src.models import CompiledDigest
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
@@ -41,21 +41,45 @@ class ShowState:
     preparation_cancelled: bool = False
     preparation_digest: CompiledDigest | None = None
     preparation_error: str | None = None
+    # Segment summaries streamed in while the digest is being compiled (topic -> text)
+    preparation_live_segments: dict[str, str] = field(default_factory=dict)
+    # False while startup init (DB download, catalog sync) runs; routers answer 503 until then
+    ready: bool = True
 
 
 # Registry: populated during lifespan startup
 _show_states: dict[str, ShowState] = {}
 _next_scheduled_run: datetime | None = None
 
+# Retry-After for requests to a show that is still loading
+STARTUP_RETRY_AFTER_SECONDS = 5
 
-def _resolve_show(show_id: str = "") -> ShowState:
-    """Resolve a show_id to its ShowState. Defaults to the first show."""
+
+def _require_ready(state: ShowState) -> ShowState:
+    """Return state, or raise 503 while the show's startup init is still running."""
+    if not state.ready:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Show '{state.show.show_id}' is still loading — retry shortly.",
+            headers={"Retry-After": str(STARTUP_RETRY_AFTER_SECONDS)},
+        )
+    return state
+
+
+def _resolve_show(show_id: str = "", require_ready: bool = True) -> ShowState:
+    """Resolve a show_id to its ShowState. Defaults to the first show.
+
+    Raises a 503 HTTPException if the show's data is not loaded yet, unless
+    require_ready is False (callers that only need the show's config).
+    """
     if show_id and show_id in _show_states:
-        return _show_states[show_id]
-    # Default to the first configured show
-    if not _show_states:
+        state = _show_states[show_id]
+    elif not _show_states:
         raise RuntimeError("Server is still starting up — no shows loaded yet.")
-    return next(iter(_show_states.values()))
+    else:
+        # Default to the first configured show
+        state = next(iter(_show_states.values()))
+    return _require_ready(state) if require_ready else state
 
 
 def _calc_next_run() -> datetime:
@@ -114,11 +138,16 @@ async def _run_generation(state: ShowState) -> None:
                 stale_prep.unlink()
                 logger.info("[%s] Removed stale prep file: %s", show.show_id, stale_prep.name)
 
-        try:
-            def _run_sync():
-                return asyncio.run(generate_digest_only(show=show, save_to_db=False))
+        state.preparation_live_segments = {}
 
-            result = await asyncio.to_thread(_run_sync)
+        def _on_segment(topic: str, text: str) -> None:
+            state.preparation_live_segments[topic] = text
+
+        try:
+            # Gemini calls are awaited on the server loop; Gmail, sqlite and CPU work use threads
+            result = await generate_digest_only(
+                show=show, save_to_db=False, on_segment=_on_segment,
+            )
 
             if state.preparation_cancelled:
                 state.preparation_digest = None
@@ -138,6 +167,7 @@ async def _run_generation(state: ShowState) -> None:
         finally:
             state.generation_running = False
             state.preparation_cancelled = False
+            state.preparation_live_segments = {}
 
 
 
@@ -158,45 +188,68 @@ async def _scheduler() -> None:
             asyncio.create_task(_run_generation(state))
         # Weekly trend analysis on Sundays
         if datetime.now(UTC).weekday() == 6:  # Sunday
-            asyncio.create_task(_run_weekly_trends())
+            for state in _show_states.values():
+                job_queue.enqueue(WEEKLY_TRENDS_JOB, {"show_id": state.show.show_id},
+                                  dedupe_key=state.show.show_id)
 
 
-async def _run_weekly_trends() -> None:
-    """Run weekly trend analysis for all shows."""
-    from src.episode_analyzer import run_weekly_trend_analysis
-    loop = asyncio.get_event_loop()
-    for state in _show_states.values():
+async def _init_show(state: ShowState, slots: asyncio.Semaphore) -> None:
+    """Download one show's DB from GCS and sync its feed, then mark it ready.
+
+    The show is marked ready even if a step fails (non-fatal, as before): it
+    then serves its local DB.
+    """
+    show = state.show
+    async with slots:
+        timings = {}
+        phase_start = time.monotonic()
         try:
-            result = await loop.run_in_executor(
-                None, run_weekly_trend_analysis, str(state.show.db_path),
+            await asyncio.to_thread(gcs_storage.download_db, show.db_path, show.show_id)
+            timings["db_download"] = time.monotonic() - phase_start
+
+            phase_start = time.monotonic()
+            await asyncio.to_thread(feed_builder.sync_catalog_from_db, show=show)
+            timings["catalog_sync"] = time.monotonic() - phase_start
+
+            # Episodes left mid-transcription by a restart without a job to resume them
+            # (e.g. the job queue file was lost with the container)
+            phase_start = time.monotonic()
+            episodes = await asyncio.to_thread(
+                database.get_episodes_with_audio, limit=200, db_path=show.db_path,
             )
-            if result:
-                # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-                gcs_storage.upload_db(state.show.db_path, state.show.show_id)
-                logger.info("Weekly trends for %s: %d suggestions", state.show.show_id, len(result))
+            for ep in episodes:
+                if ep.get("audio_analysis_status") in ("pending", "running"):
+                    logger.info("[%s] Startup: resuming transcription for %s.",
+                                show.show_id, ep["date"])
+                    enqueue_transcription(ep["date"], show)
+            timings["transcription_check"] = time.monotonic() - phase_start
         except Exception as e:
-            logger.error("Weekly trend analysis failed for %s: %s", state.show.show_id, e)
+            logger.warning("[%s] Non-fatal startup error: %s", show.show_id, e)
+        finally:
+            state.ready = True
+        logger.info("[%s] Startup init complete in %.2fs (%s).", show.show_id,
+                    sum(timings.values()),
+                    ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items()))
 
+    # Check for a missed run once this show's DB is loaded
+    if _missed_todays_run(state):
+        logger.info("[%s] Startup: missed today's scheduled run — triggering now.", show.show_id)
+        asyncio.create_task(_run_generation(state))
 
-async def _deferred_startup():
-    """Download DBs from GCS and sync feeds in background after app starts serving."""
-    def _init_shows():
-        for state in _show_states.values():
-            show = state.show
-            try:
-                gcs_storage.download_db(show.db_path, show.show_id)
-                feed_builder.sync_catalog_from_db(show=show)
-                logger.info("[%s] Startup init complete.", show.show_id)
-            except Exception as e:
-                logger.warning("[%s] Non-fatal startup error: %s", show.show_id, e)
 
-    await asyncio.to_thread(_init_shows)
+async def _deferred_startup(workers: job_queue.WorkerPool):
+    """Initialize all shows concurrently, then start the job workers.
 
-    # Check for missed runs after DB is loaded
-    for state in _show_states.values():
-        if _missed_todays_run(state):
-            logger.info("[%s] Startup: missed today's scheduled run — triggering now.", state.show.show_id)
-            asyncio.create_task(_run_generation(state))
+    Each show serves as soon as its own init finishes. Workers start only once
+    every show DB is in place, so a resumed job never writes to a DB that is
+    about to be replaced by the GCS copy.
+    """
+    started = time.monotonic()
+    slots = asyncio.Semaphore(max(1, settings.startup_concurrency))
+    await asyncio.gather(*(_init_show(state, slots) for state in _show_states.values()))
+    logger.info("Startup: %d show(s) ready in %.2fs.", len(_show_states),
+                time.monotonic() - started)
+    workers.start()
 
 
 @asynccontextmanager
@@ -209,17 +262,33 @@ async def lifespan(app: FastAPI):
         logger.warning("Running in DEV mode — GCS writes disabled. "
                         "Set NOCTUA_ENV=prod to enable GCS persistence.")
 
-    # Initialize per-show state
+    # Initialize per-show state; each show is marked ready by _init_show()
     for show_id, show in shows.items():
-        _show_states[show_id] = ShowState(show=show)
+        _show_states[show_id] = ShowState(show=show, ready=False)
 
     # Ensure output directories exist (fast, non-blocking)
     for state in _show_states.values():
         state.show.episodes_dir.mkdir(parents=True, exist_ok=True)
         state.show.exports_dir.mkdir(parents=True, exist_ok=True)
 
+    # Jobs still leased by the previous process were interrupted: queue them again
+    job_queue.reclaim_stalled(expired_only=False)
+    job_queue.purge_finished()
+    workers = job_queue.WorkerPool(
+        handlers={
+            TRANSCRIBE_JOB: _run_transcription_job,
+            LEARNING_JOB: _run_learning_job,
+            WEEKLY_TRENDS_JOB: _run_weekly_trends_job,
+            GCS_SYNC_JOB: _run_gcs_sync_job,
+        },
+        concurrency={
+            TRANSCRIBE_JOB: settings.transcription_workers,
+            LEARNING_JOB: settings.learning_analysis_workers,
+        },
+    )
+
     # Start GCS download and feed sync in background (don't block health checks)
-    init_task = asyncio.create_task(_deferred_startup())
+    init_task = asyncio.create_task(_deferred_startup(workers))
 
     task = asyncio.create_task(_scheduler())
     logger.info("Background scheduler started (%02d:%02d UTC). Shows: %s",
@@ -228,10 +297,19 @@ async def lifespan(app: FastAPI):
     yield
     task.cancel()
     init_task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for background in (task, init_task):
+        try:
+            await background
+        except asyncio.CancelledError:
+            pass
+    # After startup has finished or been cancelled, so the workers can't start late.
+    # Upload DB changes still inside their debounce window before the workers go.
+    if workers.started and not await workers.drain(
+        GCS_SYNC_JOB, timeout=settings.db_sync_flush_timeout_seconds,
+    ):
+        logger.warning("Shutdown: DB sync to GCS did not finish in %ds — "
+                       "it will run on the next start.", settings.db_sync_flush_timeout_seconds)
+    await workers.stop()
 
 
 app = FastAPI(title="The Hootline", description="Daily podcast generator", lifespan=lifespan)
@@ -253,46 +331,102 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 
-async def _transcribe_episode_background(date: str, mp3_path: Path, show: ShowConfig) -> None:
-    """Run audio transcription in background, save results to DB, then run learning analysis."""
+# --- Background jobs (see src/job_queue.py) ---
+
+TRANSCRIBE_JOB = "transcribe"
+LEARNING_JOB = "learning_analysis"
+WEEKLY_TRENDS_JOB = "weekly_trends"
+GCS_SYNC_JOB = "gcs_sync"
+
+
+def enqueue_transcription(date: str, show: ShowConfig) -> int:
+    """Queue audio transcription (then learning analysis) for a published episode."""
+    database.set_audio_analysis_status(date, "pending", db_path=show.db_path)
+    return job_queue.enqueue(TRANSCRIBE_JOB, {"show_id": show.show_id, "date": date},
+                             dedupe_key=f"{show.show_id}:{date}")
+
+
+def enqueue_db_sync(show: ShowConfig) -> int:
+    """Mark the show DB dirty: queue one GCS upload for it after the debounce window.
+
+    Further writes before that upload starts join it instead of queueing another.
+    A write during the upload queues the next one, so the last change is never lost.
+    """
+    return job_queue.enqueue(GCS_SYNC_JOB, {"show_id": show.show_id}, dedupe_key=show.show_id,
+                             delay_seconds=settings.db_sync_debounce_seconds)
+
+
+def _job_show(job: job_queue.Job) -> ShowConfig:
+    state = _show_states.get(job.payload["show_id"])
+    if state is None:
+        raise RuntimeError(f"Unknown show: {job.payload['show_id']}")
+    return state.show
+
+
+async def _run_transcription_job(job: job_queue.Job) -> None:
+    """Transcribe an episode's audio, save the analysis, then queue learning analysis."""
     from src.audio_transcriber import transcribe_episode
+    show = _job_show(job)
+    date = job.payload["date"]
+    mp3_path = show.episodes_dir / f"noctua-{date}.mp3"
+    if not mp3_path.exists():
+        # Retrying won't bring the file back
+        logger.error("Audio transcription for %s skipped: %s not found", date, mp3_path.name)
+        database.set_audio_analysis_status(date, "failed", db_path=show.db_path)
+        return
     try:
         database.set_audio_analysis_status(date, "running", db_path=show.db_path)
         segment_order = show.format.segment_order
         segment_durations = show.format.segment_durations
-        loop = asyncio.get_event_loop()
-        analysis = await loop.run_in_executor(
-            None, lambda: transcribe_episode(mp3_path, segment_order, segment_durations, db_path=show.db_path)
+        analysis = await asyncio.to_thread(
+            transcribe_episode, mp3_path, segment_order, segment_durations, db_path=show.db_path,
         )
-        # Extract word_counts for backward compat, store full analysis
-        word_counts = analysis.get("word_counts", analysis)
-        database.update_audio_analysis(
-            date, word_counts, audio_analysis_full=analysis, db_path=show.db_path,
+    except Exception:
+        database.set_audio_analysis_status(
+            date, "failed" if job.final_attempt else "pending", db_path=show.db_path,
         )
-        # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-        gcs_storage.upload_db(show.db_path, show.show_id)
-        logger.info("Audio transcription complete for %s: %d topics, %d gaps, %d tone findings",
-                     date, sum(1 for v in word_counts.values() if v > 0),
-                     len(analysis.get("coverage_gaps", [])),
-                     len(analysis.get("tone_findings", [])))
-
-        # Run learning system analysis
-        try:
-            from src.episode_analyzer import analyze_episode
-            quality_report = database.get_quality_report(date, db_path=show.db_path)
-            learn_result = await loop.run_in_executor(
-                None, analyze_episode, date, analysis, quality_report, str(show.db_path),
-            )
-            # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-            gcs_storage.upload_db(show.db_path, show.show_id)
-            logger.info("Learning analysis complete for %s: %d findings, %d suggestions",
-                        date, learn_result["findings_count"], learn_result["suggestions_count"])
-        except Exception as e:
-            logger.error("Learning analysis failed for %s: %s", date, e)
-
-    except Exception as e:
-        logger.error("Audio transcription failed for %s: %s", date, e)
-        database.set_audio_analysis_status(date, "failed", db_path=show.db_path)
-
+        raise
+    # Extract word_counts for backward compat, store full analysis
+    word_counts = analysis.get("word_counts", analysis)
+    database.update_audio_analysis(
+        date, word_counts, audio_analysis_full=analysis, db_path=show.db_path,
+    )
+    enqueue_db_sync(show)
+    logger.info("Audio transcription complete for %s: %d topics, %d gaps, %d tone findings",
+                date, sum(1 for v in word_counts.values() if v > 0),
+                len(analysis.get("coverage_gaps", [])),
+                len(analysis.get("tone_findings", [])))
+    job_queue.enqueue(LEARNING_JOB, {"show_id": show.show_id, "date": date},
+                      dedupe_key=f"{show.show_id}:{date}")
+
+
+async def _run_learning_job(job: job_queue.Job) -> None:
+    """Run learning system analysis on a transcribed episode."""
+    from src.episode_analyzer import analyze_episode
+    show = _job_show(job)
+    date = job.payload["date"]
+    analysis = database.get_audio_analysis_full(date, db_path=show.db_path)
+    quality_report = database.get_quality_report(date, db_path=show.db_path)
+    learn_result = await asyncio.to_thread(
+        analyze_episode, date, analysis, quality_report, str(show.db_path),
+    )
+    enqueue_db_sync(show)
+    logger.info("Learning analysis complete for %s: %d findings, %d suggestions",
+                date, learn_result["findings_count"], learn_result["suggestions_count"])
 
 
+async def _run_weekly_trends_job(job: job_queue.Job) -> None:
+    """Run weekly trend analysis for one show."""
+    from src.episode_analyzer import run_weekly_trend_analysis
+    show = _job_show(job)
+    result = await asyncio.to_thread(run_weekly_trend_analysis, str(show.db_path))
+    if result:
+        enqueue_db_sync(show)
+        logger.info("Weekly trends for %s: %d suggestions", show.show_id, len(result))
+
+
+async def _run_gcs_sync_job(job: job_queue.Job) -> None:
+    """Upload a show's DB to GCS."""
+    show = _job_show(job)
+    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
+    await asyncio.to_thread(gcs_storage.upload_db, show.db_path, show.show_id)
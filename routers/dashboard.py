@@ -42,7 +42,8 @@ def _build_dashboard_html(show_id: str = "") -> str:
     if show_id and show_id in _show_states:
         show = _show_states[show_id].show
     else:
-        show = _resolve_show("").show
+        # Only the show's config is needed: the page renders while data loads
+        show = _resolve_show("", require_ready=False).show
         show_id = show.show_id
     title = show.podcast_title
     tagline = show.podcast_description
@@ -33,6 +33,12 @@ def _get_show_states():
     return _show_states
 
 
+def _get_require_ready():
+    """Late import to avoid circular dependency."""
+    from main import _require_ready
+    return _require_ready
+
+
 # --- Prompt config ---
 
 @router.get("/api/prompt-config")
@@ -398,7 +404,7 @@ def api_export_episodes(show_id: str = Query(default="")):
                 headers={"Content-Disposition": f'attachment; filename="{zip_name}"'},
             )
 
-    # Download any missing MP3s from GCS before zipping
+    # Download any missing MP3s from object storage before zipping
     all_episodes = database.list_episodes(db_path=show.db_path)
     if not all_episodes:
         return JSONResponse({"error": "No episodes found."}, status_code=404)
@@ -408,10 +414,14 @@ def api_export_episodes(show_id: str = Query(default="")):
         local_mp3 = episodes_dir / mp3_name
         if not local_mp3.exists() and ep.get("gcs_url"):
             try:
-                logger.info("Export: downloading %s from GCS...", mp3_name)
-                resp = requests.get(ep["gcs_url"], timeout=300)
-                resp.raise_for_status()
-                local_mp3.write_bytes(resp.content)
+                logger.info("Export: downloading %s from storage...", mp3_name)
+                try:
+                    gcs_storage.download_episode(ep["date"], local_mp3, show_id=show.show_id)
+                except (FileNotFoundError, RuntimeError):
+                    # Not under this show's key, or no storage configured here: use the URL
+                    resp = requests.get(ep["gcs_url"], timeout=300)
+                    resp.raise_for_status()
+                    local_mp3.write_bytes(resp.content)
             except Exception as e:
                 logger.warning("Export: failed to download %s: %s", mp3_name, e)
 
@@ -639,7 +649,7 @@ async def show_digest_html_view(show_id: str, date: str) -> Response:
     _show_states = _get_show_states()
     if show_id not in _show_states:
         return Response(content="Show not found.", status_code=404)
-    state = _show_states[show_id]
+    state = _get_require_ready()(_show_states[show_id])
     digest = database.get_digest(date, db_path=state.show.db_path)
     if not digest:
         return Response(content="Digest not found.", status_code=404)
@@ -671,7 +681,7 @@ async def show_digest_download(show_id: str, date: str) -> Response:
     _show_states = _get_show_states()
     if show_id not in _show_states:
         return Response(content="Show not found.", status_code=404)
-    state = _show_states[show_id]
+    state = _get_require_ready()(_show_states[show_id])
     digest = database.get_digest(date, db_path=state.show.db_path)
     if not digest:
         return Response(content="Digest not found.", status_code=404)
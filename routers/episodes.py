@@ -1,25 +1,30 @@
 """Episode routes — publish, upload, transcribe, serve audio, feed."""
 
-import asyncio
 import json
 import logging
 import re
 import shutil
 import subprocess
 from datetime import UTC, datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 
 from fastapi import APIRouter, Form, Query, Request, Response, UploadFile
 from fastapi.responses import FileResponse, JSONResponse
 
 from config import settings
-from src import database, episode_manager, feed_builder, gcs_storage
+from src import database, episode_manager, feed_builder, storage_backend
 from src.episode_manager import _ffmpeg_path
 
 logger = logging.getLogger(__name__)
 
 ACCEPTED_AUDIO_EXTENSIONS = {".mp3", ".m4a", ".wav", ".ogg", ".webm"}
 
+# Podcast apps poll the feed; let them (and proxies) reuse it briefly, then revalidate
+FEED_CACHE_CONTROL = "public, max-age=300"
+# Preferred first when the client accepts several
+FEED_ENCODINGS = ("br", "gzip")
+
 router = APIRouter()
 
 
@@ -33,6 +38,11 @@ def _get_show_states():
     return _show_states
 
 
+def _get_require_ready():
+    from main import _require_ready
+    return _require_ready
+
+
 @router.get("/api/latest-episode")
 async def api_latest_episode(show_id: str = Query(default="")):
     """Get the latest episode and the latest digest."""
@@ -111,6 +121,11 @@ async def api_latest_episode(show_id: str = Query(default="")):
             "date": state.preparation_date,
             "existing_episode": existing_episode,
             "error": state.preparation_error,
+            # Segments already summarized while the digest is still compiling
+            "live_segments": [
+                {"topic": topic, "words": len(text.split()), "text": text}
+                for topic, text in list(state.preparation_live_segments.items())
+            ] if state.generation_running else [],
             "digest": {
                 "date": state.preparation_digest.date,
                 "article_count": state.preparation_digest.article_count,
@@ -198,12 +213,10 @@ async def api_publish_episode(date: str = Form(""), show_id: str = Form("")):
     state.preparation_active = False
     state.preparation_digest = None
 
-    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-    gcs_storage.upload_db(show.db_path, show.show_id)
-
-    # Trigger audio transcription in background (non-blocking)
-    from main import _transcribe_episode_background
-    asyncio.create_task(_transcribe_episode_background(date, mp3_path, show))
+    # Sync the DB, then transcribe the audio, as background jobs (non-blocking)
+    from main import enqueue_db_sync, enqueue_transcription
+    enqueue_db_sync(show)
+    enqueue_transcription(date, show)
 
     # Determine feed URL
     is_legacy = show.is_legacy
@@ -248,9 +261,8 @@ async def api_transcribe_episode(date: str = Form(""), show_id: str = Form("")):
     if current and current.get("audio_analysis_status") == "running":
         return JSONResponse({"error": "Transcription already in progress."}, status_code=409)
 
-    database.set_audio_analysis_status(date, "pending", db_path=show.db_path)
-    from main import _transcribe_episode_background
-    asyncio.create_task(_transcribe_episode_background(date, mp3_path, show))
+    from main import enqueue_transcription
+    enqueue_transcription(date, show)
 
     return JSONResponse({"status": "ok", "message": f"Transcription started for {date}."})
 
@@ -443,26 +455,75 @@ async def api_bump_revision(date: str = Form(""), show_id: str = Form("")):
 # --- Feed & Episode file serving ---
 
 @router.get("/feed.xml")
-async def feed() -> Response:
+async def feed(request: Request) -> Response:
     """Serve the RSS podcast feed (default show, backward compat)."""
     state = _get_resolve_show()("")
-    feed_path = state.show.feed_path
-    if not feed_path.exists():
-        return Response(content="Feed not yet generated.", status_code=404)
-    return FileResponse(feed_path, media_type="application/rss+xml")
+    return _serve_feed(state.show, request)
 
 
 @router.get("/{show_id}/feed.xml")
-async def show_feed(show_id: str) -> Response:
+async def show_feed(show_id: str, request: Request) -> Response:
     """Serve a show-specific RSS podcast feed."""
     _show_states = _get_show_states()
     if show_id not in _show_states:
         return Response(content="Show not found.", status_code=404)
-    state = _show_states[show_id]
-    feed_path = state.show.feed_path
-    if not feed_path.exists():
+    state = _get_require_ready()(_show_states[show_id])
+    return _serve_feed(state.show, request)
+
+
+def _accepted_encoding(accept_encoding: str, available: dict[str, bytes]) -> str | None:
+    """Pick a pre-compressed variant the client accepts (q > 0), or None for identity."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip())
+    for coding in FEED_ENCODINGS:
+        if coding in available and (coding in accepted or "*" in accepted):
+            return coding
+    return None
+
+
+def _feed_not_modified(request: Request, feed: feed_builder.FeedBytes) -> bool:
+    """Evaluate If-None-Match (any variant's ETag) or, without it, If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")}
+        current = {feed.etag, *(f"{feed.etag}-{coding}" for coding in feed.encoded)}
+        return "*" in tags or bool(tags & current)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return feed.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _serve_feed(show, request: Request) -> Response:
+    """Serve a feed from memory, answering 304 when the client's copy is current."""
+    feed = feed_builder.get_feed_bytes(show)
+    if feed is None:
         return Response(content="Feed not yet generated.", status_code=404)
-    return FileResponse(feed_path, media_type="application/rss+xml")
+
+    coding = _accepted_encoding(request.headers.get("accept-encoding", ""), feed.encoded)
+    headers = {
+        "ETag": f'"{feed.etag}-{coding}"' if coding else f'"{feed.etag}"',
+        "Last-Modified": formatdate(feed.last_modified, usegmt=True),
+        "Cache-Control": FEED_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if _feed_not_modified(request, feed):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(content=feed.encoded[coding] if coding else feed.body,
+                    media_type="application/rss+xml", headers=headers)
 
 
 @router.get("/episodes/{filename}")
@@ -478,10 +539,32 @@ async def show_episode(show_id: str, filename: str, request: Request) -> Respons
     _show_states = _get_show_states()
     if show_id not in _show_states:
         return Response(content="Show not found.", status_code=404)
-    state = _show_states[show_id]
+    state = _get_require_ready()(_show_states[show_id])
     return _serve_episode(state.show.episodes_dir, filename, request)
 
 
+@router.get("/storage/{key:path}")
+async def stored_object(key: str, request: Request, expires: int = Query(default=0),
+                        signature: str = Query(default="")) -> Response:
+    """Serve an object from the local storage backend.
+
+    Episodes are public, like the GCS bucket; anything else needs a signed URL.
+    """
+    if settings.storage_backend != "local":
+        return Response(content="Not found.", status_code=404)
+    backend = storage_backend.get_backend()
+    path = backend.path(key)
+    if path is None:
+        return Response(content="Invalid key.", status_code=400)
+    if not key.startswith("episodes/") and not backend.verify(key, expires, signature):
+        return Response(content="Invalid or expired signature.", status_code=403)
+    if path.suffix == ".mp3":
+        return _serve_episode(path.parent, path.name, request)
+    if not path.is_file():
+        return Response(content="Not found.", status_code=404)
+    return FileResponse(path)
+
+
 def _serve_episode(episodes_dir: Path, filename: str, request: Request) -> Response:
     """Serve an episode MP3 file with range request support."""
     file_path = episodes_dir / filename
@@ -6,7 +6,7 @@ import logging
 from fastapi import APIRouter, Form, Query
 from fastapi.responses import JSONResponse
 
-from src import database, gcs_storage
+from src import database
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,12 @@ def _get_resolve_show():
     return _resolve_show
 
 
+def _enqueue_db_sync(show) -> None:
+    """Queue a background GCS sync of the show DB (late import, as above)."""
+    from main import enqueue_db_sync
+    enqueue_db_sync(show)
+
+
 def _infer_prompt_key(suggestion: dict) -> str | None:
     """Infer which prompt_key a suggestion targets based on its content."""
     detail = (suggestion.get("detail", "") + " " + suggestion.get("title", "")).lower()
@@ -98,8 +104,7 @@ async def api_learning_approve(suggestion_id: int = Form(0), show_id: str = Form
                 suggestion_id=suggestion_id,
                 db_path=db,
             )
-    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-    gcs_storage.upload_db(db, state.show.show_id)
+    _enqueue_db_sync(state.show)
     return JSONResponse({"status": "ok"})
 
 
@@ -110,8 +115,7 @@ async def api_learning_dismiss(suggestion_id: int = Form(0), show_id: str = Form
     updated = database.update_suggestion_status(suggestion_id, "dismissed", db_path=state.show.db_path)
     if not updated:
         return JSONResponse({"error": "Suggestion not found."}, status_code=404)
-    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-    gcs_storage.upload_db(state.show.db_path, state.show.show_id)
+    _enqueue_db_sync(state.show)
     return JSONResponse({"status": "ok"})
 
 
@@ -122,8 +126,7 @@ async def api_learning_snooze(suggestion_id: int = Form(0), show_id: str = Form(
     updated = database.update_suggestion_status(suggestion_id, "snoozed", db_path=state.show.db_path)
     if not updated:
         return JSONResponse({"error": "Suggestion not found."}, status_code=404)
-    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
-    gcs_storage.upload_db(state.show.db_path, state.show.show_id)
+    _enqueue_db_sync(state.show)
     return JSONResponse({"status": "ok"})
 
 
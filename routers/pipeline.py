@@ -9,7 +9,7 @@ from fastapi import APIRouter, Query, Request, Response
 from fastapi.responses import JSONResponse
 
 from config import settings
-from src import database
+from src import circuit_breaker, database, hedging, http_client, job_queue, rate_limiter
 from src.episode_manager import _ffmpeg_path
 
 logger = logging.getLogger(__name__)
@@ -49,6 +49,7 @@ async def health() -> dict:
         "next_scheduled_run": _next_scheduled_run.isoformat() if _next_scheduled_run else None,
         "generation_schedule_utc": f"{settings.generation_hour:02d}:{settings.generation_minute:02d}",
         "shows": list(_show_states.keys()),
+        "shows_loading": [sid for sid, s in _show_states.items() if not s.ready],
     }
 
 
@@ -66,6 +67,7 @@ async def health_detail() -> dict:
             "digests": len(database.list_digests(db_path=show.db_path)),
             "feed_exists": show.feed_path.exists(),
             "generation_running": state.generation_running,
+            "ready": state.ready,
         }
 
     return {
@@ -75,6 +77,11 @@ async def health_detail() -> dict:
         "generation_schedule_utc": f"{settings.generation_hour:02d}:{settings.generation_minute:02d}",
         "ffmpeg": _ffmpeg_path(),
         "ffmpeg_available": shutil.which("ffmpeg") is not None,
+        "http_pools": http_client.pool_stats(),
+        "llm_rate_limits": rate_limiter.stats(),
+        "llm_circuit_breakers": circuit_breaker.stats(),
+        "llm_hedging": hedging.stats(),
+        "background_jobs": job_queue.stats(),
     }
 
 
@@ -113,7 +113,7 @@ def backfill_date(target_date_str: str, show=None):
         return
 
     # 2. Parse
-    digest = content_parser.parse_emails(emails)
+    digest = content_parser.parse_emails(emails, db_path=show.db_path if show else None)
     if not digest.articles:
         logger.warning("No articles extracted for %s. Skipping.", target_date_str)
         return
@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import shows
 from src import database
-from src.audio_transcriber import transcribe_episode
+from src.audio_transcriber import analysis_rendition_path, transcribe_episode
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
 logger = logging.getLogger("backfill_analysis")
@@ -92,6 +92,7 @@ def backfill(date: str, show_id: str = "hootline"):
         # Clean up temp file if we downloaded from GCS
         if tmp_mp3:
             Path(tmp_mp3.name).unlink(missing_ok=True)
+            analysis_rendition_path(Path(tmp_mp3.name)).unlink(missing_ok=True)
 
     if not audio_analysis:
         print("Transcription failed")
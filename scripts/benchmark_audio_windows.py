@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark windowed audio analysis against the single-call path.
+
+Analyzes one episode twice — one generateContent call for the whole audio,
+then overlapping time windows in parallel — and reports wall-clock time and
+how closely the results agree (per-topic word counts, coverage gaps, tone
+findings). Works against the real API or a local stand-in
+(GEMINI_API_BASE, see scripts/fake_gemini_server.py).
+
+Usage:
+    python3 scripts/benchmark_audio_windows.py --date 2026-02-28
+    python3 scripts/benchmark_audio_windows.py --mp3 output/episodes/noctua-2026-02-28.mp3 \\
+        --window-seconds 480 --overlap-seconds 20 --concurrency 4
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import settings, shows
+from src.audio_transcriber import transcribe_episode
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+logger = logging.getLogger("benchmark_audio_windows")
+
+
+def _run(mp3_path: Path, show, windowed: bool) -> tuple[dict, float]:
+    start = time.monotonic()
+    analysis = transcribe_episode(mp3_path, show.format.segment_order,
+                                  show.format.segment_durations, db_path=show.db_path,
+                                  use_cache=False, windowed=windowed)
+    return analysis, time.monotonic() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare single-call and windowed audio analysis")
+    parser.add_argument("--date", help="Episode date (YYYY-MM-DD); finds noctua-<date>.mp3")
+    parser.add_argument("--mp3", type=Path, help="Explicit MP3 path")
+    parser.add_argument("--show-id", default="hootline")
+    parser.add_argument("--window-seconds", type=int, default=settings.audio_window_seconds)
+    parser.add_argument("--overlap-seconds", type=int,
+                        default=settings.audio_window_overlap_seconds)
+    parser.add_argument("--concurrency", type=int, default=settings.audio_window_concurrency)
+    args = parser.parse_args()
+
+    show = shows.get(args.show_id)
+    if not show:
+        print(f"Unknown show_id: {args.show_id}")
+        return 2
+    mp3_path = args.mp3 or (show.episodes_dir / f"noctua-{args.date}.mp3" if args.date else None)
+    if not mp3_path or not mp3_path.exists():
+        print(f"MP3 not found: {mp3_path}")
+        return 2
+
+    settings.audio_window_seconds = args.window_seconds
+    settings.audio_window_overlap_seconds = args.overlap_seconds
+    settings.audio_window_concurrency = args.concurrency
+
+    single, single_secs = _run(mp3_path, show, windowed=False)
+    windowed, windowed_secs = _run(mp3_path, show, windowed=True)
+
+    print(f"\nWall clock: single call {single_secs:.0f}s, windowed {windowed_secs:.0f}s "
+          f"({single_secs / max(windowed_secs, 0.001):.1f}x)\n")
+
+    print(f"{'Topic':<30} {'Single':>7} {'Windowed':>9} {'Diff':>6}")
+    a_counts, b_counts = single["word_counts"], windowed["word_counts"]
+    abs_diffs = []
+    for name in show.format.segment_order:
+        a, b = a_counts.get(name, 0), b_counts.get(name, 0)
+        abs_diffs.append(abs(b - a))
+        print(f"{name[:30]:<30} {a:>7} {b:>9} {b - a:>+6}")
+    a_total, b_total = sum(a_counts.values()), sum(b_counts.values())
+    print(f"{'TOTAL':<30} {a_total:>7} {b_total:>9} {b_total - a_total:>+6}")
+
+    a_gaps = {g["topic"] for g in single.get("coverage_gaps", [])}
+    b_gaps = {g["topic"] for g in windowed.get("coverage_gaps", [])}
+    a_tone = {(f.get("topic"), f.get("issue")) for f in single.get("tone_findings", [])}
+    b_tone = {(f.get("topic"), f.get("issue")) for f in windowed.get("tone_findings", [])}
+    print("\nAgreement:")
+    print(f"  Total word drift:       {abs(b_total - a_total) / max(a_total, 1):.1%}")
+    print(f"  Mean per-topic |diff|:  {sum(abs_diffs) / max(len(abs_diffs), 1):.0f} words")
+    print(f"  Coverage gaps shared:   {len(a_gaps & b_gaps)}/{len(a_gaps | b_gaps)}")
+    print(f"  Tone findings shared:   {len(a_tone & b_tone)}/{len(a_tone | b_tone)}")
+    print(f"  Runtime estimate:       {single.get('runtime_seconds', 0)}s vs "
+          f"{windowed.get('runtime_seconds', 0)}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
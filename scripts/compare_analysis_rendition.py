@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Check that the compact analysis rendition gives the same word counts as the full MP3.
+
+Runs audio analysis twice on one episode — once uploading the published MP3,
+once uploading the 16 kHz mono Opus rendition — and prints upload sizes,
+timings and per-topic word counts side by side. Exits non-zero if the total
+word count differs by more than --tolerance.
+
+Usage:
+    python3 scripts/compare_analysis_rendition.py --date 2026-02-28
+    python3 scripts/compare_analysis_rendition.py \
+        --mp3 output/episodes/noctua-2026-02-28.mp3 --tolerance 0.03
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import shows
+from src.audio_transcriber import prepare_analysis_audio, transcribe_episode
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+logger = logging.getLogger("compare_analysis_rendition")
+
+
+def _run(mp3_path: Path, show, rendition: bool) -> tuple[dict, float]:
+    start = time.monotonic()
+    analysis = transcribe_episode(mp3_path, show.format.segment_order,
+                                  show.format.segment_durations, db_path=show.db_path,
+                                  rendition=rendition, use_cache=False)
+    return analysis, time.monotonic() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full-MP3 and rendition audio analysis")
+    parser.add_argument("--date", help="Episode date (YYYY-MM-DD); finds noctua-<date>.mp3")
+    parser.add_argument("--mp3", type=Path, help="Explicit MP3 path")
+    parser.add_argument("--show-id", default="hootline")
+    parser.add_argument("--tolerance", type=float, default=0.05,
+                        help="Max allowed relative difference in total words (default: 0.05)")
+    args = parser.parse_args()
+
+    show = shows.get(args.show_id)
+    if not show:
+        print(f"Unknown show_id: {args.show_id}")
+        return 2
+    mp3_path = args.mp3 or (show.episodes_dir / f"noctua-{args.date}.mp3" if args.date else None)
+    if not mp3_path or not mp3_path.exists():
+        print(f"MP3 not found: {mp3_path}")
+        return 2
+
+    rendition_path, _ = prepare_analysis_audio(mp3_path)
+    full, full_secs = _run(mp3_path, show, rendition=False)
+    compact, compact_secs = _run(mp3_path, show, rendition=True)
+
+    full_size = mp3_path.stat().st_size
+    compact_size = rendition_path.stat().st_size
+    print(f"\nUpload size: {full_size / 1e6:.1f} MB → {compact_size / 1e6:.1f} MB "
+          f"({full_size / max(compact_size, 1):.1f}x smaller)")
+    print(f"Upload + analysis: {full_secs:.0f}s → {compact_secs:.0f}s\n")
+
+    print(f"{'Topic':<30} {'Full':>7} {'Compact':>8} {'Diff':>6}")
+    full_counts = full.get("word_counts", {})
+    compact_counts = compact.get("word_counts", {})
+    for name in show.format.segment_order:
+        a, b = full_counts.get(name, 0), compact_counts.get(name, 0)
+        print(f"{name[:30]:<30} {a:>7} {b:>8} {b - a:>+6}")
+    full_total, compact_total = sum(full_counts.values()), sum(compact_counts.values())
+    print(f"{'TOTAL':<30} {full_total:>7} {compact_total:>8} {compact_total - full_total:>+6}")
+    print(f"Runtime: {full.get('runtime_seconds', 0)}s vs {compact.get('runtime_seconds', 0)}s")
+
+    drift = abs(compact_total - full_total) / max(full_total, 1)
+    print(f"\nTotal word-count drift: {drift:.1%} (tolerance {args.tolerance:.0%})")
+    return 0 if drift <= args.tolerance else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
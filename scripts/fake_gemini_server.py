@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Run a local stand-in for the Gemini API (see src/fake_gemini.py).
+
+Record real responses once, then replay them offline with injected latency
+and errors to benchmark or load-test the pipeline without network access.
+Point the app at the server with GEMINI_API_BASE=http://127.0.0.1:<port>.
+
+Usage:
+    python3 scripts/fake_gemini_server.py --mode record --recordings output/gemini_recordings.jsonl
+    python3 scripts/fake_gemini_server.py --recordings output/gemini_recordings.jsonl \\
+        --latency-ms 800 --jitter-ms 400 --error-rate 0.05
+    python3 scripts/fake_gemini_server.py --default-text '{"1": "Misc"}'
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.fake_gemini import REAL_API_BASE, FakeGeminiServer, FaultConfig
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+logger = logging.getLogger("fake_gemini_server")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local record/replay Gemini API stand-in")
+    parser.add_argument("--mode", choices=["replay", "record"], default="replay")
+    parser.add_argument("--recordings", type=Path, default=None,
+                        help="JSON-lines recordings file (read in replay, appended in record)")
+    parser.add_argument("--upstream", default=REAL_API_BASE,
+                        help="Real API base URL used in record mode")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of generate calls answered with an injected error")
+    parser.add_argument("--error-codes", default="429,500,503",
+                        help="Comma-separated statuses to inject")
+    parser.add_argument("--chunk-chars", type=int, default=200,
+                        help="Characters per streamed SSE chunk")
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0)
+    parser.add_argument("--processing-polls", type=int, default=1,
+                        help="Polls an uploaded file stays PROCESSING")
+    parser.add_argument("--default-text", default=None,
+                        help="Answer for requests with no recording (default: 404)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_codes=tuple(int(c) for c in args.error_codes.split(",") if c.strip()),
+        stream_chunk_chars=args.chunk_chars,
+        stream_chunk_delay_ms=args.chunk_delay_ms,
+        processing_polls=args.processing_polls,
+        seed=args.seed,
+    )
+    responder = (lambda model, payload: args.default_text) if args.default_text else None
+    server = FakeGeminiServer(
+        recordings_path=args.recordings, mode=args.mode, responder=responder,
+        faults=faults, upstream=args.upstream, host=args.host, port=args.port,
+    )
+    logger.info("Run the app with GEMINI_API_BASE=%s", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopped. Stats: %s", server.stats())
+
+
+if __name__ == "__main__":
+    main()
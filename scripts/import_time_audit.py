@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Audit app import time and time to first /health response.
+
+Runs `python -X importtime -c "import main"` in fresh interpreters and reports
+the median total, the slowest modules, and any dependency that should only
+load on first use (DEFERRED_MODULES) but is imported at startup. With --ttfb,
+also starts the app under uvicorn and times the first successful /health.
+
+Usage:
+    python3 scripts/import_time_audit.py
+    python3 scripts/import_time_audit.py --runs 9 --top 30 --ttfb
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Loaded on first use (GCS, Gmail, HTML parsing, MP3 metadata, feed building)
+DEFERRED_MODULES = ("google.cloud", "google.api_core", "googleapiclient", "google_crc32c",
+                    "bs4", "lxml", "mutagen", "feedgen")
+
+
+def importtime(module: str = "main") -> tuple[int, dict[str, tuple[int, int]]]:
+    """Import module in a fresh interpreter.
+
+    Returns (total µs, {module name: (self µs, cumulative µs)}).
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    modules = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules[module][1], modules
+
+
+def deferred_loaded(modules: dict) -> list[str]:
+    return sorted(name for name in modules
+                  if any(name == d or name.startswith(d + ".") for d in DEFERRED_MODULES))
+
+
+def time_to_first_byte(port: int, timeout: float = 60.0) -> float:
+    """Seconds from launching uvicorn until /health answers 200."""
+    start = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.monotonic() - start < timeout:
+            try:
+                if requests.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    return time.monotonic() - start
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.01)
+        raise TimeoutError(f"/health did not answer within {timeout:.0f}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Audit app import time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="Slowest modules to list")
+    parser.add_argument("--ttfb", action="store_true", help="Also time the first /health")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    totals = []
+    for _ in range(args.runs):
+        total, modules = importtime()
+        totals.append(total)
+    print(f"import main: median {statistics.median(totals) / 1000:.0f} ms "
+          f"over {args.runs} runs (min {min(totals) / 1000:.0f} ms)")
+
+    print("\nSlowest modules (self time, last run):")
+    slowest = sorted(modules.items(), key=lambda m: -m[1][0])[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"  {self_us / 1000:7.1f} ms  {cumulative_us / 1000:7.1f} ms cumulative  {name}")
+
+    loaded = deferred_loaded(modules)
+    if loaded:
+        print(f"\nDeferred dependencies imported at startup: {', '.join(loaded)}")
+    else:
+        print("\nNo deferred dependencies imported at startup.")
+
+    if args.ttfb:
+        samples = [time_to_first_byte(args.port) for _ in range(args.runs)]
+        print(f"\nFirst /health: median {statistics.median(samples) * 1000:.0f} ms "
+              f"(min {min(samples) * 1000:.0f} ms)")
+    return 1 if loaded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
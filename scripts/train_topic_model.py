@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Train the local topic model from a show's classification history.
+
+Training data comes from two places in the show DB:
+  - article_labels: every article Gemini classified (source, title, snippet, topic)
+  - digests.segment_sources: which senders fed which segment in past digests
+    (source-only samples — they teach the model each sender's usual topic)
+
+The trained model is stored in the topic_models table and picked up by
+topic_classifier on the next classification run.
+
+Usage:
+    python3 scripts/train_topic_model.py
+    python3 scripts/train_topic_model.py --show-id sparrow --holdout 0.2
+    python3 scripts/train_topic_model.py --dry-run
+"""
+
+import argparse
+import logging
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import shows
+from src import database, gcs_storage
+from src.topic_classifier import LOCAL_MODEL_CONFIDENCE
+from src.topic_model import evaluate, model_text, train
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+logger = logging.getLogger("train_topic_model")
+
+
+def load_samples(db_path: Path, include_segment_sources: bool = True) -> list[tuple[str, str]]:
+    """Collect (text, label) training pairs from the show DB."""
+    samples = [
+        (model_text(lb["source"], lb["title"], lb["snippet"]), lb["topic"])
+        for lb in database.get_article_labels(db_path=db_path)
+    ]
+    print(f"Article labels: {len(samples)}")
+
+    if include_segment_sources:
+        source_samples = []
+        for d in database.get_topic_coverage(limit=365, db_path=db_path):
+            for topic, sources in d["segment_sources"].items():
+                for source in sources:
+                    source_samples.append((model_text(source, "", ""), topic))
+        print(f"Segment-source samples: {len(source_samples)}")
+        samples.extend(source_samples)
+
+    return samples
+
+
+def main(show_id: str, holdout: float, include_segment_sources: bool,
+         min_samples: int, dry_run: bool) -> None:
+    show = shows.get(show_id)
+    if not show:
+        print(f"Unknown show_id: {show_id}")
+        return
+
+    samples = load_samples(show.db_path, include_segment_sources)
+    if len(samples) < min_samples:
+        print(f"Only {len(samples)} samples (need {min_samples}) — not training.")
+        return
+
+    metrics = {}
+    if holdout > 0:
+        rng = random.Random(0)
+        shuffled = samples[:]
+        rng.shuffle(shuffled)
+        cut = int(len(shuffled) * (1 - holdout))
+        train_set, test_set = shuffled[:cut], shuffled[cut:]
+        model = train(train_set)
+        metrics = evaluate(model, test_set, confidence=LOCAL_MODEL_CONFIDENCE)
+        print(f"\nHoldout ({len(test_set)} samples):")
+        print(f"  Accuracy:                 {metrics['accuracy']:.1%}")
+        print(f"  Auto-assigned (>= {LOCAL_MODEL_CONFIDENCE}):  {metrics['coverage']:.1%}")
+        print(f"  Auto-assigned accuracy:   {metrics['confident_accuracy']:.1%}")
+
+    # Final model trains on everything
+    model = train(samples)
+    print(f"\nTrained on {model.sample_count} samples, {len(model.labels)} labels")
+
+    if dry_run:
+        print("Dry run — model not saved.")
+        return
+
+    model_id = database.save_topic_model(
+        model.to_json(), model.sample_count, metrics=metrics, db_path=show.db_path,
+    )
+    print(f"Saved topic model {model_id} to {show.db_path}")
+    # NOTE: In dev, this does NOT sync to GCS. Set NOCTUA_ENV=prod to persist.
+    gcs_storage.upload_db(show.db_path, show.show_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the local topic model")
+    parser.add_argument("--show-id", default="hootline", help="Show ID (default: hootline)")
+    parser.add_argument("--holdout", type=float, default=0.2,
+                        help="Fraction held out for evaluation (0 to skip, default: 0.2)")
+    parser.add_argument("--no-segment-sources", action="store_true",
+                        help="Train on article labels only")
+    parser.add_argument("--min-samples", type=int, default=200,
+                        help="Refuse to train with fewer samples (default: 200)")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate without saving")
+    args = parser.parse_args()
+    main(args.show_id, args.holdout, not args.no_segment_sources,
+         args.min_samples, args.dry_run)
@@ -0,0 +1,213 @@
+"""Local audio metrics: runtime, speech ratio, long silences and host talk time.
+
+Deterministic and free — computed from the episode audio on every
+transcription instead of asking Gemini. ffmpeg decodes the audio to 16 kHz
+mono PCM, streamed in blocks so memory stays flat for any episode length, and
+everything else is NumPy over 30 ms frames:
+
+- Voice activity: frame energy against an adaptive noise floor, with short
+  gaps closed so pauses between words are not counted as silence.
+- Long silences: non-speech runs of at least LONG_SILENCE_SECONDS.
+- Host balance (coarse): pitch is estimated per voiced frame by
+  autocorrelation and clustered into two voices. If the two clusters are not
+  clearly separated, one voice is assumed. Two hosts with very similar voices
+  will read as one.
+"""
+
+import logging
+import subprocess
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from src.episode_manager import _ffmpeg_path
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.03
+FRAME_SAMPLES = int(SAMPLE_RATE * FRAME_SECONDS)
+BLOCK_FRAMES = 2000  # frames decoded per read (60 s of audio)
+DECODE_TIMEOUT = 300  # seconds; a decode running longer is killed
+
+# Voice activity
+SPEECH_MARGIN_DB = 12.0  # above the noise floor
+SPEECH_RANGE_DB = 30.0  # below the loud level (for audio with almost no silence)
+MIN_SPEECH_DB = -50.0  # never call quieter frames speech
+NOISE_FLOOR_PERCENTILE = 10
+LOUD_PERCENTILE = 95
+MAX_PAUSE_SECONDS = 0.3  # shorter gaps inside speech are not silence
+LONG_SILENCE_SECONDS = 2.0
+
+# Pitch and speaker clustering
+MIN_PITCH_HZ = 60
+MAX_PITCH_HZ = 400
+VOICING_THRESHOLD = 0.4  # normalized autocorrelation peak
+MIN_VOICE_SEPARATION = 3.0  # cluster distance in pooled standard deviations
+MIN_VOICE_OCTAVES = 0.25  # and in pitch (~19%), so one voice's intonation is not split
+MIN_HOST_SHARE = 0.1  # each host needs this share of speech to count as present
+SMOOTHING_FRAMES = 15  # speaker labels are majority-voted over ~0.45 s
+
+
+def _frame_features(samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-frame energy (dBFS) and pitch (Hz, 0 where unvoiced) for float samples."""
+    n_frames = len(samples) // FRAME_SAMPLES
+    if n_frames == 0:
+        return np.empty(0), np.empty(0)
+    frames = samples[:n_frames * FRAME_SAMPLES].reshape(n_frames, FRAME_SAMPLES)
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+
+    # Autocorrelation via FFT, normalized by lag 0
+    centered = (frames - frames.mean(axis=1, keepdims=True)) * np.hanning(FRAME_SAMPLES)
+    spectrum = np.fft.rfft(centered, n=2 * FRAME_SAMPLES)
+    autocorr = np.fft.irfft(np.abs(spectrum) ** 2)[:, :FRAME_SAMPLES]
+    autocorr /= autocorr[:, :1] + 1e-10
+    min_lag = SAMPLE_RATE // MAX_PITCH_HZ
+    max_lag = SAMPLE_RATE // MIN_PITCH_HZ
+    lags = np.argmax(autocorr[:, min_lag:max_lag], axis=1) + min_lag
+    strength = autocorr[np.arange(n_frames), lags]
+    pitch = np.where(strength >= VOICING_THRESHOLD, SAMPLE_RATE / lags, 0.0)
+    return energy_db, pitch
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) indices of each run of True values."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _speech_mask(energy_db: np.ndarray) -> np.ndarray:
+    """Frames that carry speech, with short pauses inside speech filled in."""
+    if len(energy_db) == 0:
+        return np.zeros(0, dtype=bool)
+    floor, loud = np.percentile(energy_db, [NOISE_FLOOR_PERCENTILE, LOUD_PERCENTILE])
+    threshold = max(min(floor + SPEECH_MARGIN_DB, loud - SPEECH_RANGE_DB), MIN_SPEECH_DB)
+    speech = energy_db > threshold
+    starts, ends = _runs(~speech)
+    short = (ends - starts) * FRAME_SECONDS < MAX_PAUSE_SECONDS
+    # Only gaps between two speech runs are pauses; leading/trailing silence stays
+    inner = (starts > 0) & (ends < len(speech))
+    for start, end in zip(starts[short & inner], ends[short & inner]):
+        speech[start:end] = True
+    return speech
+
+
+def _host_split(pitch: np.ndarray) -> tuple[float, float, list[float]]:
+    """Share of voiced speech per host (larger first) and the cluster pitches in Hz."""
+    voiced = pitch[pitch > 0]
+    if len(voiced) < SMOOTHING_FRAMES * 2:
+        return 1.0, 0.0, []
+    log_pitch = np.log2(voiced)
+
+    # 1-D 2-means on log pitch
+    centers = np.percentile(log_pitch, [25, 75])
+    for _ in range(20):
+        labels = np.abs(log_pitch - centers[0]) > np.abs(log_pitch - centers[1])
+        if labels.all() or not labels.any():
+            return 1.0, 0.0, [float(2 ** np.median(log_pitch))]
+        new = np.array([log_pitch[~labels].mean(), log_pitch[labels].mean()])
+        if np.allclose(new, centers):
+            break
+        centers = new
+
+    spread = np.sqrt((log_pitch[~labels].var() + log_pitch[labels].var()) / 2) + 1e-6
+    distance = abs(centers[1] - centers[0])
+    if distance < MIN_VOICE_OCTAVES or distance / spread < MIN_VOICE_SEPARATION:
+        return 1.0, 0.0, [float(2 ** np.median(log_pitch))]
+
+    # Majority vote over a short window: turns last longer than a frame
+    window = np.ones(SMOOTHING_FRAMES) / SMOOTHING_FRAMES
+    smoothed = np.convolve(labels.astype(float), window, mode="same") > 0.5
+    high_share = float(smoothed.mean())
+    shares = sorted([1 - high_share, high_share], reverse=True)
+    return shares[0], shares[1], [float(2 ** c) for c in centers]
+
+
+def _summarize(energy_db: np.ndarray, pitch: np.ndarray, n_samples: int) -> dict:
+    speech = _speech_mask(energy_db)
+    runtime = n_samples / SAMPLE_RATE
+    speech_seconds = float(speech.sum() * FRAME_SECONDS)
+
+    starts, ends = _runs(~speech)
+    long_gaps = (ends - starts) * FRAME_SECONDS >= LONG_SILENCE_SECONDS
+    silences = [
+        {"start": round(float(s) * FRAME_SECONDS, 1),
+         "end": round(float(e) * FRAME_SECONDS, 1),
+         "seconds": round(float(e - s) * FRAME_SECONDS, 1)}
+        for s, e in zip(starts[long_gaps], ends[long_gaps])
+    ]
+
+    major, minor, host_pitch = _host_split(np.where(speech, pitch, 0.0))
+    host_seconds = [round(speech_seconds * major, 1), round(speech_seconds * minor, 1)]
+    return {
+        "runtime_seconds": round(runtime, 2),
+        "speech_seconds": round(speech_seconds, 1),
+        "speech_ratio": round(speech_seconds / runtime, 3) if runtime else 0.0,
+        "long_silences": silences,
+        "long_silence_seconds": round(sum(s["seconds"] for s in silences), 1),
+        "host_seconds": host_seconds,
+        "host_balance": round(minor / major, 3) if major else 0.0,
+        "host_pitch_hz": [int(round(p)) for p in host_pitch],
+        "both_hosts_present": bool(minor >= MIN_HOST_SHARE),
+    }
+
+
+def analyze_pcm(samples: np.ndarray) -> dict:
+    """Metrics for mono float samples in [-1, 1] at SAMPLE_RATE."""
+    energy_db, pitch = _frame_features(np.asarray(samples, dtype=np.float64))
+    return _summarize(energy_db, pitch, len(samples))
+
+
+def analyze_file(path: Path) -> dict:
+    """Decode an audio file with ffmpeg and compute its metrics.
+
+    Returns a dict with runtime_seconds, speech_seconds, speech_ratio,
+    long_silences ([{start, end, seconds}]), long_silence_seconds,
+    host_seconds ([larger, smaller]), host_balance (smaller / larger),
+    host_pitch_hz and both_hosts_present.
+
+    Raises:
+        RuntimeError: If ffmpeg fails to decode the file or takes longer than
+            DECODE_TIMEOUT.
+    """
+    cmd = [
+        _ffmpeg_path(), "-v", "error", "-i", str(path), "-vn",
+        "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-",
+    ]
+    block_bytes = BLOCK_FRAMES * FRAME_SAMPLES * 2
+    energy, pitch = [], []
+    n_samples = 0
+    errors: list[bytes] = []
+    timed_out = threading.Event()
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        # stderr is drained on its own thread so ffmpeg never blocks writing it, and
+        # a stalled decode is killed at the deadline, which ends the read loop at EOF
+        drain = threading.Thread(target=lambda: errors.append(proc.stderr.read()), daemon=True)
+        deadline = threading.Timer(DECODE_TIMEOUT, lambda: (timed_out.set(), proc.kill()))
+        drain.start()
+        deadline.start()
+        try:
+            while block := proc.stdout.read(block_bytes):
+                samples = np.frombuffer(block[:len(block) // 2 * 2], dtype=np.int16)
+                n_samples += len(samples)
+                # Blocks are whole frames except the last, whose partial frame is dropped
+                block_energy, block_pitch = _frame_features(samples / 32768.0)
+                energy.append(block_energy)
+                pitch.append(block_pitch)
+        finally:
+            deadline.cancel()
+        proc.wait()
+        drain.join()
+    if timed_out.is_set():
+        raise RuntimeError(f"ffmpeg took longer than {DECODE_TIMEOUT}s to decode {path.name}")
+    stderr = b"".join(errors).decode("utf-8", "replace")
+    if proc.returncode != 0 or n_samples == 0:
+        raise RuntimeError(f"ffmpeg could not decode {path.name}: {stderr[-300:]}")
+
+    metrics = _summarize(np.concatenate(energy), np.concatenate(pitch), n_samples)
+    logger.info("Audio metrics for %s: %.0fs runtime, %.0f%% speech, %d long silences, "
+                "host balance %.2f", path.name, metrics["runtime_seconds"],
+                metrics["speech_ratio"] * 100, len(metrics["long_silences"]),
+                metrics["host_balance"])
+    return metrics
@@ -1,29 +1,66 @@
 """Audio transcription and per-topic word count analysis via Gemini API."""
 
+import hashlib
 import json
 import logging
+import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import requests
 
 from config import settings
+from src import audio_metrics, circuit_breaker, database, http_client, rate_limiter
+from src.episode_manager import _ffmpeg_path
 from src.exceptions import AudioTranscriptionError
+from src.rate_limiter import Priority
 from src.show_bible_context import SHOW_BIBLE_RULES
 
 logger = logging.getLogger(__name__)
 
-API_BASE = "https://generativelanguage.googleapis.com"
-UPLOAD_URL = f"{API_BASE}/upload/v1beta/files"
-FILES_URL = f"{API_BASE}/v1beta/files"
-GENERATE_URL = f"{API_BASE}/v1beta/models/gemini-2.5-flash:generateContent"
+MODEL = "gemini-2.5-flash"
 
 MAX_RETRIES = 3
 RETRY_BACKOFF = [5, 10, 20]
 FILE_POLL_INTERVAL = 5  # seconds
+# Resumable upload chunk size; must be a multiple of 256 KiB (except the final chunk)
+UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+UPLOAD_CHUNK_TIMEOUT = 120  # seconds
 FILE_POLL_TIMEOUT = 120  # seconds
 GENERATE_TIMEOUT = 300  # seconds
 
+# Compact speech rendition uploaded for analysis instead of the published MP3
+ANALYSIS_SUFFIX = ".analysis.ogg"
+ANALYSIS_MIME_TYPE = "audio/ogg"
+ANALYSIS_SAMPLE_RATE = 16000
+ANALYSIS_BITRATE = "32k"
+TRANSCODE_TIMEOUT = 300  # seconds
+HASH_BLOCK_BYTES = 1024 * 1024
+
+WORDS_PER_MINUTE = 150
+COVERAGE_GAP_THRESHOLD = 0.30  # flag topics more than 30% over/under budget
+SEVERITY_RANK = {"warning": 1, "critical": 2}
+
+# Rate-limiter token reservation for an audio analysis call
+AUDIO_TOKENS_PER_SECOND = 32  # Gemini's audio tokenization rate
+DEFAULT_EPISODE_SECONDS = 35 * 60
+MAX_OUTPUT_TOKENS = 16384
+
+
+def _upload_url() -> str:
+    return f"{settings.gemini_api_base}/upload/v1beta/files"
+
+
+def _files_url() -> str:
+    return f"{settings.gemini_api_base}/v1beta/files"
+
+
+def _generate_url() -> str:
+    return f"{settings.gemini_api_base}/v1beta/models/{MODEL}:generateContent"
+
 
 def _api_key() -> str:
     if not settings.gemini_api_key:
@@ -31,10 +68,126 @@ def _api_key() -> str:
     return settings.gemini_api_key
 
 
-def upload_to_gemini(mp3_path: Path) -> str:
+def analysis_rendition_path(mp3_path: Path) -> Path:
+    """Where the analysis rendition of an episode is cached (next to the MP3)."""
+    return mp3_path.with_name(mp3_path.stem + ANALYSIS_SUFFIX)
+
+
+def prepare_analysis_audio(mp3_path: Path) -> tuple[Path, str]:
+    """Return (path, mime type) of the audio to upload for analysis.
+
+    Transcodes the episode to a 16 kHz mono 32 kbps Opus rendition — a
+    fraction of the published MP3's size, with the speech intact — and caches
+    it next to the episode until the MP3 changes. Falls back to the MP3 itself
+    if ffmpeg is unavailable or fails.
+    """
+    rendition = analysis_rendition_path(mp3_path)
+    if rendition.exists() and rendition.stat().st_mtime >= mp3_path.stat().st_mtime:
+        return rendition, ANALYSIS_MIME_TYPE
+
+    tmp_output = rendition.with_name(rendition.name + ".tmp")
+    cmd = [
+        _ffmpeg_path(), "-i", str(mp3_path), "-vn",
+        "-ac", "1", "-ar", str(ANALYSIS_SAMPLE_RATE),
+        "-codec:a", "libopus", "-b:a", ANALYSIS_BITRATE, "-application", "voip",
+        "-f", "ogg", "-y", str(tmp_output),
+    ]
+    start = time.monotonic()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TRANSCODE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        tmp_output.unlink(missing_ok=True)
+        logger.warning("Analysis rendition failed (%s) — uploading the full MP3", e)
+        return mp3_path, "audio/mpeg"
+    if result.returncode != 0:
+        tmp_output.unlink(missing_ok=True)
+        logger.warning("Analysis rendition failed (exit %d: %s) — uploading the full MP3",
+                       result.returncode, result.stderr[-300:])
+        return mp3_path, "audio/mpeg"
+
+    tmp_output.replace(rendition)
+    logger.info("Analysis rendition %s: %d → %d bytes in %.1fs", rendition.name,
+                mp3_path.stat().st_size, rendition.stat().st_size, time.monotonic() - start)
+    return rendition, ANALYSIS_MIME_TYPE
+
+
+def _query_upload_offset(upload_url: str) -> tuple[int, dict | None]:
+    """Ask the upload session how many bytes it has; returns (offset, file info if finalized)."""
+    resp = http_client.post(
+        upload_url,
+        headers={"X-Goog-Upload-Command": "query", "Content-Length": "0"},
+        timeout=30,
+    )
+    resp.raise_for_status()
+    received = int(resp.headers.get("X-Goog-Upload-Size-Received", 0))
+    if resp.headers.get("X-Goog-Upload-Status") == "final":
+        return received, resp.json().get("file", {})
+    return received, None
+
+
+def _upload_chunks(upload_url: str, mp3_path: Path, file_size: int) -> dict:
+    """Send the file in chunks and return the finalized file info.
+
+    Only one chunk is held in memory at a time. After a failed chunk the
+    server is queried for the bytes it actually received and the upload
+    continues from there; MAX_RETRIES consecutive failures without progress
+    abort the upload.
+    """
+    offset = 0
+    failures = 0
+    with open(mp3_path, "rb") as f:
+        while True:
+            f.seek(offset)
+            chunk = f.read(UPLOAD_CHUNK_BYTES)
+            last = offset + len(chunk) >= file_size
+            try:
+                resp = http_client.put(
+                    upload_url,
+                    headers={
+                        "X-Goog-Upload-Offset": str(offset),
+                        "X-Goog-Upload-Command": "upload, finalize" if last else "upload",
+                        "Content-Length": str(len(chunk)),
+                    },
+                    data=chunk,
+                    timeout=UPLOAD_CHUNK_TIMEOUT,
+                )
+                if resp.status_code < 500:
+                    resp.raise_for_status()
+                    if last:
+                        return resp.json().get("file", {})
+                    offset += len(chunk)
+                    failures = 0
+                    continue
+                error = f"{resp.status_code}: {resp.text[:200]}"
+            except requests.exceptions.HTTPError:
+                raise
+            except requests.exceptions.RequestException as e:
+                error = str(e)
+
+            failures += 1
+            if failures >= MAX_RETRIES:
+                raise AudioTranscriptionError(
+                    f"Upload of {mp3_path.name} failed at byte {offset}/{file_size}: {error}"
+                )
+            wait = RETRY_BACKOFF[min(failures - 1, len(RETRY_BACKOFF) - 1)]
+            logger.warning("Upload chunk at byte %d failed (%s), resuming in %ds...",
+                           offset, error, wait)
+            time.sleep(wait)
+            received, file_info = _query_upload_offset(upload_url)
+            if file_info is not None:
+                return file_info
+            if received > offset:
+                failures = 0
+            offset = received
+            logger.info("Resuming upload of %s at byte %d/%d", mp3_path.name, offset, file_size)
+
+
+def upload_to_gemini(mp3_path: Path, mime_type: str = "audio/mpeg") -> str:
     """Upload MP3 to Gemini Files API, return file name (e.g. 'files/abc123').
 
-    Uses resumable upload protocol for large files.
+    Uses the resumable upload protocol: the file is streamed from disk in
+    UPLOAD_CHUNK_BYTES chunks, and an interrupted upload resumes from the
+    offset the server reports rather than starting over.
     """
     key = _api_key()
     file_size = mp3_path.stat().st_size
@@ -44,13 +197,13 @@ def upload_to_gemini(mp3_path: Path) -> str:
 
     # Step 1: Initiate resumable upload
     metadata = json.dumps({"file": {"display_name": display_name}})
-    init_resp = requests.post(
-        f"{UPLOAD_URL}?key={key}",
+    init_resp = http_client.post(
+        f"{_upload_url()}?key={key}",
         headers={
             "X-Goog-Upload-Protocol": "resumable",
             "X-Goog-Upload-Command": "start",
             "X-Goog-Upload-Header-Content-Length": str(file_size),
-            "X-Goog-Upload-Header-Content-Type": "audio/mpeg",
+            "X-Goog-Upload-Header-Content-Type": mime_type,
             "Content-Type": "application/json",
         },
         data=metadata,
@@ -62,29 +215,14 @@ def upload_to_gemini(mp3_path: Path) -> str:
     if not upload_url:
         raise AudioTranscriptionError("No upload URL returned from Gemini Files API")
 
-    # Step 2: Upload the file data
-    with open(mp3_path, "rb") as f:
-        file_data = f.read()
-
-    upload_resp = requests.put(
-        upload_url,
-        headers={
-            "X-Goog-Upload-Offset": "0",
-            "X-Goog-Upload-Command": "upload, finalize",
-            "Content-Length": str(file_size),
-        },
-        data=file_data,
-        timeout=300,
-    )
-    upload_resp.raise_for_status()
-
-    file_info = upload_resp.json().get("file", {})
+    # Step 2: Stream the file in chunks, resuming from the server's offset on failure
+    file_info = _upload_chunks(upload_url, mp3_path, file_size)
     file_name = file_info.get("name", "")
     file_uri = file_info.get("uri", "")
     state = file_info.get("state", "")
 
     if not file_name:
-        raise AudioTranscriptionError(f"No file name in upload response: {upload_resp.text[:200]}")
+        raise AudioTranscriptionError(f"No file name in upload response: {file_info}")
 
     logger.info("File uploaded: %s (state=%s)", file_name, state)
 
@@ -93,8 +231,8 @@ def upload_to_gemini(mp3_path: Path) -> str:
         start_time = time.time()
         while time.time() - start_time < FILE_POLL_TIMEOUT:
             time.sleep(FILE_POLL_INTERVAL)
-            status_resp = requests.get(
-                f"{FILES_URL}/{file_name}?key={key}",
+            status_resp = http_client.get(
+                f"{_files_url()}/{file_name}?key={key}",
                 timeout=15,
             )
             status_resp.raise_for_status()
@@ -115,21 +253,46 @@ def upload_to_gemini(mp3_path: Path) -> str:
     return file_name, file_uri
 
 
-def analyze_audio(file_uri: str, segment_order: list[str],
-                  segment_durations: dict[str, int] | None = None,
-                  db_path=None) -> dict:
-    """Send audio to Gemini for topic-level word count + coverage/tone analysis.
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in blocks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_BYTES):
+            h.update(block)
+    return h.hexdigest()
+
 
-    Returns dict with keys: word_counts, coverage_gaps, tone_findings,
-    runtime_seconds, both_hosts_present.
+def _analysis_cache_key(audio_sha256: str, segment_order: list[str],
+                        segment_durations: dict[str, int] | None,
+                        prompts: tuple[str, str], rendition: bool,
+                        windowed: bool = False) -> str:
+    """Hash everything that shapes an audio analysis into a memoization key.
+
+    The audio is fingerprinted by the published MP3's bytes and the prompts
+    are the effective ones (overrides applied), so re-analysis only happens
+    when the episode, the segment plan or the prompt actually changed.
     """
-    key = _api_key()
-    wpm = 150  # words per minute
+    variant = (f"{ANALYSIS_MIME_TYPE}:{ANALYSIS_SAMPLE_RATE}:{ANALYSIS_BITRATE}" if rendition
+               else "audio/mpeg")
+    if windowed:
+        variant += (f":windows:{settings.audio_window_seconds}"
+                    f":{settings.audio_window_overlap_seconds}")
+    h = hashlib.sha256()
+    for part in (MODEL, audio_sha256, variant, json.dumps(segment_order),
+                 json.dumps(segment_durations or {}, sort_keys=True), *prompts):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _analysis_prompts(segment_order: list[str],
+                      segment_durations: dict[str, int] | None = None,
+                      db_path=None) -> tuple[str, str]:
+    """Build the (system, user) prompts for audio analysis, applying prompt overrides."""
 
     # Check for prompt overrides from the learning system
     prompt_overrides = {}
     try:
-        from src import database
         prompt_overrides = database.get_prompt_overrides(db_path=db_path)
     except Exception:
         pass
@@ -139,7 +302,7 @@ def analyze_audio(file_uri: str, segment_order: list[str],
     budget_lines = []
     for i, name in enumerate(segment_order, 1):
         mins = segment_durations.get(name, 1) if segment_durations else 1
-        word_budget = mins * wpm
+        word_budget = mins * WORDS_PER_MINUTE
         topic_lines.append(f"{i}. {name} ({mins} min budget)")
         budget_lines.append(f"- {name}: {word_budget} words (~{mins} min)")
     topics_text = "\n".join(topic_lines)
@@ -176,7 +339,6 @@ def analyze_audio(file_uri: str, segment_order: list[str],
         "Flag any segment that sounds like a solo monologue as missing_second_host (warning).\n"
         "3. SORKIN RULE: Dialogue should be fast, witty, and warm. "
         "Flag any segment that sounds stiff, robotic, or like a news reader as sorkin_violation (warning).\n\n"
-        "RUNTIME: Estimate total runtime in seconds from the audio.\n\n"
         "Return ONLY a JSON object with this exact structure:\n"
         "{\n"
         '  "word_counts": {"Latest in Tech": 523, ...all 14 topics},\n'
@@ -184,50 +346,96 @@ def analyze_audio(file_uri: str, segment_order: list[str],
         '"gap_percent": 47, "direction": "under"}],\n'
         '  "tone_findings": [{"topic": "...", "issue": "correspondent_framing" | '
         '"missing_second_host" | "sorkin_violation" | "india_outsider_language", '
-        '"description": "...", "severity": "warning" | "critical"}],\n'
-        '  "runtime_seconds": 0,\n'
-        '  "both_hosts_present": true\n'
+        '"description": "...", "severity": "warning" | "critical"}]\n'
         "}\n"
         "Use the exact topic names listed above as keys in word_counts. "
         "Set count to 0 for topics not discussed at all. "
         "coverage_gaps should only include topics with >30% deviation. "
         "tone_findings can be empty if no issues found."
     )
+    return system_prompt, user_prompt
+
+
+def analyze_audio(file_uri: str, segment_order: list[str],
+                  segment_durations: dict[str, int] | None = None,
+                  db_path=None, mime_type: str = "audio/mpeg",
+                  prompts: tuple[str, str] | None = None,
+                  audio_seconds: float | None = None) -> dict:
+    """Send audio to Gemini for topic-level word count + coverage/tone analysis.
+
+    prompts are the (system, user) pair from _analysis_prompts; they are built
+    here when omitted. audio_seconds (the clip length, if known) sizes the
+    rate-limiter token reservation.
+
+    Returns dict with keys: word_counts, coverage_gaps, tone_findings.
+    """
+    key = _api_key()
+    if prompts is None:
+        prompts = _analysis_prompts(segment_order, segment_durations, db_path)
+    system_prompt, user_prompt = prompts
 
     payload = {
         "system_instruction": {"parts": [{"text": system_prompt}]},
         "contents": [{
             "parts": [
-                {"file_data": {"file_uri": file_uri, "mime_type": "audio/mpeg"}},
+                {"file_data": {"file_uri": file_uri, "mime_type": mime_type}},
                 {"text": user_prompt},
             ]
         }],
         "generationConfig": {
-            "maxOutputTokens": 16384,
+            "maxOutputTokens": MAX_OUTPUT_TOKENS,
             "temperature": 0.0,
             "responseMimeType": "application/json",
             "thinkingConfig": {"thinkingBudget": 8192},
         },
     }
 
+    if audio_seconds is not None:
+        episode_seconds = audio_seconds
+    else:
+        episode_seconds = (sum(segment_durations.values()) * 60 if segment_durations
+                           else DEFAULT_EPISODE_SECONDS)
+    reserve = (rate_limiter.estimate_tokens(system_prompt, user_prompt)
+               + int(episode_seconds * AUDIO_TOKENS_PER_SECOND) + MAX_OUTPUT_TOKENS)
+    limiter = rate_limiter.get_limiter(MODEL)
+    breaker = circuit_breaker.get_breaker(MODEL)
+
     last_error = None
     for attempt in range(MAX_RETRIES):
+        if not breaker.allow():
+            raise AudioTranscriptionError(
+                f"Gemini circuit open for {MODEL} — skipping audio analysis "
+                f"(last error: {last_error})"
+            )
         try:
             logger.info("Analyzing audio (attempt %d/%d)...", attempt + 1, MAX_RETRIES)
-            resp = requests.post(
-                f"{GENERATE_URL}?key={key}",
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                timeout=GENERATE_TIMEOUT,
-            )
+            wait = RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
+            with limiter.slot(reserve, Priority.TRANSCRIPTION) as permit:
+                try:
+                    resp = http_client.post(
+                        f"{_generate_url()}?key={key}",
+                        headers={"Content-Type": "application/json"},
+                        json=payload,
+                        timeout=GENERATE_TIMEOUT,
+                    )
+                except requests.exceptions.RequestException:
+                    breaker.record_failure()
+                    raise
+                if resp.status_code == 429:
+                    # Queued calls for this model wait out the backoff too
+                    permit.pause(wait)
+                elif resp.ok:
+                    breaker.record_success()
+                    permit.settle(rate_limiter.usage_tokens(resp.json()))
 
             if resp.status_code == 429 or resp.status_code >= 500:
-                wait = RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
                 logger.warning(
                     "Gemini API %d (attempt %d/%d), retrying in %ds...",
                     resp.status_code, attempt + 1, MAX_RETRIES, wait,
                 )
-                time.sleep(wait)
+                if resp.status_code != 429:
+                    breaker.record_failure()
+                    time.sleep(wait)
                 last_error = f"{resp.status_code}: {resp.text[:200]}"
                 continue
 
@@ -269,8 +477,7 @@ def analyze_audio(file_uri: str, segment_order: list[str],
                 # Old format: the entire dict is word counts
                 word_counts = result
                 result = {"word_counts": word_counts, "coverage_gaps": [],
-                          "tone_findings": [], "runtime_seconds": 0,
-                          "both_hosts_present": True}
+                          "tone_findings": []}
 
             # Validate and normalize word counts: ensure all topics present
             normalized = {}
@@ -302,11 +509,202 @@ def analyze_audio(file_uri: str, segment_order: list[str],
     raise AudioTranscriptionError(f"Audio analysis failed after {MAX_RETRIES} retries: {last_error}")
 
 
+# --- Windowed analysis ---
+
+@dataclass
+class AudioWindow:
+    """One time window of an episode, in seconds.
+
+    [start, end) is the audio sent to Gemini; [core_start, core_end) is the
+    part whose words this window counts. Core ranges tile the episode without
+    gaps or overlap; the padding on either side is context only, so a topic
+    that straddles a boundary is attributed correctly but counted once.
+    """
+
+    start: float
+    end: float
+    core_start: float
+    core_end: float
+
+
+def _plan_windows(duration: float, window_seconds: float,
+                  overlap_seconds: float) -> list[AudioWindow]:
+    """Split duration into equal core ranges of about window_seconds, padded by overlap."""
+    count = max(1, round(duration / window_seconds))
+    core = duration / count
+    windows = []
+    for i in range(count):
+        core_start = i * core
+        core_end = duration if i == count - 1 else (i + 1) * core
+        windows.append(AudioWindow(
+            start=max(0.0, core_start - overlap_seconds),
+            end=min(duration, core_end + overlap_seconds),
+            core_start=core_start,
+            core_end=core_end,
+        ))
+    return windows
+
+
+def _audio_duration(path: Path) -> float | None:
+    """Audio length in seconds (MP3 or Ogg Opus), or None if it cannot be read."""
+    try:
+        import mutagen
+        audio = mutagen.File(str(path))
+        return float(audio.info.length) if audio is not None else None
+    except Exception as e:
+        logger.warning("Could not read duration of %s: %s", path.name, e)
+        return None
+
+
+def _cut_window(audio_path: Path, window: AudioWindow, out_dir: Path, index: int) -> Path:
+    """Copy one window out of the audio with ffmpeg (no re-encode)."""
+    out_path = out_dir / f"window-{index:02d}{audio_path.suffix}"
+    cmd = [
+        _ffmpeg_path(), "-ss", f"{window.start:.2f}", "-t", f"{window.end - window.start:.2f}",
+        "-i", str(audio_path), "-vn", "-codec:a", "copy", "-y", str(out_path),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=TRANSCODE_TIMEOUT)
+    if result.returncode != 0:
+        raise AudioTranscriptionError(
+            f"ffmpeg window cut failed (exit {result.returncode}): {result.stderr[-300:]}"
+        )
+    return out_path
+
+
+def _clock(seconds: float) -> str:
+    return f"{int(seconds) // 60:02d}:{int(seconds) % 60:02d}"
+
+
+def _window_prompt(user_prompt: str, window: AudioWindow) -> str:
+    """Prefix the analysis prompt with which part of the clip to count."""
+    rel_start = window.core_start - window.start
+    rel_end = window.core_end - window.start
+    clip_end = window.end - window.start
+    notes = [
+        f"This clip is an excerpt of the episode, from {_clock(window.start)} to "
+        f"{_clock(window.end)} of the full recording.",
+    ]
+    if rel_start > 0:
+        notes.append(f"The first {int(rel_start)} seconds of the clip overlap the previous "
+                     "excerpt: use them only as context and do NOT count any words spoken "
+                     f"before {_clock(rel_start)} in the clip.")
+    if rel_end < clip_end:
+        notes.append(f"Everything after {_clock(rel_end)} in the clip overlaps the next excerpt: "
+                     "use it only as context and do NOT count words spoken after that point.")
+    notes.append("Only report tone findings for the counted part. The intro/outro exclusions "
+                 "apply only if the intro or outro falls inside the counted part.")
+    return "\n".join(notes) + "\n\n" + user_prompt
+
+
+def _coverage_gaps(word_counts: dict[str, int], segment_order: list[str],
+                   segment_durations: dict[str, int] | None) -> list[dict]:
+    """Topics more than COVERAGE_GAP_THRESHOLD over or under their word budget."""
+    gaps = []
+    for name in segment_order:
+        mins = segment_durations.get(name, 1) if segment_durations else 1
+        budget = mins * WORDS_PER_MINUTE
+        actual = word_counts.get(name, 0)
+        if budget and abs(actual - budget) / budget > COVERAGE_GAP_THRESHOLD:
+            gaps.append({
+                "topic": name,
+                "budget_words": budget,
+                "actual_words": actual,
+                "gap_percent": round(abs(actual - budget) / budget * 100),
+                "direction": "over" if actual > budget else "under",
+            })
+    return gaps
+
+
+def _merge_window_results(results: list[dict], segment_order: list[str],
+                          segment_durations: dict[str, int] | None) -> dict:
+    """Combine per-window analyses into one episode analysis.
+
+    Word counts add up (each window only counts its core range). Coverage
+    gaps are recomputed against the episode budgets, since a window's own
+    gaps are meaningless. Tone findings are de-duplicated on (topic, issue),
+    keeping the most severe, so a problem spanning a boundary is reported once.
+    """
+    word_counts = {name: sum(r["word_counts"].get(name, 0) for r in results)
+                   for name in segment_order}
+
+    findings: dict[tuple[str, str], dict] = {}
+    for r in results:
+        for finding in r.get("tone_findings", []):
+            key = (finding.get("topic", ""), finding.get("issue", ""))
+            kept = findings.get(key)
+            if kept is None or (SEVERITY_RANK.get(finding.get("severity"), 0)
+                                > SEVERITY_RANK.get(kept.get("severity"), 0)):
+                findings[key] = finding
+
+    return {
+        "word_counts": word_counts,
+        "coverage_gaps": _coverage_gaps(word_counts, segment_order, segment_durations),
+        "tone_findings": list(findings.values()),
+    }
+
+
+def analyze_audio_windows(audio_path: Path, segment_order: list[str],
+                          segment_durations: dict[str, int] | None = None,
+                          db_path=None, mime_type: str = "audio/mpeg",
+                          prompts: tuple[str, str] | None = None) -> dict | None:
+    """Analyze the audio as overlapping time windows in parallel and merge the results.
+
+    Each window is cut with ffmpeg, uploaded and analyzed on its own (with its
+    own retries), so latency tracks the window length rather than the episode
+    length and a failure only repeats one window. Returns None when the audio
+    is too short to split or its duration cannot be read — the caller then
+    falls back to a single call.
+    """
+    duration = _audio_duration(audio_path)
+    window_seconds = settings.audio_window_seconds
+    if duration is None or duration < window_seconds * 1.5:
+        return None
+    if prompts is None:
+        prompts = _analysis_prompts(segment_order, segment_durations, db_path)
+    system_prompt, user_prompt = prompts
+    windows = _plan_windows(duration, window_seconds, settings.audio_window_overlap_seconds)
+    logger.info("Analyzing %s as %d windows of ~%ds", audio_path.name, len(windows),
+                int(windows[0].core_end))
+
+    def analyze_window(index: int, path: Path) -> dict:
+        window = windows[index]
+        file_name = None
+        try:
+            file_name, file_uri = upload_to_gemini(path, mime_type)
+            return analyze_audio(
+                file_uri, segment_order, segment_durations, db_path=db_path,
+                mime_type=mime_type, prompts=(system_prompt, _window_prompt(user_prompt, window)),
+                audio_seconds=window.end - window.start,
+            )
+        finally:
+            if file_name:
+                delete_from_gemini(file_name)
+
+    with tempfile.TemporaryDirectory(prefix="noctua-windows-") as tmp:
+        paths = [_cut_window(audio_path, w, Path(tmp), i) for i, w in enumerate(windows)]
+        with ThreadPoolExecutor(max_workers=settings.audio_window_concurrency) as pool:
+            results = list(pool.map(analyze_window, range(len(windows)), paths))
+
+    merged = _merge_window_results(results, segment_order, segment_durations)
+    logger.info("Windowed analysis complete: %d total words across %d windows",
+                sum(merged["word_counts"].values()), len(windows))
+    return merged
+
+
+def _local_metrics(audio_path: Path) -> dict | None:
+    """Runtime, speech and host-balance metrics computed locally, or None on failure."""
+    try:
+        return audio_metrics.analyze_file(audio_path)
+    except Exception as e:
+        logger.warning("Local audio metrics failed for %s: %s", audio_path.name, e)
+        return None
+
+
 def delete_from_gemini(file_name: str) -> None:
     """Delete an uploaded file from Gemini Files API."""
     try:
         key = _api_key()
-        resp = requests.delete(f"{FILES_URL}/{file_name}?key={key}", timeout=15)
+        resp = http_client.delete(f"{_files_url()}/{file_name}?key={key}", timeout=15)
         if resp.ok:
             logger.info("Deleted Gemini file: %s", file_name)
         else:
@@ -317,18 +715,28 @@ def delete_from_gemini(file_name: str) -> None:
 
 def transcribe_episode(mp3_path: Path, segment_order: list[str],
                        segment_durations: dict[str, int] | None = None,
-                       db_path=None) -> dict:
+                       db_path=None, rendition: bool | None = None,
+                       use_cache: bool = True, windowed: bool | None = None) -> dict:
     """Full pipeline: upload audio → analyze topics → cleanup → return full analysis.
 
+    Results are cached in the show DB by audio hash, segment plan and effective
+    prompt, so re-running an unchanged episode skips the Gemini round trip.
+
     Args:
         mp3_path: Path to the MP3 file.
         segment_order: List of topic names in order.
         segment_durations: Optional dict of topic name → allocated minutes.
         db_path: Optional database path for loading prompt overrides.
+        rendition: Upload the compact analysis rendition instead of the MP3
+            (defaults to settings.audio_analysis_rendition).
+        use_cache: Return a cached analysis when one matches.
+        windowed: Analyze overlapping time windows in parallel instead of one
+            call for the whole episode (defaults to settings.audio_analysis_windows).
 
     Returns:
         Full analysis dict with keys: word_counts, coverage_gaps, tone_findings,
-        runtime_seconds, both_hosts_present.
+        runtime_seconds, both_hosts_present and audio_metrics (see
+        src/audio_metrics.py; runtime and host presence come from it, not Gemini).
 
     Raises:
         AudioTranscriptionError: If any step fails.
@@ -336,10 +744,41 @@ def transcribe_episode(mp3_path: Path, segment_order: list[str],
     if not mp3_path.exists():
         raise AudioTranscriptionError(f"MP3 file not found: {mp3_path}")
 
+    if rendition is None:
+        rendition = settings.audio_analysis_rendition
+    if windowed is None:
+        windowed = settings.audio_analysis_windows
+
+    prompts = _analysis_prompts(segment_order, segment_durations, db_path)
+    cache_key = _analysis_cache_key(_file_sha256(mp3_path), segment_order, segment_durations,
+                                    prompts, rendition, windowed)
+    if use_cache:
+        cached = database.get_cached_audio_analysis(cache_key, db_path=db_path)
+        if cached is not None:
+            logger.info("Audio analysis cache hit for %s — skipping upload", mp3_path.name)
+            return cached
+
     file_name = None
     try:
-        file_name, file_uri = upload_to_gemini(mp3_path)
-        result = analyze_audio(file_uri, segment_order, segment_durations, db_path=db_path)
+        if rendition:
+            audio_path, mime_type = prepare_analysis_audio(mp3_path)
+        else:
+            audio_path, mime_type = mp3_path, "audio/mpeg"
+        metrics = _local_metrics(audio_path)
+        result = None
+        if windowed:
+            result = analyze_audio_windows(audio_path, segment_order, segment_durations,
+                                           db_path=db_path, mime_type=mime_type, prompts=prompts)
+        if result is None:
+            file_name, file_uri = upload_to_gemini(audio_path, mime_type)
+            result = analyze_audio(file_uri, segment_order, segment_durations, db_path=db_path,
+                                   mime_type=mime_type, prompts=prompts)
+        result["audio_metrics"] = metrics
+        result["runtime_seconds"] = int(round(metrics["runtime_seconds"])) if metrics else 0
+        result["both_hosts_present"] = metrics["both_hosts_present"] if metrics else True
+        if metrics:
+            # Without local metrics the result is incomplete; analyze again next time
+            database.save_cached_audio_analysis(cache_key, result, db_path=db_path)
         return result
     except AudioTranscriptionError:
         raise
@@ -0,0 +1,116 @@
+"""Shared circuit breaker for Gemini calls.
+
+When Gemini degrades, every caller used to burn through its own retries and
+backoff sleeps before falling back (keywords, raw segment text, skipped
+analysis). The breaker is shared per model: after GEMINI_BREAKER_FAILURES
+consecutive failed attempts (5xx, timeouts, connection errors) it opens, and
+callers fail fast with CircuitOpenError — an LLMAPIError, so existing
+fallbacks kick in immediately, mid-retry-loop included.
+
+After GEMINI_BREAKER_RESET_SECONDS one probe call is let through
+(half-open); success closes the circuit, failure re-opens it. 429s and other
+4xx responses are neither successes nor failures — rate limiting is the
+rate limiter's job.
+"""
+
+import logging
+import threading
+import time
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a timed half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        # Metrics
+        self._trips = 0
+        self._rejected = 0
+
+    def allow(self) -> bool:
+        """True if a call may be sent now; counts a rejection otherwise."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                # Let one probe through; the next one waits another reset period
+                self.state = HALF_OPEN
+                self._opened_at = time.monotonic()
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Gemini circuit for %s closed", self.name)
+            self.state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._trips += 1
+                logger.warning(
+                    "Gemini circuit for %s opened after %d consecutive failures — "
+                    "failing fast for %ds",
+                    self.name, self._failures, self.reset_seconds,
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_lock = threading.Lock()
+
+
+def get_breaker(model: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a model, creating it on first use."""
+    breaker = _breakers.get(model)
+    if breaker is None:
+        with _lock:
+            breaker = _breakers.get(model)
+            if breaker is None:
+                breaker = CircuitBreaker(model, settings.gemini_breaker_failures,
+                                         settings.gemini_breaker_reset_seconds)
+                _breakers[model] = breaker
+    return breaker
+
+
+def stats() -> dict:
+    """Per-model breaker state for /health/detail."""
+    with _lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.stats() for b in breakers}
+
+
+def reset() -> None:
+    """Drop all breakers (recreated closed, from current settings, on next use)."""
+    with _lock:
+        _breakers.clear()
@@ -1,14 +1,19 @@
 """HTML email content parsing — extract clean text from newsletters."""
 
+import asyncio
 import logging
 import re
 from difflib import SequenceMatcher
-
-from bs4 import BeautifulSoup
+from pathlib import Path
 
 from src.exceptions import ContentParseError
 from src.models import Article, DailyDigest, EmailMessage
-from src.topic_classifier import _is_filtered_sender, classify_articles_batch
+from src.topic_classifier import (
+    Topic,
+    _is_filtered_sender,
+    classify_articles_batch,
+    classify_articles_batch_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,7 @@ def _clean_html(html: str) -> str:
     # Remove tracking pixels before parsing
     html = TRACKING_PIXEL_PATTERN.sub("", html)
 
+    from bs4 import BeautifulSoup
     soup = BeautifulSoup(html, "lxml")
 
     # Remove junk tags entirely
@@ -184,15 +190,8 @@ def _split_google_alert(email: EmailMessage) -> list[Article]:
     return articles
 
 
-def parse_emails(emails: list[EmailMessage]) -> DailyDigest:
-    """Parse a list of email messages into a daily digest.
-
-    Args:
-        emails: List of raw email messages to parse.
-
-    Returns:
-        A DailyDigest containing extracted articles.
-    """
+def _extract_articles(emails: list[EmailMessage]) -> list[Article]:
+    """Turn raw emails into deduplicated, unclassified articles."""
     articles: list[Article] = []
 
     for email in emails:
@@ -238,23 +237,53 @@ def parse_emails(emails: list[EmailMessage]) -> DailyDigest:
             ) from e
 
     # Deduplicate before classification (saves AI calls)
-    articles = _deduplicate_articles(articles)
+    return _deduplicate_articles(articles)
+
+
+def _build_digest(articles: list[Article],
+                  classifications: dict[int, Topic | None]) -> DailyDigest:
+    """Apply classifications (dropping filtered articles) and build the digest."""
+    classified: list[Article] = []
+    for i, article in enumerate(articles):
+        topic = classifications.get(i)
+        if topic is None:
+            logger.info("Filtered article by classification: '%s'", article.title)
+            continue
+        article.topic = topic.value
+        classified.append(article)
+
+    total_words = sum(a.estimated_words for a in classified)
+
+    logger.info("Parsed %d articles (%d words)", len(classified), total_words)
+
+    return DailyDigest(articles=classified, total_words=total_words)
+
+
+def parse_emails(emails: list[EmailMessage], db_path: Path | None = None) -> DailyDigest:
+    """Parse a list of email messages into a daily digest.
+
+    Args:
+        emails: List of raw email messages to parse.
+        db_path: Show database for the local topic model and label history.
+
+    Returns:
+        A DailyDigest containing extracted articles.
+    """
+    articles = _extract_articles(emails)
 
     # Batch classify all articles at once (AI-assisted with regex fallback)
-    if articles:
-        classifications = classify_articles_batch(articles)
-        classified: list[Article] = []
-        for i, article in enumerate(articles):
-            topic = classifications.get(i)
-            if topic is None:
-                logger.info("Filtered article by classification: '%s'", article.title)
-                continue
-            article.topic = topic.value
-            classified.append(article)
-        articles = classified
+    classifications = classify_articles_batch(articles, db_path=db_path) if articles else {}
+    return _build_digest(articles, classifications)
 
-    total_words = sum(a.estimated_words for a in articles)
 
-    logger.info("Parsed %d articles (%d words)", len(articles), total_words)
+async def parse_emails_async(emails: list[EmailMessage],
+                             db_path: Path | None = None) -> DailyDigest:
+    """Async parse_emails: the classification call awaits instead of blocking.
 
-    return DailyDigest(articles=articles, total_words=total_words)
+    HTML extraction and deduplication are CPU-bound, so they run in a worker thread.
+    """
+    articles = await asyncio.to_thread(_extract_articles, emails)
+    classifications = (
+        await classify_articles_batch_async(articles, db_path=db_path) if articles else {}
+    )
+    return _build_digest(articles, classifications)
@@ -3,7 +3,7 @@
 import json
 import logging
 import sqlite3
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -96,12 +96,52 @@ def _create_tables(conn: sqlite3.Connection) -> None:
             FOREIGN KEY (approved_from_suggestion_id) REFERENCES suggestions(id)
         );
 
+        CREATE TABLE IF NOT EXISTS article_labels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL,
+            title TEXT NOT NULL,
+            snippet TEXT NOT NULL DEFAULT '',
+            topic TEXT NOT NULL,
+            origin TEXT NOT NULL DEFAULT 'gemini',
+            created_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS topic_models (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sample_count INTEGER NOT NULL DEFAULT 0,
+            metrics TEXT NOT NULL DEFAULT '{}',
+            model TEXT NOT NULL,
+            trained_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS sender_topic_stats (
+            sender TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            count REAL NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (sender, topic)
+        );
+
+        CREATE TABLE IF NOT EXISTS segment_cache (
+            cache_key TEXT PRIMARY KEY,
+            topic TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS audio_analysis_cache (
+            cache_key TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+
         CREATE INDEX IF NOT EXISTS idx_digests_date ON digests(date);
         CREATE INDEX IF NOT EXISTS idx_episodes_date ON episodes(date);
         CREATE INDEX IF NOT EXISTS idx_runs_started ON pipeline_runs(started_at);
         CREATE INDEX IF NOT EXISTS idx_findings_date ON findings(episode_date);
         CREATE INDEX IF NOT EXISTS idx_suggestions_date ON suggestions(episode_date);
         CREATE INDEX IF NOT EXISTS idx_suggestions_status ON suggestions(status);
+        CREATE INDEX IF NOT EXISTS idx_article_labels_created ON article_labels(created_at);
     """)
     # Migrate: add rss_summary column if missing (existing DBs)
     try:
@@ -804,3 +844,252 @@ def get_recent_coverage_gap_trends(days: int = 7,
         return [dict(r) for r in rows]
     finally:
         conn.close()
+
+
+# --- Local topic model ---
+
+def save_article_labels(labels: list[dict], db_path: Path | None = None) -> None:
+    """Record classified articles as training data for the local topic model.
+
+    Each label dict has keys: source, title, snippet, topic, and optional origin.
+    """
+    if not labels:
+        return
+    now = datetime.now(UTC).isoformat()
+    conn = _get_connection(db_path)
+    try:
+        conn.executemany(
+            """INSERT INTO article_labels (source, title, snippet, topic, origin, created_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [(lb["source"], lb["title"], lb.get("snippet", ""), lb["topic"],
+              lb.get("origin", "gemini"), now) for lb in labels],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_article_labels(limit: int = 20000, db_path: Path | None = None) -> list[dict]:
+    """Get recorded article labels (most recent first)."""
+    conn = _get_connection(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT source, title, snippet, topic, origin, created_at "
+            "FROM article_labels ORDER BY id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def save_topic_model(model_json: str, sample_count: int, metrics: dict | None = None,
+                     db_path: Path | None = None) -> int:
+    """Store a trained topic model. The newest row is the active model."""
+    conn = _get_connection(db_path)
+    try:
+        cursor = conn.execute(
+            "INSERT INTO topic_models (sample_count, metrics, model, trained_at) "
+            "VALUES (?, ?, ?, ?)",
+            (sample_count, json.dumps(metrics or {}), model_json,
+             datetime.now(UTC).isoformat()),
+        )
+        # Keep only the last few models — older ones are never read
+        conn.execute(
+            "DELETE FROM topic_models WHERE id NOT IN "
+            "(SELECT id FROM topic_models ORDER BY id DESC LIMIT 3)"
+        )
+        conn.commit()
+        logger.info("Saved topic model %d (%d samples)", cursor.lastrowid, sample_count)
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+
+def get_latest_topic_model_id(db_path: Path | None = None) -> int | None:
+    """Get the id of the active topic model, or None if none has been trained."""
+    conn = _get_connection(db_path)
+    try:
+        row = conn.execute("SELECT MAX(id) AS id FROM topic_models").fetchone()
+        return row["id"] if row else None
+    finally:
+        conn.close()
+
+
+def get_topic_model(model_id: int, db_path: Path | None = None) -> dict | None:
+    """Get a stored topic model row by id."""
+    conn = _get_connection(db_path)
+    try:
+        row = conn.execute(
+            "SELECT * FROM topic_models WHERE id = ?", (model_id,)
+        ).fetchone()
+        if not row:
+            return None
+        d = dict(row)
+        d["metrics"] = json.loads(d["metrics"])
+        return d
+    finally:
+        conn.close()
+
+
+# --- Sender → topic routing ---
+
+def record_sender_topics(observations: list[tuple[str, str]], max_total: float | None = None,
+                         db_path: Path | None = None) -> None:
+    """Add (sender, topic) observations to the per-sender topic distribution.
+
+    Senders should already be normalized by the caller (topic_classifier).
+
+    Args:
+        observations: (sender, topic) pairs, one per classified article.
+        max_total: If set, a sender's existing counts are scaled down so that
+            with the new observations they add up to at most this. Older
+            classifications then fade out as new ones arrive.
+        db_path: Show database.
+    """
+    if not observations:
+        return
+    counts: dict[tuple[str, str], float] = {}
+    added: dict[str, int] = {}
+    for sender, topic in observations:
+        counts[(sender, topic)] = counts.get((sender, topic), 0) + 1
+        added[sender] = added.get(sender, 0) + 1
+    now = datetime.now(UTC).isoformat()
+    conn = _get_connection(db_path)
+    try:
+        if max_total is not None:
+            for sender, n in added.items():
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(count), 0) FROM sender_topic_stats WHERE sender = ?",
+                    (sender,),
+                ).fetchone()[0]
+                if total > 0 and total + n > max_total:
+                    conn.execute(
+                        "UPDATE sender_topic_stats SET count = count * ? WHERE sender = ?",
+                        (max(max_total - n, 0) / total, sender),
+                    )
+                if n > max_total:
+                    # A burst larger than the window: keep its proportions, capped
+                    for key in counts:
+                        if key[0] == sender:
+                            counts[key] *= max_total / n
+        conn.executemany(
+            """INSERT INTO sender_topic_stats (sender, topic, count, updated_at)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(sender, topic) DO UPDATE SET
+                   count = count + excluded.count, updated_at = excluded.updated_at""",
+            [(sender, topic, n, now) for (sender, topic), n in counts.items()],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_sender_topic_stats(db_path: Path | None = None) -> dict[str, dict[str, float]]:
+    """Get the topic distribution per sender: {sender: {topic: count}}."""
+    conn = _get_connection(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT sender, topic, count FROM sender_topic_stats ORDER BY sender"
+        ).fetchall()
+        stats: dict[str, dict[str, int]] = {}
+        for r in rows:
+            stats.setdefault(r["sender"], {})[r["topic"]] = r["count"]
+        return stats
+    finally:
+        conn.close()
+
+
+# --- Digest segment cache ---
+
+def get_cached_segments(cache_keys: list[str], db_path: Path | None = None) -> dict[str, str]:
+    """Get cached digest content for the given keys: {cache_key: content}."""
+    if not cache_keys:
+        return {}
+    conn = _get_connection(db_path)
+    try:
+        placeholders = ",".join("?" * len(cache_keys))
+        rows = conn.execute(
+            f"SELECT cache_key, content FROM segment_cache WHERE cache_key IN ({placeholders})",
+            cache_keys,
+        ).fetchall()
+        return {r["cache_key"]: r["content"] for r in rows}
+    finally:
+        conn.close()
+
+
+def save_cached_segments(entries: dict[str, tuple[str, str]], max_age_days: int = 3,
+                         db_path: Path | None = None) -> None:
+    """Store digest content as {cache_key: (topic, content)} and prune old entries."""
+    now = datetime.now(UTC)
+    conn = _get_connection(db_path)
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO segment_cache (cache_key, topic, content, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            [(key, topic, content, now.isoformat()) for key, (topic, content) in entries.items()],
+        )
+        # Cached prose is only useful for same-evening re-runs
+        conn.execute(
+            "DELETE FROM segment_cache WHERE created_at < ?",
+            ((now - timedelta(days=max_age_days)).isoformat(),),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# --- Audio analysis cache ---
+
+def get_cached_audio_analysis(cache_key: str, db_path: Path | None = None) -> dict | None:
+    """Get a stored audio analysis result by its cache key, or None."""
+    conn = _get_connection(db_path)
+    try:
+        row = conn.execute(
+            "SELECT result FROM audio_analysis_cache WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+        return json.loads(row["result"]) if row else None
+    finally:
+        conn.close()
+
+
+def save_cached_audio_analysis(cache_key: str, result: dict,
+                               db_path: Path | None = None) -> None:
+    """Store an audio analysis result under its cache key."""
+    conn = _get_connection(db_path)
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO audio_analysis_cache (cache_key, result, created_at) "
+            "VALUES (?, ?, ?)",
+            (cache_key, json.dumps(result), datetime.now(UTC).isoformat()),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# --- Snapshots ---
+
+def snapshot(dest: Path, vacuum: bool = False, db_path: Path | None = None) -> None:
+    """Write a consistent copy of the DB to dest without blocking writers.
+
+    Uses the SQLite online backup API in one step, i.e. a single read
+    transaction: in WAL mode writers carry on meanwhile, and the copy includes
+    every transaction committed before it started (including ones still in the
+    WAL) and none after. With vacuum=True, VACUUM INTO writes a compacted copy
+    instead — smaller, but its page layout no longer matches the live DB.
+    """
+    path = db_path or DEFAULT_DB_PATH
+    dest.unlink(missing_ok=True)  # VACUUM INTO refuses an existing file
+    src = sqlite3.connect(str(path))
+    try:
+        if vacuum:
+            src.execute("VACUUM INTO ?", (str(dest),))
+        else:
+            dst = sqlite3.connect(str(dest))
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+    finally:
+        src.close()
@@ -0,0 +1,250 @@
+"""Incremental replication of a show DB to GCS: a base snapshot plus page deltas.
+
+Instead of uploading the whole noctua.db after every write, push() takes a
+consistent snapshot (SQLite backup API), hashes it page by page, and uploads
+only the pages that changed since the last push as one compressed delta. The
+bucket holds, under db/{show_id}/replica/:
+
+    manifest.json                 generation, sequence, base and delta list
+    {generation}/base.db          full snapshot the generation started from
+    {generation}/delta-000001.bin changed pages, applied in order
+
+restore() downloads the base and replays the deltas. Once the deltas add up
+to REPLICA_COMPACT_RATIO of the base (or REPLICA_MAX_DELTAS files), the next
+push compacts: it uploads a fresh base as a new generation and deletes the
+old one.
+
+Page hashes from the last push are kept next to the DB
+(noctua.db.replica.json). If they are missing or don't match the manifest
+(fresh container, another instance pushed), the push starts a new generation.
+
+Deltas are page diffs of a snapshot rather than shipped WAL frames: every
+connection in this app can checkpoint the WAL, so frames can't be captured
+reliably, while a snapshot diff only needs read access.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import struct
+import tempfile
+import time
+import uuid
+import zlib
+from pathlib import Path
+
+from src import database
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+DELTA_MAGIC = b"NOCDLT01"
+DELTA_HEADER = struct.Struct(">8sIII")  # magic, page_size, page_count, changed pages
+PAGE_NUMBER = struct.Struct(">I")
+HASH_BYTES = 8  # per-page blake2b digest; only compared against the same page
+
+REPLICA_MAX_DELTAS = 50
+REPLICA_COMPACT_RATIO = 0.5  # delta bytes / base bytes
+
+
+def _prefix(show_id: str) -> str:
+    return f"db/{show_id}/replica"
+
+
+def _state_path(db_path: Path) -> Path:
+    return Path(f"{db_path}.replica.json")
+
+
+def _page_size(path: Path) -> int:
+    """Page size from the database header (bytes 16-17; 1 means 65536)."""
+    with open(path, "rb") as f:
+        header = f.read(100)
+    size = struct.unpack(">H", header[16:18])[0]
+    return 65536 if size == 1 else size
+
+
+def _page_hashes(path: Path, page_size: int) -> list[str]:
+    hashes = []
+    with open(path, "rb") as f:
+        while page := f.read(page_size):
+            hashes.append(hashlib.blake2b(page, digest_size=HASH_BYTES).hexdigest())
+    return hashes
+
+
+def _encode_delta(path: Path, page_size: int, page_count: int, pages: list[int]) -> bytes:
+    parts = [DELTA_HEADER.pack(DELTA_MAGIC, page_size, page_count, len(pages))]
+    with open(path, "rb") as f:
+        for number in pages:
+            f.seek(number * page_size)
+            parts.append(PAGE_NUMBER.pack(number))
+            parts.append(f.read(page_size))
+    return zlib.compress(b"".join(parts), 6)
+
+
+def _apply_delta(path: Path, data: bytes) -> None:
+    raw = zlib.decompress(data)
+    magic, page_size, page_count, count = DELTA_HEADER.unpack_from(raw)
+    if magic != DELTA_MAGIC:
+        raise ValueError("Not a DB replica delta")
+    offset = DELTA_HEADER.size
+    with open(path, "r+b") as f:
+        for _ in range(count):
+            (number,) = PAGE_NUMBER.unpack_from(raw, offset)
+            offset += PAGE_NUMBER.size
+            f.seek(number * page_size)
+            f.write(raw[offset:offset + page_size])
+            offset += page_size
+        f.truncate(page_count * page_size)
+
+
+def _read_manifest(bucket, show_id: str) -> dict | None:
+    blob = bucket.blob(f"{_prefix(show_id)}/{MANIFEST_NAME}")
+    if not blob.exists():
+        return None
+    return json.loads(blob.download_as_bytes())
+
+
+def _write_manifest(bucket, show_id: str, manifest: dict) -> None:
+    bucket.blob(f"{_prefix(show_id)}/{MANIFEST_NAME}").upload_from_string(
+        json.dumps(manifest), content_type="application/json",
+    )
+
+
+def _load_state(db_path: Path) -> dict | None:
+    try:
+        return json.loads(_state_path(db_path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_state(db_path: Path, manifest: dict, hashes: list[str]) -> None:
+    state = {"generation": manifest["generation"], "seq": manifest["seq"],
+             "page_size": manifest["page_size"], "hashes": hashes}
+    tmp = _state_path(db_path).with_suffix(".tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, _state_path(db_path))
+
+
+def _push_base(snap: Path, bucket, show_id: str, page_size: int,
+               hashes: list[str], previous: dict | None) -> dict:
+    generation = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    base_name = f"{_prefix(show_id)}/{generation}/base.db"
+    bucket.blob(base_name).upload_from_filename(str(snap), content_type="application/x-sqlite3")
+    manifest = {
+        "version": 1,
+        "generation": generation,
+        "seq": 0,
+        "page_size": page_size,
+        "page_count": len(hashes),
+        "base": base_name,
+        "base_bytes": snap.stat().st_size,
+        "deltas": [],
+        "delta_bytes": 0,
+        "updated_at": time.time(),
+    }
+    _write_manifest(bucket, show_id, manifest)
+    # The new manifest no longer references the old generation
+    if previous:
+        for name in [previous["base"], *previous["deltas"]]:
+            try:
+                bucket.blob(name).delete()
+            except Exception as e:
+                logger.warning("Could not delete old replica object %s: %s", name, e)
+    return manifest
+
+
+def push(db_path: Path, bucket, show_id: str) -> dict:
+    """Replicate db_path to the bucket. Returns what was sent.
+
+    Result keys: mode ("base", "delta" or "unchanged"), bytes uploaded,
+    pages (changed pages for a delta, all pages for a base), generation, seq.
+    """
+    manifest = _read_manifest(bucket, show_id)
+    state = _load_state(db_path)
+    with tempfile.TemporaryDirectory(prefix="noctua-replica-") as tmp:
+        snap = Path(tmp) / "snapshot.db"
+        # No VACUUM: page diffs need the live DB's page layout
+        database.snapshot(snap, db_path=db_path)
+        page_size = _page_size(snap)
+        hashes = _page_hashes(snap, page_size)
+
+        in_sync = (
+            manifest is not None and state is not None
+            and state["generation"] == manifest["generation"]
+            and state["seq"] == manifest["seq"]
+            and state["page_size"] == page_size == manifest["page_size"]
+        )
+        if in_sync:
+            old = state["hashes"]
+            changed = [i for i, h in enumerate(hashes) if i >= len(old) or old[i] != h]
+            if not changed and len(hashes) == len(old):
+                return {"mode": "unchanged", "bytes": 0, "pages": 0,
+                        "generation": manifest["generation"], "seq": manifest["seq"]}
+            delta = _encode_delta(snap, page_size, len(hashes), changed)
+            compact = (
+                len(manifest["deltas"]) >= REPLICA_MAX_DELTAS
+                or manifest["delta_bytes"] + len(delta)
+                > manifest["base_bytes"] * REPLICA_COMPACT_RATIO
+            )
+            if not compact:
+                seq = manifest["seq"] + 1
+                name = f"{_prefix(show_id)}/{manifest['generation']}/delta-{seq:06d}.bin"
+                bucket.blob(name).upload_from_string(delta,
+                                                     content_type="application/octet-stream")
+                manifest.update(seq=seq, page_count=len(hashes),
+                                deltas=[*manifest["deltas"], name],
+                                delta_bytes=manifest["delta_bytes"] + len(delta),
+                                updated_at=time.time())
+                _write_manifest(bucket, show_id, manifest)
+                _save_state(db_path, manifest, hashes)
+                logger.info("Replicated %s: delta %d, %d pages, %d bytes",
+                            show_id, seq, len(changed), len(delta))
+                return {"mode": "delta", "bytes": len(delta), "pages": len(changed),
+                        "generation": manifest["generation"], "seq": seq}
+
+        new = _push_base(snap, bucket, show_id, page_size, hashes, manifest)
+    _save_state(db_path, new, hashes)
+    logger.info("Replicated %s: new base %s, %d pages, %d bytes",
+                show_id, new["generation"], len(hashes), new["base_bytes"])
+    return {"mode": "base", "bytes": new["base_bytes"], "pages": len(hashes),
+            "generation": new["generation"], "seq": 0}
+
+
+def restore(db_path: Path, bucket, show_id: str) -> bool:
+    """Rebuild db_path from the replica (base + deltas). Returns False if there is none.
+
+    Raises:
+        sqlite3.DatabaseError: If the rebuilt file fails SQLite's quick_check.
+    """
+    manifest = _read_manifest(bucket, show_id)
+    if manifest is None:
+        return False
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=db_path.parent, prefix=".restore-", suffix=".db")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        bucket.blob(manifest["base"]).download_to_filename(str(tmp))
+        for name in manifest["deltas"]:
+            _apply_delta(tmp, bucket.blob(name).download_as_bytes())
+        conn = sqlite3.connect(str(tmp))
+        try:
+            result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            conn.close()
+        if result != "ok":
+            raise sqlite3.DatabaseError(f"Restored replica failed quick_check: {result}")
+        # A WAL left from the old file would be replayed over the restored one
+        for suffix in ("-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        os.replace(tmp, db_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+        for suffix in ("-wal", "-shm"):
+            Path(f"{tmp}{suffix}").unlink(missing_ok=True)
+    _save_state(db_path, manifest, _page_hashes(db_path, manifest["page_size"]))
+    logger.info("Restored %s from replica %s (base + %d deltas)",
+                show_id, manifest["generation"], len(manifest["deltas"]))
+    return True
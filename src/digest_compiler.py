@@ -1,21 +1,27 @@
 """Compile parsed articles into a single source document for NotebookLM."""
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
 from collections import defaultdict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, TypeVar
 
-import requests
-
-from config import LOCAL_TZ, ShowConfig, ShowFormat, SHOW_FORMATS
+from config import LOCAL_TZ, ShowConfig, ShowFormat, settings
+from src import http_client
 from src.exceptions import DigestCompileError
 from src.models import Article, CompiledDigest, DailyDigest
 from src.topic_classifier import SEGMENT_DURATIONS, SEGMENT_ORDER, Topic
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # NotebookLM source limit (100K characters)
 MAX_SOURCE_CHARS = 100_000
 
@@ -123,6 +129,33 @@ Do NOT use bullet points or list format. Do NOT include host labels \
 like "[Host 1]:". Write as flowing prose that two hosts can naturally \
 discuss. Stay within the word budget."""
 
+QUALITY_REPORT_SCHEMA = (
+    '{"overall_score": 0-100, "issues": [{"type": "generic_prose" | "topic_bleed" | '
+    '"repetition" | "missing_thread" | "thin_segment", "topic": "segment name or null", '
+    '"description": "one sentence describing the issue"}], '
+    '"thread_detected": true/false, '
+    '"thread_description": "what the common thread is, or null"}\n\n'
+    "Scoring guide:\n"
+    "- Start at 100\n"
+    "- Deduct 15 for each thin segment (under 50% of word budget)\n"
+    "- Deduct 10 for each instance of generic/vague prose\n"
+    "- Deduct 10 for topic bleed (content clearly belongs in a different segment)\n"
+    "- Deduct 20 if no common thread is detectable across segments\n"
+    "- Deduct 5 for each repeated fact or story across segments\n"
+)
+
+FINAL_PASS_SYSTEM_PROMPT = """\
+You are the editor of "{podcast_name}", a daily news podcast. You review \
+segment scripts that were written independently and summarize the episode."""
+
+# Parallel summarization: attempts per segment before falling back to raw text
+SEGMENT_ATTEMPTS = 2
+
+# Segment memoization: cached prose is reused by same-evening re-runs
+SEGMENT_CACHE_MAX_AGE_DAYS = 3
+# segment_cache topic for the cached RSS summary + quality report of a whole digest
+SUMMARY_CACHE_TOPIC = "__summary__"
+
 PROMPT_CONFIG_FILENAME = "prompt_config.json"
 
 
@@ -157,20 +190,23 @@ def save_prompt_config(config: dict, show: ShowConfig | None = None) -> None:
     path.write_text(json.dumps(config, indent=2))
 
 
-def _fetch_seattle_weather() -> str:
+WEATHER_URL = "https://wttr.in/Seattle?format=j1"
+
+
+def _format_weather(data: dict) -> str:
+    """Turn a wttr.in j1 response into the intro's weather sentence."""
+    current = data["current_condition"][0]
+    temp_f = current["temp_F"]
+    desc = current["weatherDesc"][0]["value"]
+    return f"It's {temp_f}\u00b0F and {desc.lower()} here in Seattle. "
+
+
+async def _fetch_seattle_weather() -> str:
     """Fetch current Seattle weather from wttr.in. Returns a brief description or empty string."""
     try:
-        resp = requests.get(
-            "https://wttr.in/Seattle?format=j1",
-            timeout=5,
-            headers={"User-Agent": "NoctuaPodcast/1.0"},
-        )
+        resp = await http_client.get_async_client().get(WEATHER_URL, timeout=5)
         resp.raise_for_status()
-        data = resp.json()
-        current = data["current_condition"][0]
-        temp_f = current["temp_F"]
-        desc = current["weatherDesc"][0]["value"]
-        return f"It's {temp_f}\u00b0F and {desc.lower()} here in Seattle. "
+        return _format_weather(resp.json())
     except Exception as e:
         logger.warning("Weather fetch failed: %s — skipping weather", e)
         return ""
@@ -191,23 +227,11 @@ def _build_topics_summary(digest: DailyDigest, segment_counts: dict[str, int],
     return "; ".join(parts) if parts else "No segments"
 
 
-def _summarize_all_segments(
-    grouped: dict[str, list[Article]],
-    segment_word_budgets: dict[str, int],
-    segment_order: list[str],
-    podcast_name: str = "The Hootline",
-    show: ShowConfig | None = None,
-) -> tuple[dict[str, str], str] | None:
-    """Summarize all segments and generate RSS summary in a single API call.
-
-    Returns (segment_texts, rss_summary) or None if the call fails.
-    """
-    from src.llm_client import call_summarize
-    from src.exceptions import LLMAPIError
+def _effective_prompt_config(show: ShowConfig | None = None) -> dict:
+    """Load the prompt config with any approved overrides from the learning system applied."""
     from src import database
 
     prompt_config = get_prompt_config(show)
-    # Check for prompt overrides from the learning system
     try:
         db_path = show.db_path if show else None
         overrides = database.get_prompt_overrides(db_path=db_path)
@@ -219,9 +243,128 @@ def _summarize_all_segments(
             logger.info("Using prompt override for digest_preamble")
     except Exception as e:
         logger.warning("Failed to load prompt overrides: %s", e)
-    system_prompt = prompt_config["system_prompt"].format(podcast_name=podcast_name)
+    return prompt_config
+
+
+def _articles_prompt_text(articles: list[Article]) -> str:
+    """Render a segment's articles for a summarization prompt."""
+    return "\n\n".join(
+        f"### {a.title}\nSource: {a.source}\n{a.content[:1500]}" for a in articles
+    )
+
+
+def _split_summary_tail(response: str) -> tuple[str, str, dict]:
+    """Split the RSS summary and quality report sections off a summarization response.
+
+    Returns (body, rss_summary, quality_report); missing sections come back empty.
+    """
+    rss_summary = ""
+    quality_report: dict = {}
+
+    # Split off quality report first
+    if "---QUALITY_REPORT---" in response:
+        response, qr_part = response.split("---QUALITY_REPORT---", 1)
+        qr_text = qr_part.strip()
+        # Tolerate markdown code fences around the JSON block
+        qr_text = re.sub(r"^```(?:json)?\s*|\s*```$", "", qr_text)
+        try:
+            quality_report = json.loads(qr_text)
+            logger.info("Quality report: score=%s, issues=%d",
+                        quality_report.get("overall_score", "?"),
+                        len(quality_report.get("issues", [])))
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse quality report JSON: %s", qr_text[:200])
+
+    # Split off RSS summary
+    if "---RSS_SUMMARY---" in response:
+        body, rss_part = response.split("---RSS_SUMMARY---", 1)
+        rss_summary = rss_part.strip().rstrip(".")
+        if len(rss_summary.split()) > 25:
+            rss_summary = " ".join(rss_summary.split()[:20])
+    else:
+        body = response
+
+    return body, rss_summary, quality_report
+
 
-    # Build the prompt with all segments
+class SegmentStreamParser:
+    """Incrementally split a single-call digest response into segment texts.
+
+    Text is fed in chunks as it streams in; a segment is complete (and passed
+    to on_segment) as soon as the next "## SEGMENT N:" header or the RSS /
+    quality report delimiter closes it.
+    """
+
+    _HEADER = re.compile(r"## SEGMENT \d+:\s*(.+)")
+    _DELIMITERS = ("---RSS_SUMMARY---", "---QUALITY_REPORT---")
+
+    def __init__(self, on_segment: Callable[[str, str], None] | None = None):
+        self.on_segment = on_segment
+        self.segments: dict[str, str] = {}
+        self._partial = ""
+        self._topic: str | None = None
+        self._lines: list[str] = []
+        self._finished = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of response text."""
+        *lines, self._partial = (self._partial + chunk).split("\n")
+        for line in lines:
+            self._consume_line(line)
+
+    def close(self) -> dict[str, str]:
+        """Flush the final segment and return all segment texts."""
+        if self._partial:
+            self._consume_line(self._partial)
+            self._partial = ""
+        self._emit()
+        return self.segments
+
+    def _consume_line(self, line: str) -> None:
+        if self._finished:
+            return
+        for delimiter in self._DELIMITERS:
+            if delimiter in line:
+                self._lines.append(line.split(delimiter, 1)[0])
+                self._emit()
+                self._finished = True
+                return
+        match = self._HEADER.match(line.strip())
+        if match:
+            self._emit()
+            self._topic = match.group(1).strip()
+        else:
+            self._lines.append(line)
+
+    def _emit(self) -> None:
+        if self._topic is not None:
+            text = "\n".join(self._lines).strip()
+            self.segments[self._topic] = text
+            if self.on_segment:
+                self.on_segment(self._topic, text)
+        self._topic = None
+        self._lines = []
+
+
+def _system_prompt(show: ShowConfig | None, podcast_name: str) -> str:
+    """The effective summarization system prompt for a show."""
+    prompt_config = _effective_prompt_config(show)
+    return prompt_config["system_prompt"].format(podcast_name=podcast_name)
+
+
+def _all_segments_prompt(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    final_pass: bool = True,
+) -> tuple[str, int] | None:
+    """Build the single-call user message and its max_tokens.
+
+    With final_pass=False only the segments are requested, without the RSS
+    summary and quality report.
+
+    Returns None if no segment has articles.
+    """
     parts = []
     segment_number = 0
     total_word_budget = 0
@@ -233,11 +376,7 @@ def _summarize_all_segments(
         word_budget = segment_word_budgets.get(topic_name, 150)
         total_word_budget += word_budget
 
-        article_texts = []
-        for a in articles:
-            content_preview = a.content[:1500]
-            article_texts.append(f"### {a.title}\nSource: {a.source}\n{content_preview}")
-        combined = "\n\n".join(article_texts)
+        combined = _articles_prompt_text(articles)
 
         parts.append(
             f"## SEGMENT {segment_number}: {topic_name}\n"
@@ -248,6 +387,16 @@ def _summarize_all_segments(
     if not parts:
         return None
 
+    user_message = (
+        "Write ALL of the following podcast segment narratives. "
+        "For each segment, write a flowing prose narrative (no bullet points, no host labels) "
+        "that stays within its word budget. "
+        "Use the exact header format shown (## SEGMENT N: Topic) for each segment.\n\n"
+        + "\n\n---\n\n".join(parts)
+    )
+    if not final_pass:
+        return user_message, total_word_budget * 3 + 200
+
     # Collect article titles for RSS summary
     all_titles = []
     for topic_name in segment_order:
@@ -255,98 +404,436 @@ def _summarize_all_segments(
             all_titles.append(a.title)
     titles_text = "\n".join(f"- {t}" for t in all_titles[:30])
 
-    user_message = (
-        "Write ALL of the following podcast segment narratives. "
-        "For each segment, write a flowing prose narrative (no bullet points, no host labels) "
-        "that stays within its word budget. "
-        "Use the exact header format shown (## SEGMENT N: Topic) for each segment.\n\n"
-        + "\n\n---\n\n".join(parts)
-        + "\n\n---RSS_SUMMARY---\n"
+    user_message += (
+        "\n\n---RSS_SUMMARY---\n"
         "After the delimiter above, write a single sentence (~15 words) "
         "summarizing what this episode covers. No quotes, no preamble — just the sentence.\n\n"
         f"Article titles for reference:\n{titles_text}"
         "\n\n---QUALITY_REPORT---\n"
         "After the delimiter above, evaluate the digest you just wrote and return a JSON block "
         "with this exact structure:\n"
-        '{"overall_score": 0-100, "issues": [{"type": "generic_prose" | "topic_bleed" | '
-        '"repetition" | "missing_thread" | "thin_segment", "topic": "segment name or null", '
-        '"description": "one sentence describing the issue"}], '
-        '"thread_detected": true/false, '
-        '"thread_description": "what the common thread is, or null"}\n\n'
-        "Scoring guide:\n"
-        "- Start at 100\n"
-        "- Deduct 15 for each thin segment (under 50% of word budget)\n"
-        "- Deduct 10 for each instance of generic/vague prose\n"
-        "- Deduct 10 for topic bleed (content clearly belongs in a different segment)\n"
-        "- Deduct 20 if no common thread is detectable across segments\n"
-        "- Deduct 5 for each repeated fact or story across segments\n"
+        + QUALITY_REPORT_SCHEMA
+    )
+    return user_message, total_word_budget * 3 + 500
+
+
+def _parse_all_segments_response(response: str) -> tuple[dict[str, str], str, dict]:
+    """Parse a single-call response into (segment_texts, rss_summary, quality_report)."""
+    body, rss_summary, quality_report = _split_summary_tail(response)
+    parser = SegmentStreamParser()
+    parser.feed(body)
+    segment_texts = parser.close()
+
+    logger.info(
+        "Single API call produced %d segment summaries (RSS summary: %s, quality report: %s)",
+        len(segment_texts),
+        "yes" if rss_summary else "no",
+        "yes" if quality_report else "no",
     )
+    return segment_texts, rss_summary, quality_report
+
+
+def _segment_prompt(topic_name: str, articles: list[Article], word_budget: int) -> str:
+    """Build the user message for summarizing one segment on its own."""
+    return (
+        f"Write the podcast segment narrative for \"{topic_name}\". "
+        "Write flowing prose (no bullet points, no host labels) "
+        f"that stays within ~{word_budget} words. "
+        "Return only the narrative, without a header.\n\n"
+        f"Articles:\n{_articles_prompt_text(articles)}"
+    )
+
+
+def _clean_segment_text(text: str) -> str:
+    """Drop a header if the model added one anyway."""
+    return re.sub(r"^\s*##[^\n]*\n", "", text).strip()
+
+
+def _final_pass_prompt(
+    segment_texts: dict[str, str],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    titles: list[str],
+) -> str:
+    """Build the user message asking for the RSS summary and quality report."""
+    parts = []
+    for number, topic_name in enumerate(
+        [t for t in segment_order if t in segment_texts], start=1,
+    ):
+        parts.append(
+            f"## SEGMENT {number}: {topic_name}\n"
+            f"Word budget: ~{segment_word_budgets.get(topic_name, 150)} words\n\n"
+            f"{segment_texts[topic_name]}"
+        )
+    titles_text = "\n".join(f"- {t}" for t in titles[:30])
+
+    return (
+        "Here is tonight's digest:\n\n"
+        + "\n\n---\n\n".join(parts)
+        + "\n\nReply in exactly this format:\n"
+        "---RSS_SUMMARY---\n"
+        "A single sentence (~15 words) summarizing what this episode covers. "
+        "No quotes, no preamble — just the sentence.\n"
+        "---QUALITY_REPORT---\n"
+        "An evaluation of the digest as a JSON block with this exact structure:\n"
+        + QUALITY_REPORT_SCHEMA
+        + f"\nArticle titles for reference:\n{titles_text}"
+    )
+
+
+def _segment_cache_key(topic_name: str, articles: list[Article], word_budget: int,
+                       system_prompt: str) -> str:
+    """Hash everything that shapes a segment's summary into a memoization key.
+
+    Articles are fingerprinted by the exact text sent to the model, and the
+    system prompt is the effective one (prompt config plus approved overrides),
+    so editing either invalidates the affected segments.
+    """
+    from src.llm_client import PRO_MODEL
+
+    h = hashlib.sha256()
+    for part in (PRO_MODEL, topic_name, str(word_budget), system_prompt,
+                 _articles_prompt_text(articles)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@dataclass
+class _SegmentCachePlan:
+    """Cache lookup result for one compile: what is reusable and what must be summarized."""
+
+    topics: list[str]
+    keys: dict[str, str]
+    summary_key: str
+    cached: dict[str, str]
+    segment_texts: dict[str, str]
+    pending: list[str]
+
+
+def _cache_lookup(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    podcast_name: str,
+    show: ShowConfig | None,
+) -> _SegmentCachePlan | None:
+    """Look up cached segment prose for the segments that have articles."""
+    from src import database
+
+    topics = [t for t in segment_order if grouped.get(t)]
+    if not topics:
+        return None
+
+    system_prompt = _system_prompt(show, podcast_name)
+    keys = {
+        t: _segment_cache_key(t, grouped[t], segment_word_budgets.get(t, 150), system_prompt)
+        for t in topics
+    }
+    summary_key = hashlib.sha256("".join(keys[t] for t in topics).encode()).hexdigest()
+    try:
+        cached = database.get_cached_segments([*keys.values(), summary_key],
+                                              db_path=show.db_path if show else None)
+    except Exception as e:
+        logger.warning("Failed to read segment cache: %s", e)
+        cached = {}
+
+    segment_texts = {t: cached[keys[t]] for t in topics if keys[t] in cached}
+    pending = [t for t in topics if t not in segment_texts]
+    logger.info("Segment cache: %d/%d segments reused, %d to summarize",
+                len(segment_texts), len(topics), len(pending))
+    return _SegmentCachePlan(topics, keys, summary_key, cached, segment_texts, pending)
+
+
+def _cached_summary(plan: _SegmentCachePlan) -> tuple[str, dict] | None:
+    """The cached (rss_summary, quality_report) if no segment changed."""
+    if plan.pending or plan.summary_key not in plan.cached:
+        return None
+    summary = json.loads(plan.cached[plan.summary_key])
+    return summary["rss_summary"], summary["quality_report"]
+
+
+def _cache_store(
+    plan: _SegmentCachePlan,
+    new_texts: dict[str, str],
+    segment_texts: dict[str, str],
+    rss_summary: str,
+    quality_report: dict,
+    show: ShowConfig | None,
+) -> None:
+    """Store newly summarized segments, and the digest summary once every segment has prose."""
+    from src import database
+
+    # Only AI prose is cached — raw-fallback segments are retried on the next run
+    entries = {plan.keys[t]: (t, text) for t, text in new_texts.items() if t in plan.keys}
+    if all(t in segment_texts for t in plan.topics) and quality_report:
+        entries[plan.summary_key] = (SUMMARY_CACHE_TOPIC, json.dumps({
+            "rss_summary": rss_summary, "quality_report": quality_report,
+        }))
+    if not entries:
+        return
+    try:
+        database.save_cached_segments(entries, max_age_days=SEGMENT_CACHE_MAX_AGE_DAYS,
+                                      db_path=show.db_path if show else None)
+    except Exception as e:
+        logger.warning("Failed to write segment cache: %s", e)
+
+
+# --- Summarization (async; compile() runs it to completion for sync callers) ---
+
+async def _summarize_all_segments(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    podcast_name: str = "The Hootline",
+    show: ShowConfig | None = None,
+    on_segment: Callable[[str, str], None] | None = None,
+    final_pass: bool = True,
+) -> tuple[dict[str, str], str, dict] | None:
+    """Summarize all segments and generate RSS summary in a single API call.
+
+    When on_segment is given, the response is streamed and each segment is
+    passed to on_segment(topic, text) as soon as its text is complete. If the
+    stream breaks part-way, segments already completed are kept. With
+    final_pass=False only the segments are written (RSS summary and quality
+    report come back empty).
+
+    Returns (segment_texts, rss_summary, quality_report) or None if the call fails.
+    """
+    from src.exceptions import LLMAPIError
+    from src.llm_client import call_summarize_async, stream_summarize_async
+
+    prompt = _all_segments_prompt(grouped, segment_word_budgets, segment_order, final_pass)
+    if prompt is None:
+        return None
+    user_message, max_tokens = prompt
+    system_prompt = await asyncio.to_thread(_system_prompt, show, podcast_name)
+
+    if on_segment is not None:
+        live = SegmentStreamParser(on_segment)
+        chunks: list[str] = []
+        try:
+            async for chunk in stream_summarize_async(system_prompt, user_message,
+                                                      max_tokens=max_tokens,
+                                                      temperature=0.3, timeout=120,
+                                                      cache_site="digest_summary"):
+                chunks.append(chunk)
+                live.feed(chunk)
+        except LLMAPIError as e:
+            if not live.segments:
+                logger.warning("Streaming summarization failed: %s — using raw fallback", e)
+                return None
+            logger.warning("Streaming summarization broke after %d segments: %s",
+                           len(live.segments), e)
+            return dict(live.segments), "", {}
+        response = "".join(chunks)
+    else:
+        try:
+            response = await call_summarize_async(
+                system=system_prompt,
+                user_message=user_message,
+                max_tokens=max_tokens,
+                temperature=0.3,
+                timeout=120,
+                cache_site="digest_summary", hedge=True,
+            )
+        except LLMAPIError as e:
+            logger.warning("Single-call summarization failed: %s — using raw fallback", e)
+            return None
+
+    return _parse_all_segments_response(response)
+
 
+async def _summarize_segment(
+    topic_name: str,
+    articles: list[Article],
+    word_budget: int,
+    system_prompt: str,
+    semaphore: asyncio.Semaphore,
+) -> str | None:
+    """Summarize one segment in its own API call, retrying on failure.
+
+    The semaphore bounds how many segments are summarized at once.
+
+    Returns the segment narrative, or None if every attempt fails.
+    """
+    from src.exceptions import LLMAPIError
+    from src.llm_client import call_summarize_async
+
+    user_message = _segment_prompt(topic_name, articles, word_budget)
+    async with semaphore:
+        for attempt in range(SEGMENT_ATTEMPTS):
+            try:
+                text = await call_summarize_async(
+                    system=system_prompt,
+                    user_message=user_message,
+                    max_tokens=word_budget * 3 + 200,
+                    temperature=0.3,
+                    timeout=60,
+                    cache_site="segment_summary", hedge=True,
+                )
+            except LLMAPIError as e:
+                logger.warning("Segment '%s' summarization failed (attempt %d/%d): %s",
+                               topic_name, attempt + 1, SEGMENT_ATTEMPTS, e)
+                continue
+            text = _clean_segment_text(text)
+            if text:
+                return text
+    return None
+
+
+async def _summarize_final_pass(
+    segment_texts: dict[str, str],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    titles: list[str],
+    podcast_name: str,
+) -> tuple[str, dict]:
+    """Write the RSS summary and quality report from finished segment texts.
+
+    Returns (rss_summary, quality_report); either may be empty on failure.
+    """
+    from src.exceptions import LLMAPIError
+    from src.llm_client import call_fast_async
+
+    user_message = _final_pass_prompt(segment_texts, segment_word_budgets, segment_order, titles)
     try:
-        response = call_summarize(
-            system=system_prompt,
-            user_message=user_message,
-            max_tokens=total_word_budget * 3 + 500,
-            temperature=0.3,
-            timeout=120,
+        response = await call_fast_async(
+            FINAL_PASS_SYSTEM_PROMPT.format(podcast_name=podcast_name),
+            user_message,
+            max_tokens=1024,
+            temperature=0.2,
+            timeout=60,
+            cache_site="final_pass", hedge=True,
         )
     except LLMAPIError as e:
-        logger.warning("Single-call summarization failed: %s — using raw fallback", e)
+        logger.warning("Digest final pass failed: %s — no RSS summary or quality report", e)
+        return "", {}
+
+    _, rss_summary, quality_report = _split_summary_tail(response)
+    return rss_summary, quality_report
+
+
+async def _summarize_segments_parallel(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    podcast_name: str = "The Hootline",
+    show: ShowConfig | None = None,
+    on_segment: Callable[[str, str], None] | None = None,
+    final_pass: bool = True,
+) -> tuple[dict[str, str], str, dict] | None:
+    """Summarize each segment as an independent concurrent request, then run a final pass.
+
+    Wall-clock time is bounded by the slowest segment rather than one large
+    response, and a failed segment only loses that segment (it falls back to
+    raw text). The RSS summary and quality report come from a small final call
+    over the finished segment texts, skipped with final_pass=False.
+
+    Returns (segment_texts, rss_summary, quality_report) or None if every segment failed.
+    """
+    topics = [t for t in segment_order if grouped.get(t)]
+    if not topics:
         return None
 
-    # Parse the response into per-segment texts, RSS summary, and quality report
+    system_prompt = await asyncio.to_thread(_system_prompt, show, podcast_name)
+    semaphore = asyncio.Semaphore(max(1, settings.digest_segment_concurrency))
+
+    async def _run(topic_name: str) -> tuple[str, str | None]:
+        text = await _summarize_segment(
+            topic_name, grouped[topic_name], segment_word_budgets.get(topic_name, 150),
+            system_prompt, semaphore,
+        )
+        return topic_name, text
+
     segment_texts: dict[str, str] = {}
-    rss_summary = ""
-    quality_report: dict = {}
+    for next_done in asyncio.as_completed([_run(t) for t in topics]):
+        topic_name, text = await next_done
+        if text:
+            segment_texts[topic_name] = text
+            if on_segment:
+                on_segment(topic_name, text)
+
+    if not segment_texts:
+        logger.warning("All %d segment summaries failed — using raw fallback", len(topics))
+        return None
 
-    # Split off quality report first
-    if "---QUALITY_REPORT---" in response:
-        response, qr_part = response.split("---QUALITY_REPORT---", 1)
-        qr_text = qr_part.strip()
-        try:
-            quality_report = json.loads(qr_text)
-            logger.info("Quality report: score=%s, issues=%d",
-                        quality_report.get("overall_score", "?"),
-                        len(quality_report.get("issues", [])))
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse quality report JSON: %s", qr_text[:200])
+    rss_summary, quality_report = "", {}
+    if final_pass:
+        titles = [a.title for t in topics for a in grouped[t]]
+        rss_summary, quality_report = await _summarize_final_pass(
+            segment_texts, segment_word_budgets, segment_order, titles, podcast_name,
+        )
 
-    # Split off RSS summary
-    if "---RSS_SUMMARY---" in response:
-        body, rss_part = response.split("---RSS_SUMMARY---", 1)
-        rss_summary = rss_part.strip().rstrip(".")
-        if len(rss_summary.split()) > 25:
-            rss_summary = " ".join(rss_summary.split()[:20])
-    else:
-        body = response
+    logger.info(
+        "Parallel summarization produced %d/%d segment summaries (quality report: %s)",
+        len(segment_texts), len(topics), "yes" if quality_report else "no",
+    )
+    return segment_texts, rss_summary, quality_report
 
-    # Parse segment blocks by header pattern
-    segment_pattern = re.compile(r"## SEGMENT \d+:\s*(.+)")
-    current_topic = None
-    current_lines: list[str] = []
 
-    for line in body.split("\n"):
-        match = segment_pattern.match(line.strip())
-        if match:
-            # Save previous segment
-            if current_topic is not None:
-                segment_texts[current_topic] = "\n".join(current_lines).strip()
-            current_topic = match.group(1).strip()
-            current_lines = []
-        else:
-            current_lines.append(line)
+async def _summarize_with_cache(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    segment_order: list[str],
+    podcast_name: str = "The Hootline",
+    show: ShowConfig | None = None,
+    on_segment: Callable[[str, str], None] | None = None,
+) -> tuple[dict[str, str], str, dict] | None:
+    """Summarize segments, reusing cached prose for segments whose inputs are unchanged.
 
-    # Save last segment
-    if current_topic is not None:
-        segment_texts[current_topic] = "\n".join(current_lines).strip()
+    Only changed segments are sent to the LLM (in parallel or single-call mode).
+    The RSS summary and quality report are reused when no segment changed, and
+    otherwise recomputed by a final pass over all segment texts. on_segment,
+    if given, receives each segment as soon as it is available (cached ones first).
+    Cache reads and writes run in a worker thread.
 
-    logger.info(
-        "Single API call produced %d segment summaries (RSS summary: %s, quality report: %s)",
-        len(segment_texts),
-        "yes" if rss_summary else "no",
-        "yes" if quality_report else "no",
+    Returns (segment_texts, rss_summary, quality_report) or None if nothing could be summarized.
+    """
+    plan = await asyncio.to_thread(_cache_lookup, grouped, segment_word_budgets, segment_order,
+                                   podcast_name, show)
+    if plan is None:
+        return None
+    if on_segment:
+        for t, text in plan.segment_texts.items():
+            on_segment(t, text)
+
+    summarize = (
+        _summarize_segments_parallel if settings.digest_parallel_segments
+        else _summarize_all_segments
     )
+    segment_texts = dict(plan.segment_texts)
+    if not segment_texts:
+        ai_result = await summarize(grouped, segment_word_budgets, segment_order,
+                                    podcast_name=podcast_name, show=show, on_segment=on_segment)
+        if not ai_result:
+            return None
+        segment_texts, rss_summary, quality_report = ai_result
+        new_texts = segment_texts
+    else:
+        new_texts = {}
+        if plan.pending:
+            # Segments only: the final pass below runs once, over all segment texts
+            ai_result = await summarize({t: grouped[t] for t in plan.pending},
+                                        segment_word_budgets, segment_order,
+                                        podcast_name=podcast_name, show=show,
+                                        on_segment=on_segment, final_pass=False)
+            if ai_result:
+                new_texts = {t: text for t, text in ai_result[0].items() if t in plan.keys}
+                segment_texts.update(new_texts)
+
+        summary = _cached_summary(plan)
+        if summary is None:
+            titles = [a.title for t in plan.topics for a in grouped[t]]
+            summary = await _summarize_final_pass(
+                segment_texts, segment_word_budgets, segment_order, titles, podcast_name,
+            )
+        rss_summary, quality_report = summary
 
+    await asyncio.to_thread(_cache_store, plan, new_texts, segment_texts, rss_summary,
+                            quality_report, show)
+    if not rss_summary:
+        rss_summary = f"Your daily knowledge briefing from {podcast_name}."
     return segment_texts, rss_summary, quality_report
 
 
@@ -401,13 +888,12 @@ def _raw_fallback_segment(articles: list[Article], word_budget: int) -> str:
     return "\n\n---\n\n".join(parts)
 
 
-def _compile_text(
-    digest: DailyDigest, date_str: str, podcast_name: str = "The Hootline",
-    show_format: ShowFormat | None = None, show_config: ShowConfig | None = None,
-) -> tuple[str, dict[str, int], dict[str, list[str]], str, dict]:
-    """Compile articles into a segment-structured markdown document with AI summaries.
+def _plan_segments(
+    digest: DailyDigest, show_format: ShowFormat | None = None,
+) -> tuple[dict[str, list[Article]], dict[str, int], list[str], dict[str, int]]:
+    """Group, cap and budget articles per segment.
 
-    Returns (text, segment_counts, segment_sources, rss_summary, quality_report).
+    Returns (grouped, segment_word_budgets, segment_order, segment_durations).
     """
     # Resolve segment config: use show format if provided, else global defaults
     if show_format:
@@ -448,11 +934,25 @@ def _compile_text(
     if total_after < total_before:
         logger.info("Topic capping: %d -> %d articles", total_before, total_after)
 
-    # Single API call for all segment summaries + RSS summary
-    ai_result = _summarize_all_segments(
-        grouped, segment_word_budgets, format_segment_order,
-        podcast_name=podcast_name, show=show_config,
-    )
+    return grouped, segment_word_budgets, format_segment_order, format_durations
+
+
+def _render_text(
+    grouped: dict[str, list[Article]],
+    segment_word_budgets: dict[str, int],
+    format_segment_order: list[str],
+    format_durations: dict[str, int],
+    ai_result: tuple[dict[str, str], str, dict] | None,
+    weather: str,
+    date_str: str,
+    podcast_name: str = "The Hootline",
+    show_format: ShowFormat | None = None,
+    show_config: ShowConfig | None = None,
+) -> tuple[str, dict[str, int], dict[str, list[str]], str, dict]:
+    """Assemble the final document from planned segments and their AI summaries.
+
+    Returns (text, segment_counts, segment_sources, rss_summary, quality_report).
+    """
     quality_report = {}
     if ai_result:
         ai_segments, rss_summary, quality_report = ai_result
@@ -460,9 +960,6 @@ def _compile_text(
         ai_segments = {}
         rss_summary = f"Your daily knowledge briefing from {podcast_name}."
 
-    # Fetch weather for intro
-    weather = _fetch_seattle_weather()
-
     # Choose intro/outro based on show duration
     is_short = show_format and show_format.intro_minutes < 1
     if is_short:
@@ -528,55 +1025,131 @@ def _compile_text(
     return text, segment_counts, segment_sources, rss_summary, quality_report
 
 
-def compile(digest: DailyDigest, show: ShowConfig | None = None) -> CompiledDigest:
+async def _compile_text_async(
+    digest: DailyDigest, date_str: str, podcast_name: str = "The Hootline",
+    show_format: ShowFormat | None = None, show_config: ShowConfig | None = None,
+    on_segment: Callable[[str, str], None] | None = None,
+) -> tuple[str, dict[str, int], dict[str, list[str]], str, dict]:
+    """Compile articles into a segment-structured markdown document with AI summaries.
+
+    The weather fetch for the intro overlaps summarization.
+
+    Returns (text, segment_counts, segment_sources, rss_summary, quality_report).
+    """
+    grouped, budgets, order, durations = _plan_segments(digest, show_format)
+
+    ai_result, weather = await asyncio.gather(
+        _summarize_with_cache(
+            grouped, budgets, order,
+            podcast_name=podcast_name, show=show_config, on_segment=on_segment,
+        ),
+        _fetch_seattle_weather(),
+    )
+
+    return _render_text(grouped, budgets, order, durations, ai_result, weather, date_str,
+                        podcast_name=podcast_name, show_format=show_format,
+                        show_config=show_config)
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion for a sync caller, on a loop of its own.
+
+    The loop's pooled HTTP client is closed before the loop is.
+    """
+    async def run() -> T:
+        try:
+            return await coro
+        finally:
+            await http_client.aclose_async_client()
+
+    return asyncio.run(run())
+
+
+def _compile_text(
+    digest: DailyDigest, date_str: str, podcast_name: str = "The Hootline",
+    show_format: ShowFormat | None = None, show_config: ShowConfig | None = None,
+    on_segment: Callable[[str, str], None] | None = None,
+) -> tuple[str, dict[str, int], dict[str, list[str]], str, dict]:
+    """Sync _compile_text_async, for callers without an event loop."""
+    return _run_sync(_compile_text_async(
+        digest, date_str, podcast_name=podcast_name, show_format=show_format,
+        show_config=show_config, on_segment=on_segment,
+    ))
+
+
+def _episode_dates() -> tuple[str, str]:
+    """Today's episode date as (YYYY-MM-DD, display form)."""
+    episode_date = datetime.now(LOCAL_TZ).date()
+    return episode_date.strftime("%Y-%m-%d"), episode_date.strftime("%B %-d, %Y")
+
+
+def _build_compiled(
+    digest: DailyDigest, date_ymd: str, show_format: ShowFormat | None,
+    compiled_text: tuple[str, dict[str, int], dict[str, list[str]], str, dict],
+) -> CompiledDigest:
+    """Wrap _compile_text output into a CompiledDigest."""
+    text, segment_counts, segment_sources, rss_summary, quality_report = compiled_text
+    topics_summary = _build_topics_summary(digest, segment_counts, show_format=show_format)
+    # Exclude the NotebookLM instruction block from word count (it's instructions, not content)
+    content_text = text
+    if text.startswith(NOTEBOOKLM_INSTRUCTION_BLOCK):
+        content_text = text[len(NOTEBOOKLM_INSTRUCTION_BLOCK):]
+    total_words = len(content_text.split())
+
+    compiled = CompiledDigest(
+        text=text,
+        article_count=len(digest.articles),
+        total_words=total_words,
+        date=date_ymd,
+        topics_summary=topics_summary,
+        rss_summary=rss_summary,
+        segment_counts=segment_counts,
+        segment_sources=segment_sources,
+        quality_report=quality_report,
+    )
+
+    logger.info(
+        "Compiled digest: %d articles, %d words, %d chars, %d segments",
+        compiled.article_count,
+        compiled.total_words,
+        len(compiled.text),
+        len(compiled.segment_counts),
+    )
+    return compiled
+
+
+def compile(digest: DailyDigest, show: ShowConfig | None = None,
+            on_segment: Callable[[str, str], None] | None = None) -> CompiledDigest:
+    """Sync compile_async, for the CLI scripts. Must not be called from a running event loop."""
+    return _run_sync(compile_async(digest, show=show, on_segment=on_segment))
+
+
+async def compile_async(digest: DailyDigest, show: ShowConfig | None = None,
+                        on_segment: Callable[[str, str], None] | None = None) -> CompiledDigest:
     """Compile all articles into a single well-structured text document.
 
+    Gemini and weather calls are awaited, and database and prompt-file access
+    runs in worker threads, so the event loop stays responsive.
+
     Args:
         digest: The daily digest containing articles to compile.
         show: Show-specific config for podcast name. Falls back to "The Hootline".
+        on_segment: Optional callback receiving (topic, text) for each AI segment
+            summary as soon as it is ready — the summary is streamed when set.
     """
     if not digest.articles:
         raise DigestCompileError("No articles to compile.")
 
     podcast_name = show.podcast_title if show else "The Hootline"
-
-    episode_date = datetime.now(LOCAL_TZ).date()
-    date_ymd = episode_date.strftime("%Y-%m-%d")
-    date_display = episode_date.strftime("%B %-d, %Y")
-
+    date_ymd, date_display = _episode_dates()
     show_format = show.format if show else None
 
     try:
-        text, segment_counts, segment_sources, rss_summary, quality_report = _compile_text(
+        compiled_text = await _compile_text_async(
             digest, date_display, podcast_name=podcast_name,
-            show_format=show_format, show_config=show,
+            show_format=show_format, show_config=show, on_segment=on_segment,
         )
-        topics_summary = _build_topics_summary(digest, segment_counts, show_format=show_format)
-        # Exclude the NotebookLM instruction block from word count (it's instructions, not content)
-        content_text = text[len(NOTEBOOKLM_INSTRUCTION_BLOCK):] if text.startswith(NOTEBOOKLM_INSTRUCTION_BLOCK) else text
-        total_words = len(content_text.split())
-
-        compiled = CompiledDigest(
-            text=text,
-            article_count=len(digest.articles),
-            total_words=total_words,
-            date=date_ymd,
-            topics_summary=topics_summary,
-            rss_summary=rss_summary,
-            segment_counts=segment_counts,
-            segment_sources=segment_sources,
-            quality_report=quality_report,
-        )
-
-        logger.info(
-            "Compiled digest: %d articles, %d words, %d chars, %d segments",
-            compiled.article_count,
-            compiled.total_words,
-            len(compiled.text),
-            len(compiled.segment_counts),
-        )
-
-        return compiled
+        return _build_compiled(digest, date_ymd, show_format, compiled_text)
 
     except DigestCompileError:
         raise
@@ -5,10 +5,6 @@ import json
 import logging
 from datetime import UTC, datetime, timedelta, timezone
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
 from config import LOCAL_TZ, ShowConfig, settings
 from src.exceptions import EmailFetchError
 from src.models import EmailMessage
@@ -25,6 +21,11 @@ def _get_gmail_service(show: ShowConfig | None = None):
         raise EmailFetchError("Gmail credentials or token not configured.")
 
     try:
+        # googleapiclient loads slowly; import when a fetch actually runs
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build
+
         token_data = json.loads(token_json)
         creds = Credentials.from_authorized_user_info(token_data)
 
@@ -11,12 +11,14 @@ import time
 import requests
 
 from config import settings
-from src import database
-from src.exceptions import LLMAPIError
+from src import circuit_breaker, database, http_client, llm_cache, rate_limiter
+from src.exceptions import CircuitOpenError, LLMAPIError
+from src.rate_limiter import Priority
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
+MODEL = "gemini-2.5-flash"
+MAX_OUTPUT_TOKENS = 4096
 
 EGREGIOUS_THRESHOLDS = {
     "runtime_outside_window": (28 * 60, 38 * 60),  # 28-38 minutes in seconds
@@ -25,8 +27,16 @@ EGREGIOUS_THRESHOLDS = {
     "quality_score_critical": 50,
 }
 
+# Findings from the local audio metrics (src/audio_metrics.py)
+AUDIO_METRIC_THRESHOLDS = {
+    "long_silence_seconds": 10,  # total dead air across the episode
+    "host_balance_min": 0.4,  # less-heard host's talk time / the other's
+}
+
 
-def _gemini_json_call(prompt: str, temperature: float = 0.2) -> list | dict:
+def _gemini_json_call(prompt: str, temperature: float = 0.2,
+                      priority: Priority = Priority.TRANSCRIPTION,
+                      cache_site: str | None = None) -> list | dict:
     """Make a Gemini API call expecting JSON response."""
     key = settings.gemini_api_key
     if not key:
@@ -35,33 +45,56 @@ def _gemini_json_call(prompt: str, temperature: float = 0.2) -> list | dict:
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
-            "maxOutputTokens": 4096,
+            "maxOutputTokens": MAX_OUTPUT_TOKENS,
             "temperature": temperature,
             "responseMimeType": "application/json",
         },
     }
-
-    resp = requests.post(
-        f"{API_URL}?key={key}",
-        headers={"Content-Type": "application/json"},
-        json=payload,
-        timeout=120,
-    )
-
+    cache_key = llm_cache.request_key(MODEL, payload) if cache_site else None
+    if cache_key and (cached := llm_cache.get(cache_key)) is not None:
+        return json.loads(cached)
+
+    limiter = rate_limiter.get_limiter(MODEL)
+    reserve = rate_limiter.estimate_tokens(prompt) + MAX_OUTPUT_TOKENS
+    breaker = circuit_breaker.get_breaker(MODEL)
+
+    def _post():
+        if not breaker.allow():
+            raise CircuitOpenError(f"Gemini circuit open for {MODEL} — skipping call")
+        with limiter.slot(reserve, priority) as permit:
+            try:
+                resp = http_client.post(
+                    f"{settings.gemini_api_base}/v1beta/models/{MODEL}:generateContent?key={key}",
+                    headers={"Content-Type": "application/json"},
+                    json=payload,
+                    timeout=120,
+                )
+            except requests.exceptions.RequestException:
+                breaker.record_failure()
+                raise
+            if resp.status_code == 429:
+                permit.pause(10)
+            elif resp.status_code >= 500:
+                breaker.record_failure()
+            elif resp.ok:
+                breaker.record_success()
+                permit.settle(rate_limiter.usage_tokens(resp.json()))
+        return resp
+
+    resp = _post()
     if resp.status_code == 429 or resp.status_code >= 500:
-        time.sleep(10)
-        resp = requests.post(
-            f"{API_URL}?key={key}",
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=120,
-        )
+        if resp.status_code != 429:
+            time.sleep(10)
+        resp = _post()
 
     resp.raise_for_status()
     data = resp.json()
     candidate = data.get("candidates", [{}])[0]
     text = candidate["content"]["parts"][0]["text"]
-    return json.loads(text)
+    result = json.loads(text)
+    if cache_key:
+        llm_cache.put(cache_key, text, cache_site)
+    return result
 
 
 def analyze_episode(
@@ -133,6 +166,9 @@ def analyze_episode(
             "data": {"runtime_seconds": runtime},
         })
 
+    # --- Local audio metrics: dead air and host balance ---
+    findings.extend(_audio_metric_findings(audio_analysis.get("audio_metrics") or {}))
+
     # Save findings to DB
     from pathlib import Path
     finding_ids = database.save_findings(episode_date, findings, db_path=Path(db_path))
@@ -161,6 +197,48 @@ def analyze_episode(
     }
 
 
+def _audio_metric_findings(metrics: dict) -> list[dict]:
+    """Findings from the deterministic audio metrics computed at transcription."""
+    if not metrics:
+        return []
+    findings = []
+    silence = metrics.get("long_silence_seconds", 0)
+    if silence >= AUDIO_METRIC_THRESHOLDS["long_silence_seconds"]:
+        findings.append({
+            "job": "audio_quality",
+            "severity": "warning",
+            "topic": None,
+            "finding": (
+                f"{silence:.0f}s of dead air in {len(metrics.get('long_silences', []))} "
+                "long silences"
+            ),
+            "data": {"long_silences": metrics.get("long_silences", [])},
+        })
+    host_data = {k: metrics.get(k) for k in ("host_seconds", "host_balance", "host_pitch_hz")}
+    if not metrics.get("both_hosts_present", True):
+        # Pitch clustering reads two similar voices as one, so this is only a warning
+        findings.append({
+            "job": "audio_quality",
+            "severity": "warning",
+            "topic": None,
+            "finding": "Only one host voice was detected in the episode audio",
+            "data": host_data,
+        })
+    elif metrics.get("host_balance", 1) < AUDIO_METRIC_THRESHOLDS["host_balance_min"]:
+        more, less = metrics.get("host_seconds", [0, 0])
+        findings.append({
+            "job": "audio_quality",
+            "severity": "warning",
+            "topic": None,
+            "finding": (
+                f"Hosts were unbalanced: {more / 60:.0f} min vs {less / 60:.0f} min "
+                "of talk time"
+            ),
+            "data": host_data,
+        })
+    return findings
+
+
 def _check_egregious(audio_analysis: dict, quality_report: dict,
                      findings: list[dict]) -> bool:
     """Episode is egregious only if it hits 2+ critical thresholds."""
@@ -241,7 +319,7 @@ Rules:
 """
 
     try:
-        raw = _gemini_json_call(prompt, temperature=0.2)
+        raw = _gemini_json_call(prompt, temperature=0.2, cache_site="suggestions")
         if not isinstance(raw, list):
             raw = [raw] if isinstance(raw, dict) else []
         # Map finding indices back to IDs
@@ -303,7 +381,8 @@ Return ONLY a JSON array:
 """
 
     try:
-        raw = _gemini_json_call(prompt, temperature=0.3)
+        raw = _gemini_json_call(prompt, temperature=0.3, priority=Priority.WEEKLY_TRENDS,
+                               cache_site="weekly_trends")
         if not isinstance(raw, list):
             return []
         # Save as suggestions with a synthetic episode_date
@@ -6,8 +6,6 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from mutagen.mp3 import MP3
-
 from config import ShowConfig
 from src import gcs_storage
 from src.exceptions import EpisodeProcessError
@@ -121,7 +119,8 @@ def process(mp3_path: Path, topics_summary: str, rss_summary: str = "",
         mp3_path = _ensure_mp3(mp3_path)
         file_size = mp3_path.stat().st_size  # re-read after possible conversion
 
-        # Extract duration using mutagen
+        # Extract duration using mutagen (imported here: not needed to serve requests)
+        from mutagen.mp3 import MP3
         audio = MP3(str(mp3_path))
         duration_seconds = int(audio.info.length)
 
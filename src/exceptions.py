@@ -25,6 +25,10 @@ class LLMAPIError(NoctuaError):
     """Raised when an LLM API call fails."""
 
 
+class CircuitOpenError(LLMAPIError):
+    """Raised instead of calling Gemini while its circuit breaker is open."""
+
+
 # Backward-compat alias
 ClaudeAPIError = LLMAPIError
 
@@ -0,0 +1,516 @@
+"""Local stand-in for the Gemini API, for offline benchmarking and load tests.
+
+Implements the parts of the API the pipeline uses: generateContent,
+streamGenerateContent (SSE) and the Files API resumable upload (chunks and
+offset queries), poll and delete calls used by audio_transcriber. Point the
+app at it with GEMINI_API_BASE (any non-empty GEMINI_API_KEY works).
+
+Modes:
+    replay — answer from a recordings file (JSON lines keyed like
+             llm_cache.request_key); unmatched requests go to the
+             responder, or get a 404 when there is none.
+    record — replay what is recorded, forward everything else to the real
+             API and append the answer to the recordings file. Text only:
+             uploads are answered locally, so the real API could not fetch
+             their file URIs. Requests that reference files are treated as
+             unmatched instead of forwarded.
+
+Latency, stream pacing and error injection (random 429/5xx or an explicit
+fail_next queue) are configured per server with FaultConfig;
+interrupt_next_upload drops the connection part-way through an upload chunk.
+
+Usage (fixture):
+    with FakeGeminiServer(recordings_path=path) as fake:
+        settings.gemini_api_base = fake.base_url
+        ...
+
+Usage (CLI): see scripts/fake_gemini_server.py.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from src.llm_cache import request_key
+
+logger = logging.getLogger(__name__)
+
+REAL_API_BASE = "https://generativelanguage.googleapis.com"
+
+_GENERATE_PATH = re.compile(r"^/v1beta/models/([^/:]+):(generateContent|streamGenerateContent)$")
+# audio_transcriber addresses files as files/<name> under /v1beta/files/
+_FILE_PATH = re.compile(r"^/v1beta/files/(?:files/)?([A-Za-z0-9_-]+)$")
+
+_ERROR_STATUS = {
+    400: "INVALID_ARGUMENT",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+# (model, payload) -> response text, for requests with no recording
+Responder = Callable[[str, dict], str]
+
+
+@dataclass
+class FaultConfig:
+    """Latency and error injection applied to generate calls."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_codes: tuple[int, ...] = (429, 500, 503)
+    stream_chunk_chars: int = 200
+    stream_chunk_delay_ms: float = 0.0
+    # GET polls a new file answers PROCESSING to before turning ACTIVE
+    processing_polls: int = 1
+    seed: int = 0
+
+
+class Recordings:
+    """Recorded responses in a JSON-lines file: {key, model, text, usage}."""
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if path and path.exists():
+            for line in path.read_text().splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry
+            logger.info("Loaded %d recorded Gemini responses from %s", len(self._entries), path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict | None:
+        return self._entries.get(key)
+
+    def add(self, entry: dict) -> None:
+        with self._lock:
+            self._entries[entry["key"]] = entry
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a") as f:
+                    f.write(json.dumps(entry) + "\n")
+
+
+def _usage(payload: dict, text: str) -> dict:
+    prompt_chars = len(json.dumps(payload.get("contents", [])))
+    prompt_chars += len(json.dumps(payload.get("system_instruction", {})))
+    prompt_tokens = prompt_chars // 4 + 1
+    output_tokens = len(text) // 4 + 1
+    return {
+        "promptTokenCount": prompt_tokens,
+        "candidatesTokenCount": output_tokens,
+        "totalTokenCount": prompt_tokens + output_tokens,
+    }
+
+
+def _references_files(payload: dict) -> bool:
+    """Whether a generate request carries file_data parts (Files API uploads)."""
+    return any(
+        "file_data" in part or "fileData" in part
+        for content in payload.get("contents", [])
+        for part in content.get("parts", [])
+    )
+
+
+def _response_body(text: str, usage: dict | None, finish_reason: str | None = "STOP") -> dict:
+    candidate = {"content": {"parts": [{"text": text}], "role": "model"}}
+    if finish_reason:
+        candidate["finishReason"] = finish_reason
+    body = {"candidates": [candidate]}
+    if usage:
+        body["usageMetadata"] = usage
+    return body
+
+
+class FakeGeminiServer:
+    """A threaded local HTTP server speaking enough of the Gemini API for the pipeline."""
+
+    def __init__(
+        self,
+        recordings_path: Path | None = None,
+        mode: str = "replay",
+        responder: Responder | None = None,
+        faults: FaultConfig | None = None,
+        upstream: str = REAL_API_BASE,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if mode not in ("replay", "record"):
+            raise ValueError(f"Unknown fake Gemini mode: {mode}")
+        self.mode = mode
+        self.recordings = Recordings(recordings_path)
+        self.responder = responder
+        self.faults = faults or FaultConfig()
+        self.upstream = upstream.rstrip("/")
+        self._rng = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._fail_queue: list[int] = []
+        self._uploads: dict[str, dict] = {}
+        self._interrupt_uploads = 0
+        self._files: dict[str, dict] = {}
+        self._stats: Counter = Counter()
+
+        handler = type("_Handler", (_Handler,), {"fake": self})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGeminiServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name="fake-gemini", daemon=True)
+        self._thread.start()
+        logger.info("Fake Gemini (%s mode) listening on %s", self.mode, self.base_url)
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeGeminiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Run in the foreground (CLI)."""
+        logger.info("Fake Gemini (%s mode) listening on %s", self.mode, self.base_url)
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    # --- Fault injection ---
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Answer the next count generate calls with this HTTP status."""
+        with self._lock:
+            self._fail_queue.extend([status] * count)
+
+    def interrupt_next_upload(self, count: int = 1) -> None:
+        """Drop the connection mid-way through the next count upload chunks."""
+        with self._lock:
+            self._interrupt_uploads += count
+
+    def _injected_error(self) -> int | None:
+        with self._lock:
+            if self._fail_queue:
+                return self._fail_queue.pop(0)
+            if self.faults.error_rate and self._rng.random() < self.faults.error_rate:
+                return self._rng.choice(self.faults.error_codes)
+        return None
+
+    def _delay(self) -> None:
+        with self._lock:
+            jitter = self._rng.uniform(0, self.faults.jitter_ms) if self.faults.jitter_ms else 0.0
+        delay = (self.faults.latency_ms + jitter) / 1000
+        if delay > 0:
+            time.sleep(delay)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """Request and outcome counters (generate, stream, replayed, recorded, errors_*...)."""
+        with self._lock:
+            return dict(self._stats)
+
+    # --- Generate ---
+
+    def generate(self, model: str, payload: dict, query: dict, headers: dict) -> tuple[str, dict]:
+        """Resolve a generate request to (text, usage), recording in record mode.
+
+        Raises:
+            LookupError: If there is no recording and no responder (replay mode).
+        """
+        key = request_key(model, payload)
+        entry = self.recordings.get(key)
+        if entry:
+            self.count("replayed")
+            return entry["text"], entry.get("usage") or _usage(payload, entry["text"])
+
+        if self.mode == "record" and not _references_files(payload):
+            text, usage = self._forward(model, payload, query, headers)
+            self.recordings.add({"key": key, "model": model, "text": text, "usage": usage})
+            self.count("recorded")
+            return text, usage
+
+        if self.responder is None:
+            self.count("unmatched")
+            raise LookupError(f"No recording for {model} request {key[:12]}")
+        text = self.responder(model, payload)
+        self.count("generated")
+        return text, _usage(payload, text)
+
+    def _forward(self, model: str, payload: dict, query: dict,
+                 headers: dict) -> tuple[str, dict]:
+        from src import http_client
+
+        forward_headers = {"Content-Type": "application/json"}
+        if headers.get("x-goog-api-key"):
+            forward_headers["x-goog-api-key"] = headers["x-goog-api-key"]
+        params = {"key": query["key"][0]} if "key" in query else None
+        resp = http_client.post(
+            f"{self.upstream}/v1beta/models/{model}:generateContent",
+            headers=forward_headers, params=params, json=payload, timeout=300,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        parts = data["candidates"][0]["content"]["parts"]
+        # Keep the final text part (thinking models may emit more than one)
+        text = [p["text"] for p in parts if "text" in p][-1]
+        return text, data.get("usageMetadata") or _usage(payload, text)
+
+    # --- Files API ---
+
+    def start_upload(self, metadata: dict, size: int, mime_type: str = "audio/mpeg") -> str:
+        upload_id = hashlib.sha256(f"{time.time_ns()}-{len(self._uploads)}".encode()).hexdigest()
+        with self._lock:
+            self._uploads[upload_id[:16]] = {
+                "metadata": metadata, "size": size, "mime_type": mime_type, "received": 0,
+                "digest": hashlib.sha256(), "info": None,
+            }
+        return upload_id[:16]
+
+    def upload_chunk(self, upload_id: str, offset: int, data: bytes,
+                     finalize: bool) -> tuple[int, dict | None]:
+        """Append a chunk at offset; returns (HTTP status, file info once finalized).
+
+        Status 0 means the connection should be dropped without a response
+        (an interrupt_next_upload fault; half the chunk is kept).
+        """
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+            if upload is None:
+                return 404, None
+            if offset != upload["received"]:
+                return 400, None
+            if self._interrupt_uploads:
+                self._interrupt_uploads -= 1
+                data = data[:len(data) // 2]
+                upload["digest"].update(data)
+                upload["received"] += len(data)
+                return 0, None
+            upload["digest"].update(data)
+            upload["received"] += len(data)
+            if not finalize:
+                return 200, None
+            # Same bytes → same file id, so replayed audio analysis requests hash identically
+            file_id = upload["digest"].hexdigest()[:16]
+            display_name = upload["metadata"].get("file", {}).get("display_name", file_id)
+            info = {
+                "name": f"files/{file_id}",
+                "displayName": display_name,
+                "mimeType": upload["mime_type"],
+                "sizeBytes": str(upload["received"]),
+                "uri": f"{self.base_url}/v1beta/files/{file_id}",
+                "state": "PROCESSING" if self.faults.processing_polls > 0 else "ACTIVE",
+            }
+            upload["info"] = info
+            self._files[file_id] = {"info": info, "polls_left": self.faults.processing_polls}
+            return 200, info
+
+    def query_upload(self, upload_id: str) -> tuple[int, dict | None] | None:
+        """(bytes received, file info if finalized) for an upload session, or None."""
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+            if upload is None:
+                return None
+            return upload["received"], upload["info"]
+
+    def poll_file(self, file_id: str) -> dict | None:
+        with self._lock:
+            entry = self._files.get(file_id)
+            if entry is None:
+                return None
+            if entry["polls_left"] > 0:
+                entry["polls_left"] -= 1
+            else:
+                entry["info"]["state"] = "ACTIVE"
+            return dict(entry["info"])
+
+    def delete_file(self, file_id: str) -> bool:
+        with self._lock:
+            return self._files.pop(file_id, None) is not None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    fake: FakeGeminiServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("fake-gemini: " + format, *args)
+
+    # --- Helpers ---
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": {
+            "code": status, "message": message,
+            "status": _ERROR_STATUS.get(status, "UNKNOWN"),
+        }})
+
+    # --- Routes ---
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        body = self._body()
+
+        if url.path == "/upload/v1beta/files" and "upload_id" in query:
+            self._upload(query["upload_id"][0], body)
+            return
+        if url.path == "/upload/v1beta/files":
+            size = int(self.headers.get("X-Goog-Upload-Header-Content-Length") or 0)
+            upload_id = self.fake.start_upload(
+                json.loads(body or b"{}"), size,
+                self.headers.get("X-Goog-Upload-Header-Content-Type", "audio/mpeg"),
+            )
+            self.fake.count("upload_start")
+            self._send_json(200, {}, headers={
+                "X-Goog-Upload-URL":
+                    f"{self.fake.base_url}/upload/v1beta/files?upload_id={upload_id}",
+                "X-Goog-Upload-Status": "active",
+            })
+            return
+
+        match = _GENERATE_PATH.match(url.path)
+        if not match:
+            self._send_error(404, f"Unknown path {url.path}")
+            return
+        model, method = match.groups()
+        streaming = method == "streamGenerateContent"
+        self.fake.count("stream" if streaming else "generate")
+
+        self.fake._delay()
+        status = self.fake._injected_error()
+        if status:
+            self.fake.count(f"errors_{status}")
+            self._send_error(status, "Injected by fake Gemini")
+            return
+
+        try:
+            payload = json.loads(body)
+            text, usage = self.fake.generate(model, payload, query, dict(self.headers.items()))
+        except LookupError as e:
+            self._send_error(404, str(e))
+            return
+        except Exception as e:
+            logger.warning("Fake Gemini failed to answer %s: %s", model, e)
+            self._send_error(500, str(e))
+            return
+
+        if streaming:
+            self._stream(text, usage)
+        else:
+            self._send_json(200, _response_body(text, usage))
+
+    def _stream(self, text: str, usage: dict) -> None:
+        size = max(1, self.fake.faults.stream_chunk_chars)
+        chunks = [text[i:i + size] for i in range(0, len(text), size)] or [""]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        delay = self.fake.faults.stream_chunk_delay_ms / 1000
+        for i, chunk in enumerate(chunks):
+            last = i == len(chunks) - 1
+            event = _response_body(chunk, usage if last else None, "STOP" if last else None)
+            self.wfile.write(f"data: {json.dumps(event)}\r\n\r\n".encode())
+            self.wfile.flush()
+            if delay and not last:
+                time.sleep(delay)
+
+    def do_PUT(self) -> None:
+        url = urlparse(self.path)
+        self._upload(parse_qs(url.query).get("upload_id", [""])[0], self._body())
+
+    def _upload(self, upload_id: str, body: bytes) -> None:
+        """Resumable upload session commands: upload, upload+finalize, query."""
+        command = self.headers.get("X-Goog-Upload-Command", "")
+        if command == "query":
+            state = self.fake.query_upload(upload_id)
+            self.fake.count("upload_query")
+            if state is None:
+                self._send_error(404, "Unknown upload session")
+                return
+            received, info = state
+            self._send_json(200, {"file": info} if info else {}, headers={
+                "X-Goog-Upload-Status": "final" if info else "active",
+                "X-Goog-Upload-Size-Received": str(received),
+            })
+            return
+
+        offset = int(self.headers.get("X-Goog-Upload-Offset") or 0)
+        status, info = self.fake.upload_chunk(upload_id, offset, body, "finalize" in command)
+        self.fake.count("upload_chunk")
+        if status == 0:
+            self.fake.count("upload_interrupted")
+            self.close_connection = True
+            return
+        if status == 404:
+            self._send_error(404, "Unknown upload session")
+            return
+        if status == 400:
+            self._send_error(400, f"Upload offset {offset} does not match bytes received")
+            return
+        if info is None:
+            self._send_json(200, {}, headers={"X-Goog-Upload-Status": "active"})
+            return
+        self.fake.count("upload_finish")
+        self._send_json(200, {"file": info}, headers={"X-Goog-Upload-Status": "final"})
+
+    def do_GET(self) -> None:
+        match = _FILE_PATH.match(urlparse(self.path).path)
+        info = self.fake.poll_file(match.group(1)) if match else None
+        self.fake.count("file_poll")
+        if info is None:
+            self._send_error(404, "File not found")
+            return
+        self._send_json(200, info)
+
+    def do_DELETE(self) -> None:
+        match = _FILE_PATH.match(urlparse(self.path).path)
+        self.fake.count("file_delete")
+        if not match or not self.fake.delete_file(match.group(1)):
+            self._send_error(404, "File not found")
+            return
+        self._send_json(200, {})
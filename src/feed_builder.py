@@ -1,24 +1,54 @@
 """RSS/podcast feed generation using feedgen."""
 
+import gzip
+import hashlib
 import json
 import logging
+import os
+import re
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from feedgen.feed import FeedGenerator
+import brotli
 
 from config import ShowConfig, settings
 from src import database
 from src.exceptions import FeedBuildError
 from src.models import EpisodeMetadata
 
+if TYPE_CHECKING:
+    from feedgen.feed import FeedGenerator
+
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class FeedBytes:
+    """A built feed held in memory, with what the feed routes need for conditional GET."""
+
+    body: bytes
+    # Content hash: strong validator for the body (encoded variants append -gzip / -br)
+    etag: str
+    # Unix seconds of the last content change (feed.xml mtime)
+    last_modified: int
+    # Pre-compressed bodies by Content-Encoding ("gzip", "br")
+    encoded: dict[str, bytes] = field(default_factory=dict)
+    # (mtime_ns, size) of feed.xml when cached, to notice writes by other processes
+    stat_key: tuple[int, int] = (0, 0)
+
+
+# Built feeds by feed.xml path: refreshed by build_feed(), served by the feed routes
+_feed_cache: dict[str, FeedBytes] = {}
+
 DEFAULT_FEED_PATH = Path("output/feed.xml")
 DEFAULT_EPISODES_JSON = Path("output/episodes.json")
 MAX_FEED_EPISODES = 30
 FALLBACK_RSS_DESCRIPTION = "Your nightly knowledge briefing."
 
+_LAST_BUILD_DATE = re.compile(rb"<lastBuildDate>([^<]+)</lastBuildDate>")
+
 
 def _resolve_paths(show: ShowConfig | None) -> tuple[Path, Path]:
     """Return (feed_path, episodes_json) for the given show."""
@@ -42,7 +72,23 @@ def _save_episode_catalog(episodes: list[dict], show: ShowConfig | None = None)
     episodes_json.write_text(json.dumps(episodes, indent=2))
 
 
-def _build_feed_generator(episodes: list[dict], show: ShowConfig | None = None) -> FeedGenerator:
+def _episode_published(ep: dict) -> datetime:
+    """An episode's published time, falling back to its date (18:30 UTC, as add_episode sets).
+
+    Never the current time, so an unchanged catalog rebuilds to the same bytes.
+    """
+    if ep.get("published"):
+        return datetime.fromisoformat(ep["published"])
+    try:
+        return datetime.strptime(ep["date"], "%Y-%m-%d").replace(
+            hour=18, minute=30, tzinfo=UTC
+        )
+    except ValueError:
+        return datetime.fromtimestamp(0, UTC)
+
+
+def _build_feed_generator(episodes: list[dict],
+                          show: ShowConfig | None = None) -> "FeedGenerator":
     """Create and configure a FeedGenerator with podcast extension.
 
     Args:
@@ -52,6 +98,8 @@ def _build_feed_generator(episodes: list[dict], show: ShowConfig | None = None)
     Returns:
         Configured FeedGenerator.
     """
+    # feedgen pulls in lxml; imported on first feed build, not at app startup
+    from feedgen.feed import FeedGenerator
     fg = FeedGenerator()
     fg.load_extension("podcast")
 
@@ -118,10 +166,7 @@ def _build_feed_generator(episodes: list[dict], show: ShowConfig | None = None)
         fe.title(display_date)
         fallback = f"Your nightly knowledge briefing from {title}."
         fe.description(ep.get("rss_summary") or fallback)
-        fe.published(
-            datetime.fromisoformat(ep["published"]) if "published" in ep
-            else datetime.now(UTC)
-        )
+        fe.published(_episode_published(ep))
 
         # Enclosure (the MP3 file)
         fe.enclosure(mp3_url, str(ep["file_size_bytes"]), "audio/mpeg")
@@ -265,6 +310,10 @@ def clear_feed(show: ShowConfig | None = None) -> None:
 def build_feed(show: ShowConfig | None = None) -> str:
     """Build or rebuild the complete RSS feed XML.
 
+    Also refreshes the in-memory copy served by the feed routes. feed.xml is
+    only rewritten when its content changes, so its mtime (Last-Modified) and
+    lastBuildDate both mark the last real change.
+
     Returns:
         Path to the generated feed.xml file.
     """
@@ -272,12 +321,65 @@ def build_feed(show: ShowConfig | None = None) -> str:
         feed_path, _ = _resolve_paths(show)
         episodes = _load_episode_catalog(show)
         fg = _build_feed_generator(episodes, show)
+        previous = feed_path.read_bytes() if feed_path.exists() else None
 
-        feed_path.parent.mkdir(parents=True, exist_ok=True)
-        fg.rss_file(str(feed_path), pretty=True)
+        # Render with the previous lastBuildDate first: if nothing else changed
+        # (e.g. the rebuild on every startup) the bytes and the ETag stay the same
+        xml = None
+        if previous and (match := _LAST_BUILD_DATE.search(previous)):
+            fg.lastBuildDate(parsedate_to_datetime(match.group(1).decode()))
+            xml = fg.rss_str(pretty=True)
 
-        logger.info("Feed written to %s (%d episodes)", feed_path, len(episodes))
+        feed_path.parent.mkdir(parents=True, exist_ok=True)
+        if xml is not None and xml == previous:
+            logger.info("Feed unchanged at %s (%d episodes)", feed_path, len(episodes))
+        else:
+            fg.lastBuildDate(datetime.now(UTC))
+            xml = fg.rss_str(pretty=True)
+            tmp = feed_path.with_suffix(".xml.tmp")
+            tmp.write_bytes(xml)
+            os.replace(tmp, feed_path)
+            logger.info("Feed written to %s (%d episodes)", feed_path, len(episodes))
+        _cache_feed(feed_path, xml)
         return str(feed_path)
 
     except Exception as e:
         raise FeedBuildError(f"Failed to build feed: {e}") from e
+
+
+def _cache_feed(feed_path: Path, xml: bytes) -> FeedBytes:
+    stat = feed_path.stat()
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _feed_cache.get(str(feed_path))
+    if cached is not None and cached.stat_key == stat_key and cached.body == xml:
+        return cached  # no-op rebuild: skip recompressing
+    encoded = {
+        "gzip": gzip.compress(xml, compresslevel=9, mtime=0),
+        "br": brotli.compress(xml, quality=11),
+    }
+    feed = FeedBytes(
+        body=xml,
+        etag=hashlib.blake2b(xml, digest_size=16).hexdigest(),
+        last_modified=int(stat.st_mtime),
+        encoded=encoded,
+        stat_key=stat_key,
+    )
+    _feed_cache[str(feed_path)] = feed
+    return feed
+
+
+def get_feed_bytes(show: ShowConfig | None = None) -> FeedBytes | None:
+    """The show's built feed from memory, or None if it hasn't been generated.
+
+    Costs one stat() per call: feed.xml is re-read only if it was written
+    since it was cached (e.g. by a script in another process).
+    """
+    feed_path, _ = _resolve_paths(show)
+    try:
+        stat = feed_path.stat()
+    except FileNotFoundError:
+        return None
+    cached = _feed_cache.get(str(feed_path))
+    if cached is not None and cached.stat_key == (stat.st_mtime_ns, stat.st_size):
+        return cached
+    return _cache_feed(feed_path, feed_path.read_bytes())
@@ -1,76 +1,150 @@
-"""Upload episode MP3 files and sync SQLite DB via Google Cloud Storage."""
+"""Host episode MP3s and sync the SQLite DB on object storage (GCS or a local directory).
 
-import json
+Works on storage_backend.get_backend(); STORAGE_BACKEND picks the implementation.
+"""
+
+import base64
+import hashlib
 import logging
-import sqlite3
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from google.cloud import storage
-from google.oauth2 import service_account
-
-from config import is_dev, is_prod, settings
+from config import is_dev, settings
+from src import database, db_replication, storage_backend
+from src.storage_backend import ObjectInfo, StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Episodes at least this large are uploaded as parallel slices composed in storage
+COMPOSITE_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+COMPOSITE_SLICE_BYTES = 8 * 1024 * 1024
+COMPOSITE_MAX_SLICES = 8  # GCS composes at most 32 sources per request
+
+
+def _file_checksums(path: Path) -> tuple[str, str]:
+    """CRC32C and MD5 of a file, base64-encoded the way GCS reports them."""
+    import google_crc32c
+    crc, md5 = google_crc32c.Checksum(), hashlib.md5()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            crc.update(chunk)
+            md5.update(chunk)
+    return base64.b64encode(crc.digest()).decode(), base64.b64encode(md5.digest()).decode()
 
-def _get_client() -> storage.Client:
-    """Create a GCS client from service account credentials."""
-    creds_info = json.loads(settings.gcs_credentials_json)
-    credentials = service_account.Credentials.from_service_account_info(creds_info)
-    return storage.Client(credentials=credentials, project=credentials.project_id)
+
+def _matches(info: ObjectInfo | None, size: int, crc32c: str, md5: str) -> bool:
+    """True if an existing object already holds these bytes.
+
+    CRC32C is compared when present (composite objects have no MD5), MD5 otherwise.
+    """
+    if info is None or info.size != size:
+        return False
+    if info.crc32c:
+        return info.crc32c == crc32c
+    return info.md5_hash == md5
+
+
+def _composite_upload(backend: StorageBackend, key: str, local_path: Path, size: int,
+                      content_type: str) -> ObjectInfo:
+    """Upload local_path as parallel slices, then compose them into key.
+
+    Slices go to temporary objects next to the target and are deleted afterwards,
+    whether or not the compose succeeded.
+    """
+    slices = min(COMPOSITE_MAX_SLICES, max(2, -(-size // COMPOSITE_SLICE_BYTES)))
+    slice_size = -(-size // slices)
+    prefix = f"{key}.parts-{uuid.uuid4().hex[:8]}"
+    parts = [f"{prefix}/{i:02d}" for i in range(slices)]
+
+    def send(i: int) -> None:
+        offset = i * slice_size
+        backend.put(parts[i], local_path, content_type, offset=offset,
+                    length=min(slice_size, size - offset))
+
+    try:
+        with ThreadPoolExecutor(max_workers=slices, thread_name_prefix="storage-slice") as pool:
+            list(pool.map(send, range(slices)))
+        return backend.compose(key, parts, content_type)
+    finally:
+        for part in parts:
+            try:
+                backend.delete(part)
+            except Exception as e:
+                logger.warning("Could not delete upload slice %s: %s", part, e)
+
+
+def _episode_key(date: str, show_id: str) -> str:
+    return f"episodes/{show_id}/noctua-{date}.mp3"
 
 
 def upload_episode(local_path: Path, date: str, show_id: str = "noctua") -> str:
-    """Upload an episode MP3 to GCS and return the public URL.
+    """Upload an episode MP3 and return its public URL.
+
+    Skips the upload when the object already holds identical bytes (same size
+    and CRC32C/MD5), e.g. on re-publish. Files of COMPOSITE_UPLOAD_THRESHOLD or
+    more are sent as parallel slices and composed server-side.
 
     Args:
         local_path: Path to the local MP3 file.
         date: Episode date string (YYYY-MM-DD).
-        show_id: Show identifier for namespaced blob paths.
+        show_id: Show identifier for namespaced object keys.
 
     Returns:
         Public URL of the uploaded file.
+
+    Raises:
+        ValueError: If the composed object's CRC32C does not match the local file.
     """
-    bucket_name = settings.gcs_bucket_name
-    blob_name = f"episodes/{show_id}/noctua-{date}.mp3"
+    backend = storage_backend.get_backend()
+    key = _episode_key(date, show_id)
+    url = backend.public_url(key)
+
+    size = local_path.stat().st_size
+    crc32c, md5 = _file_checksums(local_path)
+    if _matches(backend.stat(key), size, crc32c, md5):
+        logger.info("Episode already stored with the same checksum, skipped upload: %s", url)
+        return url
+
+    if size >= COMPOSITE_UPLOAD_THRESHOLD:
+        info = _composite_upload(backend, key, local_path, size, "audio/mpeg")
+        if info.crc32c != crc32c:
+            raise ValueError(f"Composed upload of {key} failed the CRC32C check")
+    else:
+        backend.put(key, local_path, "audio/mpeg")
+
+    logger.info("Uploaded episode to %s: %s (%.1f MB)", backend.name, url, size / (1024 * 1024))
+    return url
 
-    client = _get_client()
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_name)
 
-    blob.upload_from_filename(str(local_path), content_type="audio/mpeg")
+def download_episode(date: str, local_path: Path, show_id: str = "noctua") -> None:
+    """Download a stored episode MP3 to local_path.
 
-    url = f"https://storage.googleapis.com/{bucket_name}/{blob_name}"
-    logger.info("Uploaded episode to GCS: %s", url)
-    return url
+    Raises:
+        FileNotFoundError: If the episode is not in storage.
+    """
+    storage_backend.get_backend().get(_episode_key(date, show_id), local_path)
 
 
 def is_configured() -> bool:
-    """Check if GCS storage is configured."""
-    return bool(settings.gcs_bucket_name and settings.gcs_credentials_json)
+    """Check if object storage is configured."""
+    return storage_backend.is_configured()
 
 
 # --- SQLite DB sync ---
 
 
-def _checkpoint_wal(db_path: Path) -> None:
-    """Flush WAL journal into the main DB file before upload."""
-    if not db_path.exists():
-        return
-    conn = sqlite3.connect(str(db_path))
-    try:
-        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-    finally:
-        conn.close()
-
-
 def upload_db(db_path: Path, show_id: str = "hootline") -> bool:
-    """Upload the SQLite DB to GCS. Returns True on success.
+    """Upload the SQLite DB to object storage. Returns True on success.
 
-    Only runs in prod (NOCTUA_ENV=prod). Dev is read-only against prod GCS.
+    With GCS, only runs in prod (NOCTUA_ENV=prod): dev is read-only against prod GCS.
+    Uploads a consistent snapshot taken with the SQLite backup API (writers
+    are not blocked). With DB_REPLICATION, only the pages changed since the
+    last upload are sent.
     Non-fatal: logs errors but never raises.
     """
-    if is_dev():
+    if is_dev() and settings.storage_backend == "gcs":
         logger.warning("DEV MODE: upload_db() called but skipped — data will NOT persist to GCS. "
                         "Set NOCTUA_ENV=prod to enable.")
         return False
@@ -79,40 +153,53 @@ def upload_db(db_path: Path, show_id: str = "hootline") -> bool:
     if not db_path.exists():
         logger.warning("DB file not found at %s — skipping upload.", db_path)
         return False
+    if settings.db_replication:
+        try:
+            db_replication.push(db_path, storage_backend.get_backend().bucket, show_id)
+            return True
+        except Exception as e:
+            logger.error("Failed to replicate DB to storage: %s", e)
+            return False
     try:
-        _checkpoint_wal(db_path)
         blob_name = f"db/{show_id}/noctua.db"
-        client = _get_client()
-        bucket = client.bucket(settings.gcs_bucket_name)
-        blob = bucket.blob(blob_name)
-        blob.upload_from_filename(str(db_path), content_type="application/x-sqlite3")
-        logger.info("Uploaded DB to GCS: %s", blob_name)
+        with tempfile.TemporaryDirectory(prefix="noctua-db-") as tmp:
+            # Upload a snapshot, never the live file: a concurrent write can't tear it
+            snap = Path(tmp) / "noctua.db"
+            database.snapshot(snap, vacuum=settings.db_snapshot_vacuum, db_path=db_path)
+            storage_backend.get_backend().put(blob_name, snap, "application/x-sqlite3")
+        logger.info("Uploaded DB to storage: %s", blob_name)
         return True
     except Exception as e:
-        logger.error("Failed to upload DB to GCS: %s", e)
+        logger.error("Failed to upload DB to storage: %s", e)
         return False
 
 
 def download_db(db_path: Path, show_id: str = "hootline") -> bool:
-    """Download the SQLite DB from GCS. Returns True if downloaded.
+    """Download the SQLite DB from object storage. Returns True if downloaded.
 
-    Only overwrites if the blob exists in GCS.
+    Only overwrites if the object exists. With DB_REPLICATION, the
+    incremental replica is preferred and the full blob is the fallback.
     Non-fatal: logs warnings but never raises.
     """
     if not is_configured():
         return False
+    if settings.db_replication:
+        try:
+            if db_replication.restore(db_path, storage_backend.get_backend().bucket, show_id):
+                return True
+            logger.info("No DB replica in storage for %s — trying the full DB blob.", show_id)
+        except Exception as e:
+            logger.warning("Failed to restore DB replica from storage: %s — "
+                           "trying the full DB blob.", e)
     try:
         blob_name = f"db/{show_id}/noctua.db"
-        client = _get_client()
-        bucket = client.bucket(settings.gcs_bucket_name)
-        blob = bucket.blob(blob_name)
-        if not blob.exists():
-            logger.info("No DB blob in GCS at %s — using local DB.", blob_name)
+        backend = storage_backend.get_backend()
+        if backend.stat(blob_name) is None:
+            logger.info("No DB object in storage at %s — using local DB.", blob_name)
             return False
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        blob.download_to_filename(str(db_path))
-        logger.info("Downloaded DB from GCS: %s", blob_name)
+        backend.get(blob_name, db_path)
+        logger.info("Downloaded DB from storage: %s", blob_name)
         return True
     except Exception as e:
-        logger.warning("Failed to download DB from GCS: %s — using local DB.", e)
+        logger.warning("Failed to download DB from storage: %s — using local DB.", e)
         return False
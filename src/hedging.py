@@ -0,0 +1,143 @@
+"""Hedged requests for latency-critical Gemini calls.
+
+A hedged call starts the request and, if it has not finished by the p95
+latency observed for that call kind, starts an identical backup request;
+whichever succeeds first wins. It trims the long tail of slow responses
+(classification, digest compile) at the cost of an occasional extra call.
+
+Latencies are tracked per key (the call site); hedging only kicks in once
+MIN_SAMPLES successful calls have been seen, and is off unless
+GEMINI_HEDGE_REQUESTS is set.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latency samples kept per key
+WINDOW = 200
+# No hedging until this many samples exist for a key
+MIN_SAMPLES = 20
+# Never hedge sooner than this (seconds)
+MIN_HEDGE_DELAY = 0.5
+
+_samples: dict[str, deque] = {}
+_counters: Counter = Counter()
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+
+def observe(key: str, seconds: float) -> None:
+    """Record a successful call's latency."""
+    with _lock:
+        _samples.setdefault(key, deque(maxlen=WINDOW)).append(seconds)
+
+
+def hedge_delay(key: str) -> float | None:
+    """Seconds to wait before hedging calls for key (p95), or None if too few samples."""
+    with _lock:
+        samples = sorted(_samples.get(key, ()))
+    if len(samples) < MIN_SAMPLES:
+        return None
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return max(MIN_HEDGE_DELAY, p95)
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _counters[name] += 1
+
+
+def hedged_call(fn: Callable[[], T], key: str) -> T:
+    """Run fn, racing a second fn() if the first outlives the p95 latency for key."""
+    delay = hedge_delay(key)
+    start = time.monotonic()
+    if delay is None:
+        result = fn()
+        observe(key, time.monotonic() - start)
+        return result
+
+    primary = _executor.submit(fn)
+    done, _ = wait([primary], timeout=delay)
+    if not done:
+        _count("hedges_fired")
+        logger.info("Hedging %s call after %.1fs", key, delay)
+        backup = _executor.submit(fn)
+        pending = {primary, backup}
+    else:
+        pending = {primary}
+        backup = None
+
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            # The loser keeps running in its thread; its result is discarded
+            observe(key, time.monotonic() - start)
+            if future is backup:
+                _count("hedges_won")
+            return future.result()
+    raise error
+
+
+async def hedged_call_async(factory: Callable[[], Awaitable[T]], key: str) -> T:
+    """Async hedged_call: the losing request is cancelled."""
+    delay = hedge_delay(key)
+    start = time.monotonic()
+    if delay is None:
+        result = await factory()
+        observe(key, time.monotonic() - start)
+        return result
+
+    primary = asyncio.ensure_future(factory())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    backup = None
+    pending = {primary}
+    if not done:
+        _count("hedges_fired")
+        logger.info("Hedging %s call after %.1fs", key, delay)
+        backup = asyncio.ensure_future(factory())
+        pending.add(backup)
+
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    error = error or task.exception()
+                    continue
+                observe(key, time.monotonic() - start)
+                if task is backup:
+                    _count("hedges_won")
+                return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+    raise error
+
+
+def stats() -> dict:
+    """Hedge counters and current hedge delay per key."""
+    with _lock:
+        keys = list(_samples)
+        counters = dict(_counters)
+    return {**counters, "delays": {k: hedge_delay(k) for k in keys}}
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
+        _counters.clear()
@@ -0,0 +1,134 @@
+"""Shared HTTP session with keep-alive connection pooling for outbound API calls.
+
+Every Gemini caller (llm_client, audio_transcriber, episode_analyzer) and the
+weather fetch go through one process-wide requests.Session, so repeated calls
+to the same host reuse pooled TCP+TLS connections instead of handshaking each
+time. requests/urllib3 speak HTTP/1.1 only; keep-alive pooling is where the
+win comes from.
+
+The session is safe to share across threads for this usage: no cookies or
+per-request session state are relied on, and urllib3 pools are thread-safe.
+
+Async callers (llm_client's *_async functions) use get_async_client(), one
+pooled httpx.AsyncClient per event loop.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Distinct hosts kept in the pool manager (Gemini API, upload URLs, wttr.in, GCS)
+POOL_CONNECTIONS = 8
+# Keep-alive connections per host — sized for parallel segment summarization
+POOL_MAXSIZE = 16
+
+# Applied when a caller does not pass its own timeout
+DEFAULT_TIMEOUT = 30
+
+_session: requests.Session | None = None
+_adapter: HTTPAdapter | None = None
+_lock = threading.Lock()
+
+# httpx.AsyncClient is bound to the loop it was first used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session, _adapter
+    if _session is None:
+        with _lock:
+            if _session is None:
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                      pool_maxsize=POOL_MAXSIZE, pool_block=False)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = "NoctuaPodcast/1.0"
+                _adapter, _session = adapter, session
+    return _session
+
+
+def request(method: str, url: str, timeout: float | None = DEFAULT_TIMEOUT,
+            **kwargs) -> requests.Response:
+    """Send a request through the shared session (same arguments as requests.request)."""
+    return get_session().request(method, url, timeout=timeout, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def put(url: str, **kwargs) -> requests.Response:
+    return request("PUT", url, **kwargs)
+
+
+def delete(url: str, **kwargs) -> requests.Response:
+    return request("DELETE", url, **kwargs)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the pooled async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE * POOL_CONNECTIONS,
+                                max_keepalive_connections=POOL_MAXSIZE),
+            headers={"User-Agent": "NoctuaPodcast/1.0"},
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's async client (call before the loop shuts down)."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def pool_stats() -> dict:
+    """Per-host connection pool statistics for /health/detail.
+
+    connections_opened counts new TCP connections; requests counts requests
+    sent. A high requests/connections ratio means keep-alive is working.
+    """
+    if _adapter is None:
+        return {"pool_maxsize": POOL_MAXSIZE, "hosts": {}}
+    hosts = {}
+    pools = _adapter.poolmanager.pools
+    with pools.lock:
+        entries = [pools[key] for key in pools.keys()]
+    for pool in entries:
+        hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+            "connections_opened": pool.num_connections,
+            "requests": pool.num_requests,
+            # The pool queue is pre-filled with None placeholders; count real sockets
+            "idle": sum(1 for conn in list(pool.pool.queue) if conn) if pool.pool else 0,
+        }
+    return {"pool_maxsize": POOL_MAXSIZE, "hosts": hosts}
+
+
+def close() -> None:
+    """Close the shared session and drop pooled connections."""
+    global _session, _adapter
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _adapter = None
@@ -0,0 +1,478 @@
+"""Persistent background jobs: transcription, learning analysis, weekly trends, GCS sync.
+
+Jobs live in a small SQLite file (JOB_QUEUE_PATH, separate from the show DBs
+so a GCS restore never overwrites the queue). A worker claims a job by taking
+a lease, extends it with heartbeats while the handler runs, and marks the job
+done or failed. Failed jobs are retried with exponential backoff until
+JOB_MAX_ATTEMPTS. If the process dies mid-job the lease is left behind; on
+the next startup reclaim_stalled() puts those jobs back in the queue so they
+resume instead of being lost.
+
+Each job type gets its own pool of workers (see WorkerPool), so several
+episodes published or backfilled at once queue up instead of all
+transcribing at the same time.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+RETRY_BACKOFF_SECONDS = 30  # doubled after each failed attempt
+POLL_SECONDS = 5.0  # idle workers also wake on enqueue
+KEEP_FINISHED_DAYS = 14
+
+# Identifies this process in lease owners (host:pid)
+PROCESS_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass
+class Job:
+    """A claimed job, handed to its handler."""
+
+    id: int
+    job_type: str
+    payload: dict
+    attempts: int
+    max_attempts: int
+    owner: str
+
+    @property
+    def final_attempt(self) -> bool:
+        """True when a failure now marks the job failed instead of retrying it."""
+        return self.attempts >= self.max_attempts
+
+
+Handler = Callable[[Job], Awaitable[None]]
+
+
+def _connect(db_path: Path | None = None) -> sqlite3.Connection:
+    path = Path(db_path or settings.job_queue_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_type TEXT NOT NULL,
+            payload TEXT NOT NULL DEFAULT '{}',
+            dedupe_key TEXT,
+            state TEXT NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            run_after REAL NOT NULL,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            heartbeat_at REAL,
+            last_error TEXT NOT NULL DEFAULT '',
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(job_type, state, run_after)"
+    )
+    return conn
+
+
+def enqueue(job_type: str, payload: dict, dedupe_key: str | None = None,
+            delay_seconds: float = 0, max_attempts: int | None = None,
+            db_path: Path | None = None) -> int:
+    """Add a job and return its id.
+
+    Args:
+        job_type: Handler name, e.g. "transcribe".
+        payload: JSON-serializable handler arguments.
+        dedupe_key: If a queued job of the same type has this key, return its id
+            instead of adding another (running jobs don't count: they may already
+            have read stale data).
+        delay_seconds: Earliest start, relative to now.
+        max_attempts: Defaults to JOB_MAX_ATTEMPTS.
+        db_path: Queue DB (defaults to JOB_QUEUE_PATH).
+    """
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if dedupe_key is not None:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE job_type = ? AND dedupe_key = ? AND state = ?",
+                (job_type, dedupe_key, QUEUED),
+            ).fetchone()
+            if row:
+                conn.execute("COMMIT")
+                return row["id"]
+        cursor = conn.execute(
+            """INSERT INTO jobs (job_type, payload, dedupe_key, state, max_attempts,
+                                 run_after, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (job_type, json.dumps(payload), dedupe_key, QUEUED,
+             max_attempts or settings.job_max_attempts, now + delay_seconds, now, now),
+        )
+        conn.execute("COMMIT")
+        job_id = cursor.lastrowid
+    finally:
+        conn.close()
+    logger.info("Queued %s job %d", job_type, job_id)
+    if _pool is not None:
+        _pool.wake(job_type)
+    return job_id
+
+
+def claim(job_type: str, owner: str, lease_seconds: float | None = None,
+          db_path: Path | None = None) -> Job | None:
+    """Lease the oldest due job of this type, or return None if there is none."""
+    lease = lease_seconds or settings.job_lease_seconds
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            """SELECT * FROM jobs WHERE job_type = ? AND state = ? AND run_after <= ?
+               ORDER BY run_after, id LIMIT 1""",
+            (job_type, QUEUED, now),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        conn.execute(
+            """UPDATE jobs SET state = ?, attempts = attempts + 1, lease_owner = ?,
+                              lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+               WHERE id = ?""",
+            (RUNNING, owner, now + lease, now, now, row["id"]),
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return Job(id=row["id"], job_type=job_type, payload=json.loads(row["payload"]),
+               attempts=row["attempts"] + 1, max_attempts=row["max_attempts"], owner=owner)
+
+
+def heartbeat(job: Job, lease_seconds: float | None = None,
+              db_path: Path | None = None) -> bool:
+    """Extend the job's lease. Returns False if the lease was lost (reclaimed)."""
+    lease = lease_seconds or settings.job_lease_seconds
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            """UPDATE jobs SET lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+               WHERE id = ? AND state = ? AND lease_owner = ?""",
+            (now + lease, now, now, job.id, RUNNING, job.owner),
+        )
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def complete(job: Job, db_path: Path | None = None) -> None:
+    """Mark a leased job done."""
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires_at = NULL,
+                              updated_at = ?
+               WHERE id = ? AND lease_owner = ?""",
+            (DONE, now, job.id, job.owner),
+        )
+    finally:
+        conn.close()
+
+
+def fail(job: Job, error: str, db_path: Path | None = None) -> bool:
+    """Record a failed attempt. Returns True if the job will be retried."""
+    now = time.time()
+    retry = not job.final_attempt
+    backoff = RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """UPDATE jobs SET state = ?, run_after = ?, last_error = ?, lease_owner = NULL,
+                              lease_expires_at = NULL, updated_at = ?
+               WHERE id = ? AND lease_owner = ?""",
+            (QUEUED if retry else FAILED, now + backoff, error[:2000], now,
+             job.id, job.owner),
+        )
+    finally:
+        conn.close()
+    return retry
+
+
+def release(job: Job, db_path: Path | None = None) -> None:
+    """Put an interrupted job back in the queue without spending an attempt."""
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """UPDATE jobs SET state = ?, attempts = attempts - 1, run_after = ?,
+                              lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+               WHERE id = ? AND state = ? AND lease_owner = ?""",
+            (QUEUED, now, now, job.id, RUNNING, job.owner),
+        )
+    finally:
+        conn.close()
+
+
+def reclaim_stalled(expired_only: bool = True, db_path: Path | None = None) -> int:
+    """Requeue running jobs whose worker is gone. Returns the number reclaimed.
+
+    With expired_only=False every running job is reclaimed — call it that way at
+    startup, before any worker runs, since no lease can belong to a live worker.
+    Jobs that already used their last attempt are marked failed instead.
+    """
+    now = time.time()
+    where = "state = ?" + (" AND lease_expires_at < ?" if expired_only else "")
+    params: tuple = (RUNNING, now) if expired_only else (RUNNING,)
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(f"SELECT id, job_type, attempts, max_attempts FROM jobs WHERE {where}",
+                            params).fetchall()
+        for row in rows:
+            exhausted = row["attempts"] >= row["max_attempts"]
+            conn.execute(
+                """UPDATE jobs SET state = ?, run_after = ?, lease_owner = NULL,
+                                  lease_expires_at = NULL, updated_at = ?,
+                                  last_error = CASE WHEN last_error = '' THEN ? ELSE last_error END
+                   WHERE id = ?""",
+                (FAILED if exhausted else QUEUED, now, now, "lease expired", row["id"]),
+            )
+            logger.warning("Reclaimed stalled %s job %d (attempt %d/%d)%s", row["job_type"],
+                           row["id"], row["attempts"], row["max_attempts"],
+                           " — no attempts left, marked failed" if exhausted else "")
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def expedite(job_type: str, db_path: Path | None = None) -> int:
+    """Make every queued job of this type due now. Returns the number of jobs."""
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "UPDATE jobs SET run_after = ?, updated_at = ? "
+            "WHERE job_type = ? AND state = ? AND run_after > ?",
+            (now, now, job_type, QUEUED, now),
+        )
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def pending(job_type: str, db_path: Path | None = None) -> int:
+    """Number of queued or running jobs of this type."""
+    conn = _connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE job_type = ? AND state IN (?, ?)",
+            (job_type, QUEUED, RUNNING),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def purge_finished(max_age_days: int = KEEP_FINISHED_DAYS, db_path: Path | None = None) -> int:
+    """Delete done and failed jobs older than max_age_days. Returns the number deleted."""
+    cutoff = time.time() - max_age_days * 24 * 3600
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "DELETE FROM jobs WHERE state IN (?, ?) AND updated_at < ?", (DONE, FAILED, cutoff),
+        )
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def stats(db_path: Path | None = None) -> dict:
+    """Job counts per type and state, plus the live worker pool."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT job_type, state, COUNT(*) AS n FROM jobs GROUP BY job_type, state"
+        ).fetchall()
+    finally:
+        conn.close()
+    counts: dict[str, dict[str, int]] = {}
+    for row in rows:
+        counts.setdefault(row["job_type"], {})[row["state"]] = row["n"]
+    return {
+        "jobs": counts,
+        "workers": _pool.concurrency if _pool is not None else {},
+    }
+
+
+# --- Worker pool ---
+
+_pool: "WorkerPool | None" = None
+
+
+class WorkerPool:
+    """Async workers, a fixed number per job type, running handlers from the queue."""
+
+    def __init__(self, handlers: dict[str, Handler], concurrency: dict[str, int],
+                 db_path: Path | None = None):
+        self.handlers = handlers
+        self.concurrency = {t: max(1, concurrency.get(t, 1)) for t in handlers}
+        self.db_path = db_path
+        self._events: dict[str, asyncio.Event] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.started = False
+
+    def start(self) -> None:
+        """Start the workers on the running event loop and route enqueue wake-ups here."""
+        global _pool
+        self._loop = asyncio.get_running_loop()
+        for job_type, count in self.concurrency.items():
+            self._events[job_type] = asyncio.Event()
+            for index in range(count):
+                self._tasks.append(asyncio.create_task(self._worker(job_type, index)))
+        self._tasks.append(asyncio.create_task(self._reclaimer()))
+        _pool = self
+        self.started = True
+        logger.info("Job workers started: %s",
+                    ", ".join(f"{t}={n}" for t, n in self.concurrency.items()))
+
+    async def stop(self) -> None:
+        """Cancel the workers. Jobs in progress go back to the queue."""
+        global _pool
+        if _pool is self:
+            _pool = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def drain(self, job_type: str, timeout: float) -> bool:
+        """Run queued jobs of job_type now, including delayed ones, and wait for them.
+
+        Returns False if some were still queued or running after timeout seconds.
+        """
+        await asyncio.to_thread(expedite, job_type, self.db_path)
+        self.wake(job_type)
+        deadline = time.monotonic() + timeout
+        while await asyncio.to_thread(pending, job_type, self.db_path):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.2)
+        return True
+
+    def wake(self, job_type: str) -> None:
+        """Wake an idle worker for job_type. Safe to call from any thread."""
+        event = self._events.get(job_type)
+        if event is None or self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # loop shutting down
+
+    async def _worker(self, job_type: str, index: int) -> None:
+        owner = f"{PROCESS_ID}/{job_type}-{index}"
+        event = self._events[job_type]
+        while True:
+            # Clear before looking so an enqueue during the claim still wakes us
+            event.clear()
+            claiming = asyncio.ensure_future(
+                asyncio.to_thread(claim, job_type, owner, db_path=self.db_path)
+            )
+            try:
+                job = await asyncio.shield(claiming)
+            except asyncio.CancelledError:
+                # The claim thread can't be stopped: let it finish and hand the job back
+                job = await claiming
+                if job is not None:
+                    await self._update(release, job, self.db_path)
+                raise
+            except sqlite3.Error as e:
+                logger.error("Job queue claim failed for %s: %s", job_type, e)
+                job = None
+            if job is None:
+                # asyncio.timeout, not wait_for: wait_for can swallow a cancel that
+                # lands as the event fires, and the worker would never stop
+                try:
+                    async with asyncio.timeout(POLL_SECONDS):
+                        await event.wait()
+                except TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        logger.info("Running %s job %d (attempt %d/%d)", job.job_type, job.id,
+                    job.attempts, job.max_attempts)
+        beat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self.handlers[job.job_type](job)
+        except asyncio.CancelledError:
+            await self._update(release, job, self.db_path)
+            raise
+        except Exception as e:
+            retry = await self._update(fail, job, f"{type(e).__name__}: {e}", self.db_path)
+            logger.error("%s job %d failed (attempt %d/%d)%s: %s", job.job_type, job.id,
+                         job.attempts, job.max_attempts,
+                         " — will retry" if retry else "", e)
+        else:
+            await self._update(complete, job, self.db_path)
+            logger.info("%s job %d done", job.job_type, job.id)
+        finally:
+            beat.cancel()
+
+    @staticmethod
+    async def _update(fn: Callable, *args):
+        """Run a queue update in a thread, to completion even if the worker is cancelled.
+
+        A cancelled to_thread call that hasn't started yet never runs, which would
+        leave the job leased until the next startup. The cancel is re-raised after.
+        """
+        update = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        try:
+            return await asyncio.shield(update)
+        except asyncio.CancelledError:
+            await update
+            raise
+
+    async def _heartbeat(self, job: Job) -> None:
+        interval = settings.job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                alive = await asyncio.to_thread(heartbeat, job, db_path=self.db_path)
+            except sqlite3.Error as e:
+                logger.warning("Heartbeat failed for %s job %d: %s", job.job_type, job.id, e)
+                continue
+            if not alive:
+                logger.warning("%s job %d lost its lease — another worker may rerun it",
+                               job.job_type, job.id)
+                return
+
+    async def _reclaimer(self) -> None:
+        """Requeue jobs whose lease expired (a worker in another process died)."""
+        while True:
+            await asyncio.sleep(settings.job_lease_seconds)
+            try:
+                if await asyncio.to_thread(reclaim_stalled, True, self.db_path):
+                    for job_type in self.handlers:
+                        self.wake(job_type)
+            except sqlite3.Error as e:
+                logger.warning("Job reclaim failed: %s", e)
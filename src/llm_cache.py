@@ -0,0 +1,179 @@
+"""Opt-in disk cache of Gemini responses, keyed by a hash of the full request.
+
+Controlled by NOCTUA_LLM_CACHE:
+    off        — default; every call goes to Gemini.
+    readonly   — serve recorded responses, never write (benchmarks and evals
+                 replay a recorded run at zero latency; misses still call Gemini).
+    readwrite  — serve recorded responses and record new ones.
+
+Only calls that name a call site are cached; the call site picks the TTL.
+The key covers the model, system instruction, user message and generation
+config, so any prompt or parameter change is a miss. Entries live in a small
+SQLite file and are evicted least-recently-used once it exceeds
+LLM_CACHE_MAX_MB.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+from config import NOCTUA_LLM_CACHE, settings
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "readonly", "readwrite")
+
+DAY = 24 * 3600
+
+# TTL per call site, in seconds
+CALL_SITE_TTLS = {
+    "classify": 30 * DAY,        # temperature 0 topic classification
+    "segment_summary": 7 * DAY,
+    "digest_summary": 7 * DAY,   # single-call all-segments summary
+    "final_pass": 7 * DAY,       # RSS summary + quality report
+    "suggestions": 1 * DAY,      # episode_analyzer suggestions
+    "weekly_trends": 1 * DAY,
+}
+DEFAULT_TTL = 1 * DAY
+
+
+def mode() -> str:
+    """The active cache mode ("off" for unknown values)."""
+    value = NOCTUA_LLM_CACHE
+    if value not in MODES:
+        logger.warning("Unknown NOCTUA_LLM_CACHE=%r — cache disabled", value)
+        return "off"
+    return value
+
+
+def request_key(model: str, payload: dict) -> str:
+    """Deterministic key for a Gemini request (model + JSON body, keys sorted)."""
+    canonical = json.dumps({"model": model, "payload": payload}, sort_keys=True,
+                           separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _connect(readonly: bool = False) -> sqlite3.Connection | None:
+    """Open the cache DB, creating it if needed.
+
+    A read-only open never creates or writes anything; it returns None when
+    there is no cache file yet.
+    """
+    path = Path(settings.llm_cache_path)
+    if readonly:
+        if not path.exists():
+            return None
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS llm_responses (
+            cache_key TEXT PRIMARY KEY,
+            call_site TEXT NOT NULL,
+            response TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            last_used_at REAL NOT NULL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at)"
+    )
+    return conn
+
+
+def get(key: str) -> str | None:
+    """Return the cached response for key, or None (always None when the cache is off)."""
+    current = mode()
+    if current == "off":
+        return None
+    now = time.time()
+    try:
+        conn = _connect(readonly=current == "readonly")
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT response FROM llm_responses WHERE cache_key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row and current == "readwrite":
+                conn.execute("UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?",
+                             (now, key))
+                conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("LLM cache read failed: %s", e)
+        return None
+    return row[0] if row else None
+
+
+def put(key: str, response: str, call_site: str) -> None:
+    """Record a response (readwrite mode only), then evict down to the size limit."""
+    if mode() != "readwrite":
+        return
+    now = time.time()
+    ttl = CALL_SITE_TTLS.get(call_site, DEFAULT_TTL)
+    size = len(response.encode("utf-8"))
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                """INSERT OR REPLACE INTO llm_responses
+                   (cache_key, call_site, response, size_bytes, created_at, expires_at,
+                    last_used_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (key, call_site, response, size, now, now + ttl, now),
+            )
+            _evict(conn, now)
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("LLM cache write failed: %s", e)
+
+
+def _evict(conn: sqlite3.Connection, now: float) -> None:
+    """Drop expired entries, then least-recently-used ones until under the size cap."""
+    conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+    max_bytes = settings.llm_cache_max_mb * 1024 * 1024
+    total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+    if total <= max_bytes:
+        return
+    evicted = 0
+    for key, size in conn.execute(
+        "SELECT cache_key, size_bytes FROM llm_responses ORDER BY last_used_at"
+    ).fetchall():
+        if total <= max_bytes:
+            break
+        conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+        total -= size
+        evicted += 1
+    logger.info("LLM cache: evicted %d entries to stay under %d MB",
+                evicted, settings.llm_cache_max_mb)
+
+
+def stats() -> dict:
+    """Entry count and size per call site."""
+    current = mode()
+    if current == "off":
+        return {"mode": "off"}
+    conn = _connect(readonly=current == "readonly")
+    if conn is None:
+        return {"mode": current, "call_sites": {}}
+    try:
+        rows = conn.execute(
+            "SELECT call_site, COUNT(*), SUM(size_bytes) FROM llm_responses GROUP BY call_site"
+        ).fetchall()
+    finally:
+        conn.close()
+    return {
+        "mode": current,
+        "call_sites": {site: {"entries": n, "bytes": size} for site, n, size in rows},
+    }
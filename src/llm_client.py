@@ -1,17 +1,21 @@
 """Thin wrapper around the Google Gemini API."""
 
+import asyncio
+import json
 import logging
 import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
 
+import httpx
 import requests
 
 from config import settings
-from src.exceptions import LLMAPIError
+from src import circuit_breaker, hedging, http_client, llm_cache, rate_limiter
+from src.exceptions import CircuitOpenError, LLMAPIError
+from src.rate_limiter import Priority
 
 logger = logging.getLogger(__name__)
 
-API_URL = "https://generativelanguage.googleapis.com/v1beta/models"
-
 FLASH_MODEL = "gemini-2.5-flash"
 PRO_MODEL = "gemini-2.5-flash"
 
@@ -19,6 +23,170 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = [2, 5, 10]  # seconds to wait between retries
 
 
+def _build_request(
+    model: str,
+    method: str,
+    system: str,
+    user_message: str,
+    max_tokens: int,
+    temperature: float,
+) -> tuple[str, dict, dict]:
+    """Build (url, headers, payload) for a Gemini model method call."""
+    if not settings.gemini_api_key:
+        raise LLMAPIError("No GEMINI_API_KEY configured")
+
+    url = f"{settings.gemini_api_base}/v1beta/models/{model}:{method}"
+    headers = {
+        "content-type": "application/json",
+        "x-goog-api-key": settings.gemini_api_key,
+    }
+    payload = {
+        "system_instruction": {"parts": [{"text": system}]},
+        "contents": [{"parts": [{"text": user_message}]}],
+        "generationConfig": {
+            "maxOutputTokens": max_tokens,
+            "temperature": temperature,
+        },
+    }
+    return url, headers, payload
+
+
+def _backoff(attempt: int) -> int:
+    return RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
+
+
+class _GeminiRequest:
+    """One Gemini call: the request, its cache key, rate limiter and circuit breaker.
+
+    Request building and response handling live here once; the sync (requests)
+    and async (httpx) paths below only move the bytes and wait. Responses of
+    either library work, since both expose status_code, text and json().
+    """
+
+    def __init__(self, model: str, method: str, system: str, user_message: str,
+                 max_tokens: int, temperature: float, cache_site: str | None):
+        self.model = model
+        self.url, self.headers, self.payload = _build_request(
+            model, method, system, user_message, max_tokens, temperature,
+        )
+        self.cache_site = cache_site
+        self.cache_key = llm_cache.request_key(model, self.payload) if cache_site else None
+        self.limiter = rate_limiter.get_limiter(model)
+        self.reserve = rate_limiter.estimate_tokens(system, user_message) + max_tokens
+        self.breaker = circuit_breaker.get_breaker(model)
+        self.last_error: str | None = None
+        self.usage: int | None = None
+        self.chunks: list[str] = []
+
+    def cached(self) -> str | None:
+        return llm_cache.get(self.cache_key) if self.cache_key else None
+
+    def store(self, text: str) -> None:
+        """Record a complete response in the LLM cache (if this call site uses it)."""
+        if self.cache_key:
+            llm_cache.put(self.cache_key, text, self.cache_site)
+
+    def check_breaker(self, what: str = "call") -> None:
+        """Raises CircuitOpenError if the model's circuit breaker is open."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Gemini circuit open for {self.model} — skipping {what} "
+                                   f"(last error: {self.last_error})")
+
+    def response_text(self, resp, permit: rate_limiter.Permit, attempt: int) -> str | None:
+        """The text of a generateContent response, or None if the call should be retried.
+
+        Raises:
+            LLMAPIError: On a client error other than 429.
+        """
+        if resp.status_code == 429:
+            # Hold every queued call for this model instead of each retrying alone
+            permit.pause(_backoff(attempt))
+        elif resp.status_code >= 500:
+            self.breaker.record_failure()
+        elif resp.status_code >= 400:
+            raise LLMAPIError(f"Gemini API call failed: {resp.status_code}: {resp.text[:200]}")
+        else:
+            data = resp.json()
+            self.breaker.record_success()
+            permit.settle(rate_limiter.usage_tokens(data))
+            return data["candidates"][0]["content"]["parts"][0]["text"]
+
+        logger.warning(
+            "Gemini API %d (attempt %d/%d), retrying in %ds...",
+            resp.status_code, attempt + 1, MAX_RETRIES, _backoff(attempt),
+        )
+        self.last_error = f"{resp.status_code}: {resp.text[:200]}"
+        return None
+
+    def retry_wait(self, status_code: int, attempt: int) -> int:
+        """Seconds to sleep before retrying a response (a 429 already paused the limiter)."""
+        return 0 if status_code == 429 else _backoff(attempt)
+
+    def call_failed(self, error: Exception, attempt: int) -> int:
+        """Record a transport error. Returns seconds to sleep before the next attempt."""
+        self.last_error = str(error)
+        self.breaker.record_failure()
+        if attempt >= MAX_RETRIES - 1:
+            return 0
+        logger.warning(
+            "Gemini API error (attempt %d/%d): %s, retrying in %ds...",
+            attempt + 1, MAX_RETRIES, error, _backoff(attempt),
+        )
+        return _backoff(attempt)
+
+    def stream_opened(self, status_code: int, body: str, permit: rate_limiter.Permit,
+                      attempt: int) -> bool:
+        """Check the status a stream opened with. False means retry; body is for errors only.
+
+        Raises:
+            LLMAPIError: On a client error other than 429.
+        """
+        if status_code < 400:
+            self.breaker.record_success()
+            return True
+        if status_code == 429:
+            permit.pause(_backoff(attempt))
+        elif status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            raise LLMAPIError(f"Gemini API call failed: {status_code}: {body}")
+        self.last_error = f"{status_code}: {body}"
+        return False
+
+    def stream_failed(self, error: Exception) -> None:
+        """Record a transport error while opening a stream."""
+        self.last_error = str(error)
+        self.breaker.record_failure()
+
+    def stream_retry_wait(self, attempt: int) -> int:
+        """Seconds to sleep before trying to open the stream again (0 after the last try)."""
+        if attempt >= MAX_RETRIES - 1:
+            return 0
+        logger.warning(
+            "Gemini stream error (attempt %d/%d): %s, retrying in %ds...",
+            attempt + 1, MAX_RETRIES, self.last_error, _backoff(attempt),
+        )
+        return _backoff(attempt)
+
+    def stream_texts(self, line: str) -> list[str]:
+        """Text parts of one server-sent event line ("data: {GenerateContentResponse}")."""
+        if not line or not line.startswith("data:"):
+            return []
+        data = json.loads(line[5:])
+        self.usage = rate_limiter.usage_tokens(data) or self.usage
+        texts = [
+            part["text"]
+            for candidate in data.get("candidates", [])[:1]
+            for part in candidate.get("content", {}).get("parts", [])
+            if part.get("text")
+        ]
+        self.chunks.extend(texts)
+        return texts
+
+    def exhausted(self) -> LLMAPIError:
+        return LLMAPIError(f"Gemini API failed after {MAX_RETRIES} retries: {self.last_error}")
+
+
 def _call_gemini(
     model: str,
     system: str,
@@ -26,6 +194,29 @@ def _call_gemini(
     max_tokens: int = 1024,
     temperature: float = 0.0,
     timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
+) -> str:
+    """Make a Gemini API call, hedged when requested and GEMINI_HEDGE_REQUESTS is on."""
+    def request() -> str:
+        return _request_gemini(model, system, user_message, max_tokens, temperature, timeout,
+                               priority, cache_site)
+
+    if hedge and settings.gemini_hedge_requests:
+        return hedging.hedged_call(request, key=cache_site or model)
+    return request()
+
+
+def _request_gemini(
+    model: str,
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
 ) -> str:
     """Make a Gemini API call with retry on 429/5xx errors.
 
@@ -41,63 +232,209 @@ def _call_gemini(
         The generated text.
 
     Raises:
+        CircuitOpenError: If the model's circuit breaker is open (before or between retries).
         LLMAPIError: If the API key is missing or all retries fail.
     """
-    if not settings.gemini_api_key:
-        raise LLMAPIError("No GEMINI_API_KEY configured")
+    req = _GeminiRequest(model, "generateContent", system, user_message, max_tokens,
+                         temperature, cache_site)
+    if (cached := req.cached()) is not None:
+        return cached
 
-    url = f"{API_URL}/{model}:generateContent"
-    headers = {
-        "content-type": "application/json",
-        "x-goog-api-key": settings.gemini_api_key,
-    }
-    payload = {
-        "system_instruction": {"parts": [{"text": system}]},
-        "contents": [{"parts": [{"text": user_message}]}],
-        "generationConfig": {
-            "maxOutputTokens": max_tokens,
-            "temperature": temperature,
-        },
-    }
+    for attempt in range(MAX_RETRIES):
+        req.check_breaker()
+        try:
+            with req.limiter.slot(req.reserve, priority) as permit:
+                resp = http_client.post(req.url, headers=req.headers, json=req.payload,
+                                        timeout=timeout)
+                text = req.response_text(resp, permit, attempt)
+        except LLMAPIError:
+            raise
+        except Exception as e:
+            time.sleep(req.call_failed(e, attempt))
+            continue
+        if text is not None:
+            req.store(text)
+            return text
+        time.sleep(req.retry_wait(resp.status_code, attempt))
+
+    raise req.exhausted()
+
+
+def _stream_gemini(
+    model: str,
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+) -> Iterator[str]:
+    """Stream a Gemini response via streamGenerateContent, yielding text chunks.
+
+    Retries on 429/5xx and connection errors only until the stream opens —
+    once text has been yielded, a failure raises rather than restarting the
+    response mid-way.
+
+    Raises:
+        LLMAPIError: If the API key is missing, the stream cannot be opened,
+            or it breaks part-way through.
+    """
+    req = _GeminiRequest(model, "streamGenerateContent?alt=sse", system, user_message,
+                         max_tokens, temperature, cache_site)
+    if (cached := req.cached()) is not None:
+        yield cached
+        return
+
+    # The slot is held for the whole stream, including retries to open it
+    with req.limiter.slot(req.reserve, priority) as permit:
+        resp = None
+        for attempt in range(MAX_RETRIES):
+            req.check_breaker("stream")
+            try:
+                resp = http_client.post(req.url, headers=req.headers, json=req.payload,
+                                        timeout=timeout, stream=True)
+            except requests.exceptions.RequestException as e:
+                req.stream_failed(e)
+            else:
+                body = resp.text[:200] if resp.status_code >= 400 else ""
+                try:
+                    if req.stream_opened(resp.status_code, body, permit, attempt):
+                        break
+                finally:
+                    if resp.status_code >= 400:
+                        resp.close()
+                resp = None
+            time.sleep(req.stream_retry_wait(attempt))
+
+        if resp is None:
+            raise req.exhausted()
+
+        try:
+            for line in resp.iter_lines(decode_unicode=True):
+                yield from req.stream_texts(line)
+            # Only complete responses are recorded
+            req.store("".join(req.chunks))
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            raise LLMAPIError(f"Gemini stream interrupted: {e}") from e
+        finally:
+            permit.settle(req.usage)
+            resp.close()
+
+
+async def _call_gemini_async(
+    model: str,
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
+) -> str:
+    """Async twin of _call_gemini."""
+    def request() -> Awaitable[str]:
+        return _request_gemini_async(model, system, user_message, max_tokens, temperature,
+                                     timeout, priority, cache_site)
+
+    if hedge and settings.gemini_hedge_requests:
+        return await hedging.hedged_call_async(request, key=cache_site or model)
+    return await request()
+
+
+async def _request_gemini_async(
+    model: str,
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+) -> str:
+    """Async _request_gemini over httpx. LLM cache reads and writes run in a worker thread."""
+    req = _GeminiRequest(model, "generateContent", system, user_message, max_tokens,
+                         temperature, cache_site)
+    if req.cache_key and (cached := await asyncio.to_thread(req.cached)) is not None:
+        return cached
+    client = http_client.get_async_client()
 
-    last_error = None
     for attempt in range(MAX_RETRIES):
+        req.check_breaker()
         try:
-            resp = requests.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=timeout,
-            )
-            if resp.status_code == 429 or resp.status_code >= 500:
-                wait = RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
-                logger.warning(
-                    "Gemini API %d (attempt %d/%d), retrying in %ds...",
-                    resp.status_code, attempt + 1, MAX_RETRIES, wait,
-                )
-                time.sleep(wait)
-                last_error = f"{resp.status_code}: {resp.text[:200]}"
-                continue
-
-            resp.raise_for_status()
-            data = resp.json()
-            return data["candidates"][0]["content"]["parts"][0]["text"]
-        except requests.exceptions.HTTPError as e:
-            raise LLMAPIError(f"Gemini API call failed: {e}") from e
+            async with req.limiter.slot_async(req.reserve, priority) as permit:
+                resp = await client.post(req.url, headers=req.headers, json=req.payload,
+                                         timeout=timeout)
+                text = req.response_text(resp, permit, attempt)
         except LLMAPIError:
             raise
         except Exception as e:
-            last_error = str(e)
-            if attempt < MAX_RETRIES - 1:
-                wait = RETRY_BACKOFF[min(attempt, len(RETRY_BACKOFF) - 1)]
-                logger.warning(
-                    "Gemini API error (attempt %d/%d): %s, retrying in %ds...",
-                    attempt + 1, MAX_RETRIES, e, wait,
-                )
-                time.sleep(wait)
+            await asyncio.sleep(req.call_failed(e, attempt))
             continue
+        if text is not None:
+            if req.cache_key:
+                await asyncio.to_thread(req.store, text)
+            return text
+        await asyncio.sleep(req.retry_wait(resp.status_code, attempt))
 
-    raise LLMAPIError(f"Gemini API failed after {MAX_RETRIES} retries: {last_error}")
+    raise req.exhausted()
+
+
+async def _stream_gemini_async(
+    model: str,
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+) -> AsyncIterator[str]:
+    """Async _stream_gemini over httpx (same retry-until-open semantics)."""
+    req = _GeminiRequest(model, "streamGenerateContent?alt=sse", system, user_message,
+                         max_tokens, temperature, cache_site)
+    if req.cache_key and (cached := await asyncio.to_thread(req.cached)) is not None:
+        yield cached
+        return
+    client = http_client.get_async_client()
+
+    # The slot is held for the whole stream, including retries to open it
+    async with req.limiter.slot_async(req.reserve, priority) as permit:
+        resp = None
+        for attempt in range(MAX_RETRIES):
+            req.check_breaker("stream")
+            try:
+                request = client.build_request("POST", req.url, headers=req.headers,
+                                               json=req.payload, timeout=timeout)
+                resp = await client.send(request, stream=True)
+            except httpx.HTTPError as e:
+                req.stream_failed(e)
+            else:
+                body = ""
+                if resp.status_code >= 400:
+                    body = (await resp.aread())[:200].decode("utf-8", "replace")
+                    await resp.aclose()
+                if req.stream_opened(resp.status_code, body, permit, attempt):
+                    break
+                resp = None
+            await asyncio.sleep(req.stream_retry_wait(attempt))
+
+        if resp is None:
+            raise req.exhausted()
+
+        try:
+            async for line in resp.aiter_lines():
+                for text in req.stream_texts(line):
+                    yield text
+            # Only complete responses are recorded
+            if req.cache_key:
+                await asyncio.to_thread(req.store, "".join(req.chunks))
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            raise LLMAPIError(f"Gemini stream interrupted: {e}") from e
+        finally:
+            permit.settle(req.usage)
+            await resp.aclose()
 
 
 def call_fast(
@@ -106,9 +443,13 @@ def call_fast(
     max_tokens: int = 1024,
     temperature: float = 0.0,
     timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
 ) -> str:
     """Call Gemini Flash (fast/cheap, good for classification)."""
-    return _call_gemini(FLASH_MODEL, system, user_message, max_tokens, temperature, timeout)
+    return _call_gemini(FLASH_MODEL, system, user_message, max_tokens, temperature, timeout,
+                        priority, cache_site, hedge)
 
 
 def call_summarize(
@@ -117,9 +458,77 @@ def call_summarize(
     max_tokens: int = 4096,
     temperature: float = 0.3,
     timeout: int = 60,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
 ) -> str:
     """Call Gemini Flash (good for summarization)."""
-    return _call_gemini(PRO_MODEL, system, user_message, max_tokens, temperature, timeout)
+    return _call_gemini(PRO_MODEL, system, user_message, max_tokens, temperature, timeout,
+                        priority, cache_site, hedge)
+
+
+def stream_summarize(
+    system: str,
+    user_message: str,
+    max_tokens: int = 4096,
+    temperature: float = 0.3,
+    timeout: int = 60,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+) -> Iterator[str]:
+    """Stream a summarization response from Gemini Flash as text chunks."""
+    return _stream_gemini(PRO_MODEL, system, user_message, max_tokens, temperature, timeout,
+                          priority, cache_site)
+
+
+async def call_fast_async(
+    system: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    timeout: int = 30,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
+) -> str:
+    """Async call_fast."""
+    return await _call_gemini_async(
+        FLASH_MODEL, system, user_message, max_tokens, temperature, timeout, priority,
+        cache_site, hedge,
+    )
+
+
+async def call_summarize_async(
+    system: str,
+    user_message: str,
+    max_tokens: int = 4096,
+    temperature: float = 0.3,
+    timeout: int = 60,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+    hedge: bool = False,
+) -> str:
+    """Async call_summarize."""
+    return await _call_gemini_async(
+        PRO_MODEL, system, user_message, max_tokens, temperature, timeout, priority,
+        cache_site, hedge,
+    )
+
+
+def stream_summarize_async(
+    system: str,
+    user_message: str,
+    max_tokens: int = 4096,
+    temperature: float = 0.3,
+    timeout: int = 60,
+    priority: Priority = Priority.PREPARATION,
+    cache_site: str | None = None,
+) -> AsyncIterator[str]:
+    """Async stream_summarize."""
+    return _stream_gemini_async(
+        PRO_MODEL, system, user_message, max_tokens, temperature, timeout, priority,
+        cache_site,
+    )
 
 
 # Backward-compat aliases
@@ -0,0 +1,136 @@
+"""Local stand-in for a google.cloud.storage bucket, backed by a directory.
+
+Implements the subset of the Bucket/Blob API that gcs_storage and
+db_replication use (upload/download from files and bytes, exists, delete,
+size, crc32c/md5_hash, compose, get_blob, list_blobs), so episode uploads and
+DB sync can be exercised and measured without a live bucket. Blob names map
+to paths under the root directory; writes go to a temp file first and are
+renamed into place, so a reader never sees a partial object (like GCS).
+
+Usage:
+    bucket = LocalBucket(tmp_path / "bucket")
+    db_replication.push(db_path, bucket, "hootline")
+"""
+
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+
+class LocalBlob:
+    """One object in a LocalBucket."""
+
+    def __init__(self, bucket: "LocalBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+        self.size: int | None = None
+        self.content_type: str | None = None
+        if self.path.exists():
+            self.size = self.path.stat().st_size
+
+    @property
+    def path(self) -> Path:
+        return self.bucket.root / self.name
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    @property
+    def crc32c(self) -> str | None:
+        """Base64 CRC32C of the contents, as GCS reports it."""
+        if not self.exists():
+            return None
+        import google_crc32c
+        crc = google_crc32c.Checksum(self.path.read_bytes())
+        return base64.b64encode(crc.digest()).decode()
+
+    @property
+    def md5_hash(self) -> str | None:
+        """Base64 MD5 of the contents, as GCS reports it."""
+        if not self.exists():
+            return None
+        return base64.b64encode(hashlib.md5(self.path.read_bytes()).digest()).decode()
+
+    def reload(self) -> None:
+        """Refresh size (raises FileNotFoundError if the object is gone)."""
+        self.size = self.path.stat().st_size
+
+    def _write(self, write) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.size = self.path.stat().st_size
+        self.bucket.bytes_uploaded += self.size
+
+    def upload_from_filename(self, filename: str, content_type: str | None = None) -> None:
+        with open(filename, "rb") as src:
+            self._write(lambda f: shutil.copyfileobj(src, f))
+
+    def upload_from_file(self, file_obj, size: int | None = None,
+                         content_type: str | None = None) -> None:
+        """Upload size bytes (or the rest) from file_obj's current position."""
+        data = file_obj.read() if size is None else file_obj.read(size)
+        self._write(lambda f: f.write(data))
+
+    def upload_from_string(self, data: bytes | str, content_type: str | None = None) -> None:
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        self._write(lambda f: f.write(payload))
+
+    def download_to_filename(self, filename: str) -> None:
+        shutil.copyfile(self.path, filename)
+        self.bucket.bytes_downloaded += self.path.stat().st_size
+
+    def download_as_bytes(self) -> bytes:
+        data = self.path.read_bytes()
+        self.bucket.bytes_downloaded += len(data)
+        return data
+
+    def compose(self, sources: list["LocalBlob"]) -> None:
+        """Concatenate sources into this object. Counts no transfer, like GCS."""
+        uploaded = self.bucket.bytes_uploaded
+
+        def concat(f):
+            for source in sources:
+                with open(source.path, "rb") as src:
+                    shutil.copyfileobj(src, f)
+
+        self._write(concat)
+        self.bucket.bytes_uploaded = uploaded
+
+    def delete(self) -> None:
+        self.path.unlink()
+
+
+class LocalBucket:
+    """A directory that behaves like a bucket. Counts bytes moved for benchmarks."""
+
+    def __init__(self, root: Path, name: str = "local"):
+        self.root = Path(root)
+        self.name = name
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.bytes_uploaded = 0
+        self.bytes_downloaded = 0
+
+    def blob(self, name: str) -> LocalBlob:
+        return LocalBlob(self, name)
+
+    def get_blob(self, name: str) -> LocalBlob | None:
+        """The object, or None if it doesn't exist."""
+        blob = LocalBlob(self, name)
+        return blob if blob.exists() else None
+
+    def list_blobs(self, prefix: str = "") -> Iterator[LocalBlob]:
+        for path in sorted(self.root.rglob("*")):
+            name = path.relative_to(self.root).as_posix()
+            if path.is_file() and not path.name.startswith(".upload-") and name.startswith(prefix):
+                yield LocalBlob(self, name)
@@ -0,0 +1,281 @@
+"""Process-wide client-side rate limiting for Gemini calls.
+
+Every Gemini request (llm_client, audio_transcriber, episode_analyzer) takes a
+slot from its model's limiter before it is sent. Each limiter enforces a
+requests-per-minute bucket, a tokens-per-minute bucket and a cap on in-flight
+requests, and hands out slots in priority order — digest preparation first,
+then transcription/episode analysis, then the weekly trend job. Callers queue
+instead of all firing at once and retrying into a storm of 429s; a 429 that
+still gets through pauses the whole model for the backoff period.
+
+Token cost is reserved up front (prompt estimate + max output tokens) and
+settled against the response's usageMetadata when it is available.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+
+from config import settings
+
+# Rough prompt-size estimate — Gemini tokenizes ~4 characters per token for English
+CHARS_PER_TOKEN = 4
+
+# Upper bound on how long an async waiter sleeps before re-checking its turn
+ASYNC_POLL_INTERVAL = 0.25
+
+
+class Priority(IntEnum):
+    """Scheduling class for a Gemini call — lower values are served first."""
+
+    PREPARATION = 0
+    TRANSCRIPTION = 1
+    WEEKLY_TRENDS = 2
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Estimate the prompt token count of the given texts."""
+    return sum(len(t) for t in texts) // CHARS_PER_TOKEN + 1
+
+
+class TokenBucket:
+    """A refilling bucket: capacity per minute, refilled continuously.
+
+    Not thread-safe on its own — ModelLimiter serializes access.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount is available (0 if it is available now)."""
+        self._refill(now)
+        # A request larger than the bucket waits for a full bucket rather than forever
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class Permit:
+    """A granted slot; settle() corrects the token reservation after the call."""
+
+    def __init__(self, limiter: "ModelLimiter", reserved: int):
+        self._limiter = limiter
+        self.reserved = reserved
+
+    def settle(self, actual_tokens: int | None) -> None:
+        """Refund (or charge) the difference between reserved and actual tokens."""
+        if actual_tokens is None:
+            return
+        self._limiter._adjust_tokens(self.reserved - actual_tokens)
+        self.reserved = actual_tokens
+
+    def pause(self, seconds: float) -> None:
+        """Report a server-side 429: hold every queued call for this model."""
+        self._limiter.pause(seconds)
+
+
+class ModelLimiter:
+    """RPM/TPM buckets, an in-flight cap and a priority queue for one model."""
+
+    def __init__(self, model: str, rpm: int, tpm: int, max_concurrency: int):
+        self.model = model
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._max_concurrency = max(1, max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int]] = []  # heap of (priority, ticket)
+        self._tickets = itertools.count()
+        self._cond = threading.Condition()
+        # Metrics
+        self._granted = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._throttled = 0
+
+    # --- Scheduling ---
+
+    def _enqueue(self, priority: Priority) -> tuple[int, int]:
+        entry = (int(priority), next(self._tickets))
+        heapq.heappush(self._waiters, entry)
+        return entry
+
+    def _try_grant(self, entry: tuple[int, int], tokens: int) -> float:
+        """Grant the slot if entry is next in line and capacity allows.
+
+        Returns 0 when granted, otherwise a suggested wait in seconds.
+        Must be called with the condition held.
+        """
+        if self._waiters[0] != entry or self._in_flight >= self._max_concurrency:
+            return ASYNC_POLL_INTERVAL
+        now = time.monotonic()
+        wait = max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(tokens, now),
+        )
+        if wait > 0:
+            return wait
+        heapq.heappop(self._waiters)
+        self._requests.take(1)
+        self._tokens.take(tokens)
+        self._in_flight += 1
+        self._cond.notify_all()
+        return 0.0
+
+    def _record_grant(self, waited: float) -> None:
+        self._granted += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        if waited > 0.01:
+            self._throttled += 1
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _abandon(self, entry: tuple[int, int]) -> None:
+        with self._cond:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            self._cond.notify_all()
+
+    def _adjust_tokens(self, delta: float) -> None:
+        with self._cond:
+            if delta >= 0:
+                self._tokens.give_back(delta)
+            else:
+                self._tokens.take(-delta)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @contextmanager
+    def slot(self, tokens: int, priority: Priority = Priority.PREPARATION) -> Iterator[Permit]:
+        """Block until this call may be sent; the slot is released on exit."""
+        start = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(priority)
+            try:
+                while (wait := self._try_grant(entry, tokens)) > 0:
+                    self._cond.wait(timeout=wait)
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            self._record_grant(time.monotonic() - start)
+        try:
+            yield Permit(self, tokens)
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def slot_async(self, tokens: int,
+                         priority: Priority = Priority.PREPARATION) -> AsyncIterator[Permit]:
+        """Async slot(): waits with asyncio.sleep so the event loop keeps running."""
+        start = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(entry, tokens)
+                    if wait == 0:
+                        self._record_grant(time.monotonic() - start)
+                        break
+                await asyncio.sleep(min(wait, ASYNC_POLL_INTERVAL))
+        except BaseException:
+            self._abandon(entry)
+            raise
+        try:
+            yield Permit(self, tokens)
+        finally:
+            self._release()
+
+    # --- Metrics ---
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            self._requests._refill(now)
+            self._tokens._refill(now)
+            by_priority = {p.name.lower(): 0 for p in Priority}
+            for priority, _ in self._waiters:
+                by_priority[Priority(priority).name.lower()] += 1
+            return {
+                "queue_depth": len(self._waiters),
+                "queue_by_priority": by_priority,
+                "in_flight": self._in_flight,
+                "requests_available": int(self._requests.level),
+                "tokens_available": int(self._tokens.level),
+                "paused_seconds": round(max(0.0, self._paused_until - now), 1),
+                "granted": self._granted,
+                "throttled": self._throttled,
+                "avg_wait_seconds": round(self._wait_total / self._granted, 3)
+                if self._granted else 0.0,
+                "max_wait_seconds": round(self._wait_max, 3),
+            }
+
+
+_limiters: dict[str, ModelLimiter] = {}
+_lock = threading.Lock()
+
+
+def get_limiter(model: str) -> ModelLimiter:
+    """Return the process-wide limiter for a model, creating it on first use."""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.get(model)
+            if limiter is None:
+                limiter = ModelLimiter(
+                    model,
+                    rpm=settings.gemini_requests_per_minute,
+                    tpm=settings.gemini_tokens_per_minute,
+                    max_concurrency=settings.gemini_max_concurrency,
+                )
+                _limiters[model] = limiter
+    return limiter
+
+
+def usage_tokens(data: dict) -> int | None:
+    """Total tokens billed for a Gemini response, from its usageMetadata."""
+    return (data.get("usageMetadata") or {}).get("totalTokenCount")
+
+
+def stats() -> dict:
+    """Per-model limiter metrics for /health/detail."""
+    with _lock:
+        limiters = list(_limiters.values())
+    return {limiter.model: limiter.stats() for limiter in limiters}
+
+
+def reset() -> None:
+    """Drop all limiters (they are recreated from current settings on next use)."""
+    with _lock:
+        _limiters.clear()
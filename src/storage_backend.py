@@ -0,0 +1,249 @@
+"""Object storage behind one interface: GCS in production, a local directory otherwise.
+
+Episode hosting and DB sync (gcs_storage) and the episode export go through
+get_backend() instead of google.cloud.storage directly, so the same code paths
+run, and can be benchmarked, against local disk. STORAGE_BACKEND selects the
+implementation:
+
+    gcs    GCS_BUCKET_NAME with GCS_CREDENTIALS_JSON (service account)
+    local  a directory (STORAGE_LOCAL_DIR); objects are served by the app
+           under /storage/
+
+Both implementations drive a Bucket/Blob-style object
+(google.cloud.storage.Bucket or LocalBucket), exposed as backend.bucket for
+db_replication, which works on that API directly.
+
+Usage:
+    backend = storage_backend.get_backend()
+    backend.put("episodes/hootline/noctua-2026-02-16.mp3", mp3_path, "audio/mpeg")
+    url = backend.signed_url("db/hootline/noctua.db", expires_seconds=600)
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import quote
+
+from config import settings
+from src.local_bucket import LocalBucket
+
+logger = logging.getLogger(__name__)
+
+# Served by routers/episodes.py for the local backend
+LOCAL_URL_PREFIX = "/storage"
+
+_backend: "StorageBackend | None" = None
+_lock = threading.Lock()
+
+
+@dataclass
+class ObjectInfo:
+    """Metadata of one stored object. Checksums are base64, as GCS reports them."""
+    key: str
+    size: int
+    crc32c: str | None = None
+    md5_hash: str | None = None
+
+
+def _info(blob) -> ObjectInfo:
+    return ObjectInfo(key=blob.name, size=blob.size or 0, crc32c=blob.crc32c,
+                      md5_hash=blob.md5_hash)
+
+
+class StorageBackend(ABC):
+    """Object operations shared by all backends, over a Bucket/Blob-style API.
+
+    Subclasses provide the bucket and how objects are addressed by URL.
+    """
+
+    name = ""
+    # Exceptions the bucket raises for a missing object
+    missing: tuple[type[Exception], ...] = (FileNotFoundError,)
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+
+    def put(self, key: str, local_path: Path, content_type: str | None = None,
+            offset: int = 0, length: int | None = None) -> ObjectInfo:
+        """Upload a file, or length bytes of it starting at offset."""
+        blob = self.bucket.blob(key)
+        if offset or length is not None:
+            with open(local_path, "rb") as f:
+                f.seek(offset)
+                blob.upload_from_file(f, size=length, content_type=content_type)
+        else:
+            blob.upload_from_filename(str(local_path), content_type=content_type)
+        return _info(blob)
+
+    def put_bytes(self, key: str, data: bytes, content_type: str | None = None) -> ObjectInfo:
+        blob = self.bucket.blob(key)
+        blob.upload_from_string(data, content_type=content_type)
+        return _info(blob)
+
+    def get(self, key: str, local_path: Path) -> None:
+        """Download an object to local_path, replacing it only once complete.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=local_path.parent, prefix=".download-")
+        os.close(fd)
+        try:
+            self.bucket.blob(key).download_to_filename(tmp)
+            os.replace(tmp, local_path)
+        except self.missing as e:
+            raise FileNotFoundError(key) from e
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    def get_bytes(self, key: str) -> bytes:
+        """Raises FileNotFoundError if the object does not exist."""
+        try:
+            return self.bucket.blob(key).download_as_bytes()
+        except self.missing as e:
+            raise FileNotFoundError(key) from e
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        """Metadata for key, or None if it does not exist."""
+        blob = self.bucket.get_blob(key)
+        return _info(blob) if blob is not None else None
+
+    def list_objects(self, prefix: str = "") -> list[ObjectInfo]:
+        return [_info(blob) for blob in self.bucket.list_blobs(prefix=prefix)]
+
+    def delete(self, key: str) -> bool:
+        """Delete key. Returns False if it did not exist."""
+        try:
+            self.bucket.blob(key).delete()
+            return True
+        except self.missing:
+            return False
+
+    def compose(self, key: str, sources: list[str],
+                content_type: str | None = None) -> ObjectInfo:
+        """Concatenate existing objects, in order, into key (server-side for GCS)."""
+        blob = self.bucket.blob(key)
+        blob.content_type = content_type
+        blob.compose([self.bucket.blob(source) for source in sources])
+        return _info(blob)
+
+    @abstractmethod
+    def public_url(self, key: str) -> str:
+        """The URL of a public object."""
+
+    @abstractmethod
+    def signed_url(self, key: str, expires_seconds: int = 3600) -> str:
+        """A time-limited GET URL for a private object."""
+
+
+class GCSBackend(StorageBackend):
+    """A Google Cloud Storage bucket."""
+
+    name = "gcs"
+
+    def __init__(self, bucket):
+        super().__init__(bucket)
+        from google.api_core.exceptions import NotFound
+        self.missing = (NotFound, FileNotFoundError)
+
+    def public_url(self, key: str) -> str:
+        return f"https://storage.googleapis.com/{self.bucket.name}/{key}"
+
+    def signed_url(self, key: str, expires_seconds: int = 3600) -> str:
+        return self.bucket.blob(key).generate_signed_url(
+            version="v4", expiration=timedelta(seconds=expires_seconds), method="GET",
+        )
+
+
+class LocalBackend(StorageBackend):
+    """A directory, served by the app under LOCAL_URL_PREFIX.
+
+    Signed URLs carry an expiry and an HMAC-SHA256 signature over key and
+    expiry, checked by verify().
+    """
+
+    name = "local"
+
+    def __init__(self, root: Path, base_url: str = "", signing_key: str = ""):
+        super().__init__(LocalBucket(root))
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+        # Without a configured key, signed URLs only survive until restart
+        self._signing_key = (signing_key or secrets.token_hex(32)).encode()
+
+    def path(self, key: str) -> Path | None:
+        """Filesystem path of key, or None if key would escape the root."""
+        if not key or key.startswith("/") or ".." in key.split("/"):
+            return None
+        return self.root / key
+
+    def public_url(self, key: str) -> str:
+        return f"{self.base_url}{LOCAL_URL_PREFIX}/{quote(key)}"
+
+    def _signature(self, key: str, expires: int) -> str:
+        return hmac.new(self._signing_key, f"{key}\n{expires}".encode(),
+                        hashlib.sha256).hexdigest()
+
+    def signed_url(self, key: str, expires_seconds: int = 3600) -> str:
+        expires = int(time.time()) + expires_seconds
+        return (f"{self.public_url(key)}?expires={expires}"
+                f"&signature={self._signature(key, expires)}")
+
+    def verify(self, key: str, expires: int, signature: str) -> bool:
+        """True if signature was issued for key and has not expired."""
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(self._signature(key, expires), signature)
+
+
+def is_configured() -> bool:
+    """Check if the configured storage backend can be used."""
+    if settings.storage_backend == "local":
+        return True
+    return bool(settings.gcs_bucket_name and settings.gcs_credentials_json)
+
+
+def _create_backend() -> StorageBackend:
+    if settings.storage_backend == "local":
+        return LocalBackend(Path(settings.storage_local_dir), settings.base_url,
+                            settings.storage_signing_key)
+    if settings.storage_backend != "gcs":
+        raise ValueError(f"Unknown STORAGE_BACKEND: {settings.storage_backend!r}")
+    if not is_configured():
+        raise RuntimeError("GCS storage is not configured (GCS_BUCKET_NAME, "
+                           "GCS_CREDENTIALS_JSON)")
+    from google.cloud import storage
+    from google.oauth2 import service_account
+
+    creds_info = json.loads(settings.gcs_credentials_json)
+    credentials = service_account.Credentials.from_service_account_info(creds_info)
+    # One client per process: it holds the cached access token and a pooled HTTP session
+    client = storage.Client(credentials=credentials, project=credentials.project_id)
+    return GCSBackend(client.bucket(settings.gcs_bucket_name))
+
+
+def get_backend() -> StorageBackend:
+    """Return the process-wide backend selected by STORAGE_BACKEND, creating it on first use.
+
+    Raises:
+        RuntimeError: If the GCS backend is selected but not configured.
+        ValueError: If STORAGE_BACKEND names an unknown backend.
+    """
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                _backend = _create_backend()
+                logger.info("Object storage backend: %s", _backend.name)
+    return _backend
@@ -1,9 +1,12 @@
 """Classify newsletter articles into podcast topic segments using Gemini."""
 
+import asyncio
 import json
 import logging
 import re
+import zlib
 from enum import StrEnum
+from pathlib import Path
 
 from src.models import Article
 
@@ -81,6 +84,26 @@ FILTERED_SENDERS: set[str] = {
 # Valid topic names for parsing Gemini response
 _VALID_TOPICS: dict[str, Topic] = {t.value.lower(): t for t in Topic}
 
+# Local topic model: predictions at or above this confidence skip Gemini entirely
+LOCAL_MODEL_CONFIDENCE = 0.85
+# When Gemini is unavailable, trust the local model down to this confidence
+# before dropping to the keyword table
+LOCAL_MODEL_FALLBACK_CONFIDENCE = 0.4
+
+# Learned sender routing: a sender whose history is at least this share one topic,
+# over at least this many Gemini-classified articles, is routed without an LLM call
+SENDER_ROUTE_CONFIDENCE = 0.95
+SENDER_ROUTE_MIN_SAMPLES = 10
+# One in this many routed articles still goes to Gemini, so the sender's stats keep
+# up when a newsletter changes focus
+SENDER_ROUTE_AUDIT_EVERY = 10
+# A sender's counts are scaled to this total as new labels arrive: a route built on
+# a long history is revoked after a few disagreeing audits
+SENDER_STATS_WINDOW = 50
+
+# Parsed model cache: db_path -> (model_id, TopicModel)
+_local_model_cache: dict[str, tuple[int, object]] = {}
+
 
 def _normalize(text: str) -> str:
     """Normalize text for matching: lowercase, strip, and replace curly quotes."""
@@ -215,21 +238,113 @@ def _parse_gemini_response(response_text: str, article_count: int) -> dict[int,
     return results
 
 
-def classify_articles_batch(articles: list[Article]) -> dict[int, Topic | None]:
-    """Classify articles by sending them to Gemini in a single batch.
+def _load_local_model(db_path: Path | None):
+    """Load the show's active local topic model, or None if none has been trained."""
+    if db_path is None:
+        return None
+    try:
+        from src import database
+        from src.topic_model import TopicModel
+
+        model_id = database.get_latest_topic_model_id(db_path=db_path)
+        if model_id is None:
+            return None
+        cached = _local_model_cache.get(str(db_path))
+        if cached and cached[0] == model_id:
+            return cached[1]
+        row = database.get_topic_model(model_id, db_path=db_path)
+        if not row:
+            return None
+        model = TopicModel.from_json(row["model"])
+        _local_model_cache[str(db_path)] = (model_id, model)
+        logger.info("Loaded local topic model %d (%d training samples)",
+                    model_id, model.sample_count)
+        return model
+    except Exception as e:
+        logger.warning("Failed to load local topic model: %s", e)
+        return None
 
-    Filters transactional senders first, then sends all remaining articles
-    to Gemini Flash for classification. Falls back to keyword-based
-    classification if the API call fails.
 
-    Args:
-        articles: Articles to classify (must have source, title, content set).
+def _load_sender_routes(db_path: Path | None) -> dict[str, str]:
+    """Build {normalized_sender: label} for senders stable enough to skip Gemini."""
+    if db_path is None:
+        return {}
+    try:
+        from src import database
 
-    Returns:
-        Mapping of article list index to Topic (or None if filtered/skipped).
+        stats = database.get_sender_topic_stats(db_path=db_path)
+    except Exception as e:
+        logger.warning("Failed to load sender topic stats: %s", e)
+        return {}
+
+    routes: dict[str, str] = {}
+    for sender, counts in stats.items():
+        total = sum(counts.values())
+        if total < SENDER_ROUTE_MIN_SAMPLES:
+            continue
+        label, count = max(counts.items(), key=lambda kv: kv[1])
+        if count / total >= SENDER_ROUTE_CONFIDENCE:
+            routes[sender] = label
+    return routes
+
+
+def _is_route_audit(article: Article) -> bool:
+    """Pick a stable sample of routed articles to send to Gemini anyway."""
+    key = f"{_normalize(article.source)}\n{article.title}"
+    return zlib.crc32(key.encode("utf-8")) % SENDER_ROUTE_AUDIT_EVERY == 0
+
+
+def _label_to_topic(label: str) -> Topic | None:
+    """Map a local-model label back to a Topic (None for SKIP)."""
+    from src.topic_model import SKIP_LABEL
+
+    if label == SKIP_LABEL:
+        return None
+    return _VALID_TOPICS.get(label.lower(), Topic.OTHER)
+
+
+def _record_labels(articles: list[tuple[int, Article]], labels: dict[int, Topic | None],
+                   db_path: Path | None) -> None:
+    """Store Gemini's decisions as training data for the local topic model."""
+    if db_path is None:
+        return
+    try:
+        from src import database
+        from src.topic_model import SKIP_LABEL, SNIPPET_WORDS
+
+        rows = []
+        for idx, article in articles:
+            if idx not in labels:
+                continue
+            topic = labels[idx]
+            rows.append({
+                "source": article.source,
+                "title": article.title,
+                "snippet": " ".join(article.content.split()[:SNIPPET_WORDS]),
+                "topic": topic.value if topic is not None else SKIP_LABEL,
+                "origin": "gemini",
+            })
+        database.save_article_labels(rows, db_path=db_path)
+        # Only Gemini decisions feed the sender table — counting routed articles
+        # would let a sender's route reinforce itself
+        database.record_sender_topics(
+            [(_normalize(row["source"]), row["topic"]) for row in rows],
+            max_total=SENDER_STATS_WINDOW, db_path=db_path,
+        )
+    except Exception as e:
+        logger.warning("Failed to record classification labels: %s", e)
+
+
+def _prepare_batch(
+    articles: list[Article], db_path: Path | None,
+) -> tuple[dict[int, Topic | None], list[tuple[int, Article]], dict[int, tuple[str, float]]]:
+    """Resolve everything that needs no API call.
+
+    Returns (results so far, articles still needing Gemini, local model predictions).
     """
     results: dict[int, Topic | None] = {}
     to_classify: list[tuple[int, Article]] = []
+    local_predictions: dict[int, tuple[str, float]] = {}
 
     # Pre-filter transactional senders
     for i, article in enumerate(articles):
@@ -239,40 +354,158 @@ def classify_articles_batch(articles: list[Article]) -> dict[int, Topic | None]:
             to_classify.append((i, article))
 
     if not to_classify:
+        return results, to_classify, local_predictions
+
+    # Learned sender routes: single-topic senders skip the model and Gemini, except
+    # for a sample of audits that keeps their stats current
+    audits: list[tuple[int, Article]] = []
+    sender_routes = _load_sender_routes(db_path)
+    if sender_routes:
+        unrouted: list[tuple[int, Article]] = []
+        for idx, article in to_classify:
+            label = sender_routes.get(_normalize(article.source))
+            if label is None:
+                unrouted.append((idx, article))
+                continue
+            # The route stands unless Gemini answers for the audited article
+            results[idx] = _label_to_topic(label)
+            if _is_route_audit(article):
+                audits.append((idx, article))
+        if len(unrouted) < len(to_classify):
+            logger.info("Sender routes assigned %d/%d articles (%d audited by Gemini)",
+                        len(to_classify) - len(unrouted), len(to_classify), len(audits))
+        to_classify = unrouted
+
+        if not to_classify:
+            return results, audits, local_predictions
+
+    # Local topic model (no API call for confident predictions)
+    local_model = _load_local_model(db_path)
+    if local_model is not None:
+        from src.topic_model import model_text
+
+        ambiguous: list[tuple[int, Article]] = []
+        for idx, article in to_classify:
+            label, confidence = local_model.predict(
+                model_text(article.source, article.title, article.content)
+            )
+            local_predictions[idx] = (label, confidence)
+            if confidence >= LOCAL_MODEL_CONFIDENCE:
+                results[idx] = _label_to_topic(label)
+            else:
+                ambiguous.append((idx, article))
+        logger.info("Local topic model assigned %d/%d articles, %d ambiguous sent to Gemini",
+                    len(to_classify) - len(ambiguous), len(to_classify), len(ambiguous))
+        to_classify = ambiguous
+
+    return results, to_classify + audits, local_predictions
+
+
+def _resolve_batch(
+    results: dict[int, Topic | None],
+    to_classify: list[tuple[int, Article]],
+    local_predictions: dict[int, tuple[str, float]],
+    response: str | None,
+    db_path: Path | None,
+) -> dict[int, Topic | None]:
+    """Merge Gemini's response (None if the call failed) into the results, with fallbacks."""
+    gemini_results = _parse_gemini_response(response, len(to_classify)) if response else {}
+
+    if gemini_results:
+        results.update(gemini_results)
+        # Check for any articles Gemini missed and default to Misc
+        for idx, _article in to_classify:
+            if idx not in results:
+                logger.warning("Gemini missed article %d ('%s'), defaulting to Misc",
+                               idx, _article.title[:60])
+                results[idx] = Topic.OTHER
+
+        classified_count = sum(1 for v in gemini_results.values() if v is not None)
+        skipped_count = sum(1 for v in gemini_results.values() if v is None)
+        logger.info("Gemini classified %d articles (%d skipped)", classified_count, skipped_count)
+        _record_labels(to_classify, gemini_results, db_path)
         return results
 
-    # Try Gemini classification
+    if response is not None:
+        logger.warning("Gemini returned empty results, falling back to keyword classification")
+
+    # Fallback: local model where it is reasonably sure, keywords otherwise.
+    # Audited routed articles already hold their route.
+    for idx, article in to_classify:
+        if idx in results:
+            continue
+        prediction = local_predictions.get(idx)
+        if prediction and prediction[1] >= LOCAL_MODEL_FALLBACK_CONFIDENCE:
+            results[idx] = _label_to_topic(prediction[0])
+        else:
+            results[idx] = _classify_by_keywords(article)
+
+    return results
+
+
+def classify_articles_batch(articles: list[Article],
+                            db_path: Path | None = None) -> dict[int, Topic | None]:
+    """Classify articles, using learned routes and the local model before Gemini.
+
+    Filters transactional senders first. When db_path is given, articles from
+    senders whose classification history is stable on one topic are routed
+    directly, then articles the local topic model predicts with high
+    confidence are assigned; only the remaining mixed-topic articles go to
+    Gemini Flash in a single batch. Gemini's answers are recorded as training
+    data and sender statistics. If the API call fails, falls back to the local
+    model and then to keyword-based classification.
+
+    Args:
+        articles: Articles to classify (must have source, title, content set).
+        db_path: Show database holding sender stats, the local model and label
+            history. When None, only Gemini and the keyword fallback are used.
+
+    Returns:
+        Mapping of article list index to Topic (or None if filtered/skipped).
+    """
+    results, to_classify, local_predictions = _prepare_batch(articles, db_path)
+    if not to_classify:
+        return results
+
+    response = None
     try:
         from src.llm_client import call_fast
 
         system_prompt, user_message = _build_classification_prompt(to_classify)
-        response = call_fast(system_prompt, user_message, max_tokens=8192, timeout=60)
-        gemini_results = _parse_gemini_response(response, len(to_classify))
-
-        if gemini_results:
-            results.update(gemini_results)
-            # Check for any articles Gemini missed and default to Misc
-            for idx, _article in to_classify:
-                if idx not in results:
-                    logger.warning("Gemini missed article %d ('%s'), defaulting to Misc",
-                                   idx, _article.title[:60])
-                    results[idx] = Topic.OTHER
-
-            classified_count = sum(1 for v in gemini_results.values() if v is not None)
-            skipped_count = sum(1 for v in gemini_results.values() if v is None)
-            logger.info("Gemini classified %d articles (%d skipped)", classified_count, skipped_count)
-            return results
+        response = call_fast(system_prompt, user_message, max_tokens=8192, timeout=60,
+                             cache_site="classify", hedge=True)
+    except Exception as e:
+        logger.warning("Gemini classification failed (%s), falling back to keywords", e)
 
-        logger.warning("Gemini returned empty results, falling back to keyword classification")
+    return _resolve_batch(results, to_classify, local_predictions, response, db_path)
+
+
+async def classify_articles_batch_async(articles: list[Article],
+                                        db_path: Path | None = None) -> dict[int, Topic | None]:
+    """Async classify_articles_batch: the Gemini call awaits instead of blocking a thread.
 
+    Local-model inference and the label/stats reads and writes run in a worker
+    thread, so the event loop keeps serving requests meanwhile.
+    """
+    results, to_classify, local_predictions = await asyncio.to_thread(
+        _prepare_batch, articles, db_path,
+    )
+    if not to_classify:
+        return results
+
+    response = None
+    try:
+        from src.llm_client import call_fast_async
+
+        system_prompt, user_message = _build_classification_prompt(to_classify)
+        response = await call_fast_async(system_prompt, user_message, max_tokens=8192,
+                                         timeout=60, cache_site="classify", hedge=True)
     except Exception as e:
         logger.warning("Gemini classification failed (%s), falling back to keywords", e)
 
-    # Fallback: keyword-based classification
-    for idx, article in to_classify:
-        results[idx] = _classify_by_keywords(article)
-
-    return results
+    return await asyncio.to_thread(
+        _resolve_batch, results, to_classify, local_predictions, response, db_path,
+    )
 
 
 # --- Keyword fallback (used when Gemini is unavailable) ---
@@ -0,0 +1,240 @@
+"""Local topic model — hashed TF-IDF features + multinomial logistic regression.
+
+Trained from each show's classification history (see scripts/train_topic_model.py)
+and used by topic_classifier as a fast first pass: confident predictions skip
+the Gemini call entirely, ambiguous articles still go to Gemini.
+
+Pure Python on purpose — a few thousand short documents train in seconds and
+the model serializes to a small JSON blob stored in the show's SQLite DB.
+"""
+
+import json
+import logging
+import math
+import random
+import re
+import zlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+# Hashed feature space (2^18 buckets keeps collisions rare for newsletter-sized vocab)
+N_FEATURES = 2 ** 18
+
+# Label used for articles Gemini marked as promotional / no news value
+SKIP_LABEL = "SKIP"
+
+# Words of article content fed to the model (matches the classification prompt snippet)
+SNIPPET_WORDS = 200
+
+# Weights smaller than this are dropped after training
+PRUNE_WEIGHT = 1e-3
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9'&+-]*")
+
+
+def model_text(source: str, title: str, content: str) -> str:
+    """Build the text the model sees for an article: source, title and a content snippet."""
+    snippet = " ".join(content.split()[:SNIPPET_WORDS])
+    return f"{source}\n{title}\n{snippet}"
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase unigrams, title bigrams, plus a whole-source token from the first line.
+
+    Bigrams come from the source and title only — content bigrams multiply the
+    feature count (and model size) without helping much on newsletter snippets.
+    """
+    first_line, _, rest = text.partition("\n")
+    title, _, _ = rest.partition("\n")
+    words = _TOKEN_PATTERN.findall(text.lower())
+    head = _TOKEN_PATTERN.findall(f"{first_line} {title}".lower())
+    tokens = list(words)
+    tokens.extend(f"{a} {b}" for a, b in zip(head, head[1:]))
+    if first_line.strip():
+        tokens.append(f"__source__:{first_line.strip().lower()}")
+    return tokens
+
+
+def _hash(token: str) -> int:
+    """Stable feature index (CRC32 — Python's hash() is salted per process)."""
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+def _term_counts(text: str) -> dict[int, int]:
+    counts: dict[int, int] = {}
+    for token in _tokenize(text):
+        h = _hash(token)
+        counts[h] = counts.get(h, 0) + 1
+    return counts
+
+
+@dataclass
+class TopicModel:
+    """A trained linear topic classifier over hashed TF-IDF features."""
+
+    labels: list[str]
+    idf: dict[int, float]
+    weights: list[dict[int, float]]  # one sparse weight vector per label
+    bias: list[float]
+    sample_count: int = 0
+    trained_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def vectorize(self, text: str) -> dict[int, float]:
+        """Sublinear TF-IDF vector, L2-normalized. Unseen features are dropped."""
+        vec: dict[int, float] = {}
+        for h, count in _term_counts(text).items():
+            idf = self.idf.get(h)
+            if idf is not None:
+                vec[h] = (1.0 + math.log(count)) * idf
+        norm = math.sqrt(sum(v * v for v in vec.values()))
+        if norm > 0:
+            for h in vec:
+                vec[h] /= norm
+        return vec
+
+    def _scores(self, vec: dict[int, float]) -> list[float]:
+        return [
+            b + sum(w.get(h, 0.0) * x for h, x in vec.items())
+            for w, b in zip(self.weights, self.bias)
+        ]
+
+    def predict_proba(self, text: str) -> dict[str, float]:
+        """Return {label: probability} for a single article text."""
+        probs = _softmax(self._scores(self.vectorize(text)))
+        return dict(zip(self.labels, probs))
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Return (best_label, confidence) for a single article text."""
+        proba = self.predict_proba(text)
+        label = max(proba, key=proba.get)
+        return label, proba[label]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "labels": self.labels,
+            "idf": {str(h): round(v, 4) for h, v in self.idf.items()},
+            "weights": [{str(h): round(v, 4) for h, v in w.items()} for w in self.weights],
+            "bias": [round(b, 5) for b in self.bias],
+            "sample_count": self.sample_count,
+            "trained_at": self.trained_at,
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "TopicModel":
+        data = json.loads(raw)
+        return cls(
+            labels=data["labels"],
+            idf={int(h): v for h, v in data["idf"].items()},
+            weights=[{int(h): v for h, v in w.items()} for w in data["weights"]],
+            bias=data["bias"],
+            sample_count=data.get("sample_count", 0),
+            trained_at=data.get("trained_at", ""),
+        )
+
+
+def _softmax(scores: list[float]) -> list[float]:
+    top = max(scores)
+    exps = [math.exp(s - top) for s in scores]
+    total = sum(exps)
+    return [e / total for e in exps]
+
+
+def train(
+    samples: list[tuple[str, str]],
+    epochs: int = 5,
+    learning_rate: float = 0.5,
+    l2: float = 1e-5,
+    min_df: int = 2,
+    seed: int = 0,
+) -> TopicModel:
+    """Train a model on (text, label) pairs with plain SGD on softmax cross-entropy.
+
+    Args:
+        samples: Training pairs; text should come from model_text().
+        epochs: Passes over the shuffled training set.
+        learning_rate: Initial SGD step size (decays linearly per epoch).
+        l2: L2 penalty, applied lazily to the touched weights.
+        min_df: Drop hashed features seen in fewer documents than this.
+        seed: RNG seed for reproducible shuffling.
+
+    Returns:
+        The trained TopicModel.
+    """
+    if not samples:
+        raise ValueError("Cannot train a topic model without samples")
+
+    labels = sorted({label for _, label in samples})
+    label_index = {label: i for i, label in enumerate(labels)}
+
+    # Document frequencies → smoothed IDF
+    doc_counts = [_term_counts(text) for text, _ in samples]
+    df: dict[int, int] = {}
+    for counts in doc_counts:
+        for h in counts:
+            df[h] = df.get(h, 0) + 1
+    n_docs = len(samples)
+    idf = {
+        h: math.log((1 + n_docs) / (1 + d)) + 1.0
+        for h, d in df.items() if d >= min_df
+    }
+
+    model = TopicModel(
+        labels=labels,
+        idf=idf,
+        weights=[{} for _ in labels],
+        bias=[0.0] * len(labels),
+        sample_count=n_docs,
+    )
+    vectors = [(model.vectorize(text), label_index[label]) for text, label in samples]
+
+    rng = random.Random(seed)
+    for epoch in range(epochs):
+        rng.shuffle(vectors)
+        lr = learning_rate * (1.0 - epoch / epochs)
+        for vec, target in vectors:
+            probs = _softmax(model._scores(vec))
+            for c, p in enumerate(probs):
+                grad = p - (1.0 if c == target else 0.0)
+                # Classes the model already rules out contribute almost nothing —
+                # skipping them is what keeps pure-Python SGD fast
+                if abs(grad) < 0.01:
+                    continue
+                w = model.weights[c]
+                for h, x in vec.items():
+                    w[h] = w.get(h, 0.0) * (1.0 - lr * l2) - lr * grad * x
+                model.bias[c] -= lr * grad
+
+    # Prune near-zero weights to keep the serialized model small. The idf stays
+    # whole: vectorize() normalizes over every known feature, so dropping idf
+    # entries would give the same text a different vector than it had in training.
+    model.weights = [{h: v for h, v in w.items() if abs(v) >= PRUNE_WEIGHT}
+                     for w in model.weights]
+    logger.info("Trained topic model: %d samples, %d labels, %d features",
+                n_docs, len(labels), len(idf))
+    return model
+
+
+def evaluate(model: TopicModel, samples: list[tuple[str, str]],
+             confidence: float = 0.0) -> dict:
+    """Score a model on held-out samples.
+
+    Returns dict with accuracy over all samples, plus coverage and accuracy for
+    predictions at or above the given confidence threshold.
+    """
+    correct = confident = confident_correct = 0
+    for text, label in samples:
+        predicted, conf = model.predict(text)
+        hit = predicted == label
+        correct += hit
+        if conf >= confidence:
+            confident += 1
+            confident_correct += hit
+    n = len(samples) or 1
+    return {
+        "samples": len(samples),
+        "accuracy": correct / n,
+        "coverage": confident / n,
+        "confident_accuracy": confident_correct / confident if confident else 0.0,
+    }
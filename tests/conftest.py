@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from config import settings
+
+
+@pytest.fixture(autouse=True)
+def _job_queue_in_tmp(tmp_path, monkeypatch):
+    """Keep the job queue out of output/ (the app lifespan reclaims and purges it)."""
+    monkeypatch.setattr(settings, "job_queue_path", str(tmp_path / "jobs.db"))
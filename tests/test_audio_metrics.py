@@ -0,0 +1,99 @@
+"""Tests for local audio metrics on synthetic speech-like signals."""
+
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from src import audio_metrics
+from src.episode_analyzer import _audio_metric_findings
+
+SR = audio_metrics.SAMPLE_RATE
+RNG = np.random.default_rng(0)
+
+
+def _voice(f0: float, seconds: float) -> np.ndarray:
+    """A harmonic 'voice' with intonation and a syllable-rate envelope."""
+    t = np.arange(int(SR * seconds)) / SR
+    phase = 2 * np.pi * np.cumsum(f0 * (1 + 0.05 * np.sin(2 * np.pi * 0.7 * t))) / SR
+    tone = sum(np.sin(k * phase) / k for k in range(1, 8))
+    return 0.2 * tone * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SR * seconds))
+
+
+def _with_noise(samples: np.ndarray) -> np.ndarray:
+    return samples + 0.001 * RNG.standard_normal(len(samples))
+
+
+def test_two_hosts_with_dead_air():
+    turns = []
+    for _ in range(10):
+        turns += [_voice(115, 4), _silence(0.2), _voice(215, 3), _silence(0.2)]
+    audio = _with_noise(np.concatenate(turns + [_silence(5), _voice(115, 4)]))
+
+    metrics = audio_metrics.analyze_pcm(audio)
+
+    assert metrics["runtime_seconds"] == 83.0
+    # Short pauses between turns are speech; the 5 s gap is the only long silence
+    assert [s["seconds"] for s in metrics["long_silences"]] == [5.2]
+    assert 0.9 < metrics["speech_ratio"] < 0.97
+    assert metrics["both_hosts_present"] is True
+    louder, quieter = metrics["host_seconds"]
+    assert abs(louder - 44) < 4 and abs(quieter - 30) < 4
+    assert metrics["host_pitch_hz"][0] < 130 < 200 < metrics["host_pitch_hz"][1]
+
+
+def test_one_voice_is_not_split_into_two_hosts():
+    audio = _with_noise(np.concatenate([_voice(150, 30), _silence(3), _voice(150, 10)]))
+
+    metrics = audio_metrics.analyze_pcm(audio)
+
+    assert metrics["both_hosts_present"] is False
+    assert metrics["host_balance"] == 0.0
+    assert [s["seconds"] for s in metrics["long_silences"]] == [3.0]
+
+
+def test_analyze_file_decodes_with_ffmpeg(tmp_path):
+    audio = _with_noise(np.concatenate([_voice(115, 3), _silence(2.5), _voice(215, 3)]))
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SR)
+        f.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+    metrics = audio_metrics.analyze_file(path)
+
+    assert metrics["runtime_seconds"] == 8.5
+    assert len(metrics["long_silences"]) == 1
+
+
+def test_stalled_decode_is_killed_at_the_deadline(tmp_path, monkeypatch):
+    stalled = tmp_path / "ffmpeg"
+    stalled.write_text("#!/bin/sh\nexec sleep 30\n")
+    stalled.chmod(0o755)
+    monkeypatch.setattr(audio_metrics, "_ffmpeg_path", lambda: str(stalled))
+    monkeypatch.setattr(audio_metrics, "DECODE_TIMEOUT", 0.5)
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="took longer"):
+        audio_metrics.analyze_file(tmp_path / "clip.mp3")
+    assert time.monotonic() - start < 10
+
+
+def test_metric_findings_flag_dead_air_and_missing_host():
+    findings = _audio_metric_findings({
+        "long_silences": [{"start": 60.0, "end": 75.0, "seconds": 15.0}],
+        "long_silence_seconds": 15.0,
+        "host_seconds": [1700.0, 0.0], "host_balance": 0.0, "host_pitch_hz": [120],
+        "both_hosts_present": False,
+    })
+    assert [(f["job"], f["severity"]) for f in findings] == [
+        ("audio_quality", "warning"), ("audio_quality", "warning"),
+    ]
+    assert _audio_metric_findings({"long_silence_seconds": 0, "host_balance": 0.9,
+                                   "both_hosts_present": True}) == []
@@ -0,0 +1,161 @@
+"""Tests for audio_transcriber's analysis rendition and analysis cache."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from src import audio_transcriber
+from src.audio_transcriber import (
+    _merge_window_results,
+    _plan_windows,
+    analysis_rendition_path,
+    prepare_analysis_audio,
+)
+from src.fake_gemini import FakeGeminiServer, FaultConfig
+
+METRICS = {"runtime_seconds": 1799.4, "speech_ratio": 0.9, "long_silences": [],
+           "long_silence_seconds": 0.0, "host_seconds": [900.0, 720.0], "host_balance": 0.8,
+           "host_pitch_hz": [118, 210], "both_hosts_present": True}
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    """Stand in for ffmpeg: write a small file at the output path."""
+    with open(cmd[-1], "wb") as f:
+        f.write(b"OggS" + b"\0" * 64)
+    return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+
+
+def test_rendition_is_transcoded_once_and_cached(tmp_path):
+    mp3 = tmp_path / "noctua-2026-02-16.mp3"
+    mp3.write_bytes(b"ID3" + b"\0" * 4096)
+
+    with (
+        patch("src.audio_transcriber._ffmpeg_path", return_value="ffmpeg"),
+        patch("src.audio_transcriber.subprocess.run", side_effect=_fake_ffmpeg) as mock_run,
+    ):
+        path, mime_type = prepare_analysis_audio(mp3)
+        assert path == tmp_path / "noctua-2026-02-16.analysis.ogg"
+        assert mime_type == "audio/ogg"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert "libopus" in cmd
+
+        # Cached until the episode MP3 changes
+        assert prepare_analysis_audio(mp3) == (path, mime_type)
+        assert mock_run.call_count == 1
+
+
+def test_rendition_falls_back_to_mp3_on_ffmpeg_failure(tmp_path):
+    mp3 = tmp_path / "episode.mp3"
+    mp3.write_bytes(b"ID3" + b"\0" * 1024)
+    failed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="no libopus")
+    with (
+        patch("src.audio_transcriber._ffmpeg_path", return_value="ffmpeg"),
+        patch("src.audio_transcriber.subprocess.run", return_value=failed),
+    ):
+        assert prepare_analysis_audio(mp3) == (mp3, "audio/mpeg")
+    assert not analysis_rendition_path(mp3).exists()
+
+
+def test_transcribe_episode_uploads_rendition_and_caches_result(tmp_path):
+    mp3 = tmp_path / "episode.mp3"
+    mp3.write_bytes(b"ID3" + b"\0" * 8192)
+    db_path = tmp_path / "test.db"
+    seen = []
+
+    def responder(model, payload):
+        seen.append(payload["contents"][0]["parts"][0]["file_data"]["mime_type"])
+        return json.dumps({"word_counts": {"News": 120}})
+
+    with (
+        FakeGeminiServer(responder=responder, faults=FaultConfig(processing_polls=0)) as server,
+        patch("config.settings.gemini_api_key", "fake-key"),
+        patch("config.settings.gemini_api_base", server.base_url),
+        patch("src.audio_transcriber._ffmpeg_path", return_value="ffmpeg"),
+        patch("src.audio_transcriber.subprocess.run", side_effect=_fake_ffmpeg),
+        patch("src.audio_metrics.analyze_file", return_value=METRICS),
+    ):
+        result = audio_transcriber.transcribe_episode(mp3, ["News"], db_path=db_path)
+        assert result["word_counts"] == {"News": 120}
+        # Runtime and host presence come from the local metrics, not Gemini
+        assert result["runtime_seconds"] == 1799
+        assert result["both_hosts_present"] is True
+        assert result["audio_metrics"] == METRICS
+        assert seen == ["audio/ogg"]
+
+        # Unchanged audio and prompt: no upload, no Gemini call
+        again = audio_transcriber.transcribe_episode(mp3, ["News"], db_path=db_path)
+        assert again == result
+        assert len(seen) == 1
+
+        # A different segment plan is a real change
+        audio_transcriber.transcribe_episode(mp3, ["News"], {"News": 5}, db_path=db_path)
+        assert len(seen) == 2
+
+    stats = server.stats()
+    assert stats["upload_finish"] == 2
+    assert stats["file_delete"] == 2
+
+
+def test_plan_windows_tiles_episode_with_overlap():
+    windows = _plan_windows(1810, window_seconds=600, overlap_seconds=30)
+    assert len(windows) == 3
+    # Core ranges tile the episode exactly; padding is clamped to the audio
+    assert windows[0].core_start == 0 and windows[-1].core_end == 1810
+    for prev, nxt in zip(windows, windows[1:]):
+        assert prev.core_end == nxt.core_start
+        assert prev.end == prev.core_end + 30
+        assert nxt.start == nxt.core_start - 30
+    assert windows[0].start == 0 and windows[-1].end == 1810
+
+
+def test_merge_window_results_dedupes_boundary_findings():
+    finding = {"topic": "News", "issue": "sorkin_violation", "severity": "warning",
+               "description": "stiff"}
+    results = [
+        {"word_counts": {"News": 700, "Sports": 0}, "tone_findings": [finding]},
+        {"word_counts": {"News": 100, "Sports": 300},
+         "tone_findings": [dict(finding, severity="critical")]},
+    ]
+    merged = _merge_window_results(results, ["News", "Sports"], {"News": 5, "Sports": 4})
+    assert merged["word_counts"] == {"News": 800, "Sports": 300}
+    assert merged["tone_findings"] == [dict(finding, severity="critical")]
+    # Gaps are recomputed against episode budgets: News 800/750 is fine, Sports 300/600 is not
+    assert merged["coverage_gaps"] == [{"topic": "Sports", "budget_words": 600,
+                                        "actual_words": 300, "gap_percent": 50,
+                                        "direction": "under"}]
+
+
+def test_windowed_transcription_analyzes_windows_in_parallel(tmp_path):
+    mp3 = tmp_path / "episode.mp3"
+    mp3.write_bytes(b"ID3" + b"\0" * 8192)
+    prompts = []
+
+    def responder(model, payload):
+        prompts.append(payload["contents"][0]["parts"][1]["text"])
+        return json.dumps({"word_counts": {"News": 100}, "tone_findings": []})
+
+    def cut(audio_path, window, out_dir, index):
+        out = out_dir / f"window-{index}.mp3"
+        out.write_bytes(b"ID3" + bytes([index]) * 512)
+        return out
+
+    with (
+        FakeGeminiServer(responder=responder, faults=FaultConfig(processing_polls=0)) as server,
+        patch("config.settings.gemini_api_key", "fake-key"),
+        patch("config.settings.gemini_api_base", server.base_url),
+        patch("src.audio_transcriber._audio_duration", return_value=1800.0),
+        patch("src.audio_metrics.analyze_file", return_value=METRICS),
+        patch("src.audio_transcriber._cut_window", side_effect=cut),
+    ):
+        result = audio_transcriber.transcribe_episode(
+            mp3, ["News"], {"News": 2}, db_path=tmp_path / "test.db",
+            rendition=False, windowed=True,
+        )
+
+    assert result["word_counts"] == {"News": 300}
+    assert result["runtime_seconds"] == 1799
+    assert len(prompts) == 3
+    assert all(p.startswith("This clip is an excerpt") for p in prompts)
+    assert server.stats()["file_delete"] == 3
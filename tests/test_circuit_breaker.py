@@ -0,0 +1,80 @@
+"""Tests for the shared Gemini circuit breaker and hedged requests."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src import circuit_breaker, hedging, llm_client
+from src.exceptions import CircuitOpenError
+from src.fake_gemini import FakeGeminiServer
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state():
+    circuit_breaker.reset()
+    hedging.reset()
+    yield
+    circuit_breaker.reset()
+    hedging.reset()
+
+
+@pytest.fixture
+def server():
+    fake = FakeGeminiServer(responder=lambda model, payload: "ok").start()
+    with (
+        patch("config.settings.gemini_api_key", "fake-key"),
+        patch("config.settings.gemini_api_base", fake.base_url),
+        patch("config.settings.gemini_breaker_failures", 2),
+        patch("src.llm_client.RETRY_BACKOFF", [0]),
+    ):
+        yield fake
+    fake.stop()
+
+
+def test_breaker_trips_and_fails_fast(server):
+    server.fail_next(503, count=10)
+    with pytest.raises(CircuitOpenError):
+        llm_client.call_fast("sys", "question")
+    # Two 503s tripped the breaker; the third attempt never reached the server
+    assert server.stats()["errors_503"] == 2
+    assert circuit_breaker.stats()[llm_client.FLASH_MODEL]["state"] == circuit_breaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        llm_client.call_fast("sys", "another question")
+    assert server.stats()["errors_503"] == 2
+
+
+def test_half_open_probe_closes_breaker():
+    breaker = circuit_breaker.CircuitBreaker("m", failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()  # the probe
+    assert breaker.state == circuit_breaker.HALF_OPEN
+    assert not breaker.allow()  # only one probe per reset period
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.stats() == {"state": "closed", "consecutive_failures": 0,
+                               "trips": 1, "rejected": 2}
+
+
+def test_backup_request_wins_when_primary_is_slow():
+    for _ in range(hedging.MIN_SAMPLES):
+        hedging.observe("classify", 0.01)
+    calls = []
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        time.sleep(2 if first else 0)
+        return "primary" if first else "backup"
+
+    with patch("src.hedging.MIN_HEDGE_DELAY", 0.05):
+        start = time.monotonic()
+        assert hedging.hedged_call(request, key="classify") == "backup"
+        assert time.monotonic() - start < 1
+    assert hedging.stats()["hedges_won"] == 1
@@ -1,5 +1,9 @@
 """Tests for database module."""
 
+import sqlite3
+
+import pytest
+
 from src import database
 
 
@@ -79,3 +83,31 @@ def test_list_runs(tmp_path):
     assert len(runs) == 2
     # Most recent first
     assert runs[0]["run_id"] == "run-b"
+
+
+def test_snapshot_does_not_block_an_open_writer(tmp_path):
+    db_path = tmp_path / "test.db"
+    database.save_digest("2026-02-16", "Committed", 1, 10, "A", db_path=db_path)
+
+    writer = sqlite3.connect(str(db_path), timeout=0)
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("UPDATE digests SET markdown_text = 'Uncommitted'")
+    try:
+        for vacuum in (False, True):
+            snap = tmp_path / f"snap-{vacuum}.db"
+            database.snapshot(snap, vacuum=vacuum, db_path=db_path)
+            # Committed rows still in the WAL are included; the open transaction is not
+            assert database.get_digest("2026-02-16", db_path=snap)["markdown_text"] == "Committed"
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+def test_sender_topic_burst_for_new_sender_is_capped(tmp_path):
+    db_path = tmp_path / "test.db"
+    observations = [("news@example.com", "Tech")] * 40 + [("news@example.com", "Science")] * 20
+    database.record_sender_topics(observations, max_total=50, db_path=db_path)
+
+    stats = database.get_sender_topic_stats(db_path=db_path)["news@example.com"]
+    assert sum(stats.values()) == pytest.approx(50)
+    assert stats["Tech"] == pytest.approx(2 * stats["Science"])
@@ -0,0 +1,75 @@
+"""Tests for incremental DB replication against a local bucket stand-in."""
+
+import sqlite3
+
+from src import database, db_replication
+from src.local_bucket import LocalBucket
+
+
+def _fill(db_path, days: int) -> None:
+    for day in range(days):
+        database.save_digest(f"2099-{1 + day // 28:02d}-{1 + day % 28:02d}", "x" * 4000,
+                             10, 700, "Topics", db_path=db_path)
+
+
+def _digests(db_path) -> list[tuple]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("SELECT date, markdown_text FROM digests ORDER BY date").fetchall()
+    finally:
+        conn.close()
+
+
+def test_push_sends_only_changed_pages_and_restore_replays(tmp_path):
+    db_path = tmp_path / "noctua.db"
+    bucket = LocalBucket(tmp_path / "bucket")
+    _fill(db_path, 200)
+
+    base = db_replication.push(db_path, bucket, "hootline")
+    assert base["mode"] == "base"
+    assert db_replication.push(db_path, bucket, "hootline")["mode"] == "unchanged"
+
+    # One small write ships a few pages, not the archive
+    database.save_digest("2099-12-31", "late edition", 1, 2, "Topics", db_path=db_path)
+    delta = db_replication.push(db_path, bucket, "hootline")
+    assert delta["mode"] == "delta" and delta["seq"] == 1
+    assert delta["pages"] < 10
+    assert delta["bytes"] < base["bytes"] / 20
+
+    restored = tmp_path / "restored" / "noctua.db"
+    assert db_replication.restore(restored, bucket, "hootline") is True
+    assert _digests(restored) == _digests(db_path)
+
+    # The restored copy continues the same replica instead of starting over
+    database.save_digest("2099-12-30", "from the new container", 1, 4, "Topics",
+                         db_path=restored)
+    assert db_replication.push(restored, bucket, "hootline")["mode"] == "delta"
+
+
+def test_deltas_are_compacted_into_a_new_base(tmp_path, monkeypatch):
+    db_path = tmp_path / "noctua.db"
+    bucket = LocalBucket(tmp_path / "bucket")
+    _fill(db_path, 50)
+    first = db_replication.push(db_path, bucket, "hootline")
+
+    monkeypatch.setattr(db_replication, "REPLICA_MAX_DELTAS", 2)
+    modes = []
+    for n in range(3):
+        database.save_digest(f"2098-01-{n + 1:02d}", "more", 1, 1, "Topics", db_path=db_path)
+        modes.append(db_replication.push(db_path, bucket, "hootline")["mode"])
+    assert modes == ["delta", "delta", "base"]
+
+    # The old generation is gone; only the new base and manifest remain
+    names = [b.name for b in bucket.list_blobs("db/hootline/replica/")]
+    assert len(names) == 2
+    assert not any(first["generation"] in n for n in names)
+
+    restored = tmp_path / "restored.db"
+    assert db_replication.restore(restored, bucket, "hootline") is True
+    assert _digests(restored) == _digests(db_path)
+
+
+def test_restore_without_replica_returns_false(tmp_path):
+    bucket = LocalBucket(tmp_path / "bucket")
+    assert db_replication.restore(tmp_path / "noctua.db", bucket, "hootline") is False
+    assert not (tmp_path / "noctua.db").exists()
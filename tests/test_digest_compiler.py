@@ -203,3 +203,231 @@ def test_compile_text_duration_labels():
 
     assert "~5 minutes" in text  # Tech
     assert "~4 minutes" in text  # World Politics
+
+
+# --- Parallel per-segment summarization ---
+
+
+async def test_parallel_summarization_contains_segment_failure():
+    from unittest.mock import patch
+
+    from src.digest_compiler import _summarize_segments_parallel
+    from src.exceptions import LLMAPIError
+
+    grouped = {
+        Topic.TECH_AI.value: [_make_article(title="AI Update", topic=Topic.TECH_AI.value)],
+        Topic.US_POLITICS.value: [
+            _make_article(title="Senate Vote", topic=Topic.US_POLITICS.value),
+        ],
+    }
+    budgets = {Topic.TECH_AI.value: 750, Topic.US_POLITICS.value: 450}
+    order = [Topic.TECH_AI.value, Topic.US_POLITICS.value]
+
+    def fake_summarize(system, user_message, **kwargs):
+        if "Senate Vote" in user_message:
+            raise LLMAPIError("timeout")
+        return "## SEGMENT 1: Latest in Tech\nAI prose."
+
+    final = (
+        '---RSS_SUMMARY---\nAI news tonight.\n'
+        '---QUALITY_REPORT---\n{"overall_score": 80, "issues": []}'
+    )
+    with (
+        patch("src.llm_client.call_summarize_async", side_effect=fake_summarize) as mock_summarize,
+        patch("src.llm_client.call_fast_async", return_value=final),
+    ):
+        segments, rss, report = await _summarize_segments_parallel(grouped, budgets, order)
+
+    assert segments == {Topic.TECH_AI.value: "AI prose."}
+    assert rss == "AI news tonight"
+    assert report["overall_score"] == 80
+    # Failed segment was retried, successful one called once
+    assert mock_summarize.call_count == 3
+
+
+async def test_parallel_summarization_all_failed_returns_none():
+    from unittest.mock import patch
+
+    from src.digest_compiler import _summarize_segments_parallel
+    from src.exceptions import LLMAPIError
+
+    grouped = {Topic.TECH_AI.value: [_make_article(topic=Topic.TECH_AI.value)]}
+    with patch("src.llm_client.call_summarize_async", side_effect=LLMAPIError("down")):
+        assert await _summarize_segments_parallel(
+            grouped, {Topic.TECH_AI.value: 750}, [Topic.TECH_AI.value],
+        ) is None
+
+
+# --- Segment memoization ---
+
+
+async def test_recompile_reuses_unchanged_segments(tmp_path):
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    from src.digest_compiler import _summarize_with_cache
+
+    show = SimpleNamespace(db_path=tmp_path / "test.db", output_dir=tmp_path)
+    budgets = {Topic.TECH_AI.value: 750, Topic.US_POLITICS.value: 450}
+    order = [Topic.TECH_AI.value, Topic.US_POLITICS.value]
+    grouped = {
+        Topic.TECH_AI.value: [_make_article(title="AI Update", topic=Topic.TECH_AI.value)],
+        Topic.US_POLITICS.value: [
+            _make_article(title="Senate Vote", topic=Topic.US_POLITICS.value),
+        ],
+    }
+    first = (
+        "## SEGMENT 1: Latest in Tech\nAI prose.\n\n## SEGMENT 2: US Politics\nSenate prose.\n"
+        '---RSS_SUMMARY---\nAI and the Senate\n'
+        '---QUALITY_REPORT---\n{"overall_score": 90, "issues": []}'
+    )
+    with patch("src.llm_client.call_summarize_async", return_value=first):
+        await _summarize_with_cache(grouped, budgets, order, show=show)
+
+    # Unchanged re-run: no LLM calls at all
+    with (
+        patch("src.llm_client.call_summarize_async") as mock_summarize,
+        patch("src.llm_client.call_fast_async") as mock_fast,
+    ):
+        segments, rss, report = await _summarize_with_cache(grouped, budgets, order, show=show)
+    assert not mock_summarize.called and not mock_fast.called
+    assert segments == {Topic.TECH_AI.value: "AI prose.", Topic.US_POLITICS.value: "Senate prose."}
+    assert rss == "AI and the Senate"
+    assert report["overall_score"] == 90
+
+    # New politics article: only that segment is regenerated, summary is recomputed
+    grouped[Topic.US_POLITICS.value].append(
+        _make_article(title="Budget Deal", topic=Topic.US_POLITICS.value)
+    )
+    final = (
+        '---RSS_SUMMARY---\nA budget deal\n'
+        '---QUALITY_REPORT---\n{"overall_score": 85, "issues": []}'
+    )
+    with (
+        patch("src.llm_client.call_summarize_async",
+              return_value="## SEGMENT 1: US Politics\nBudget prose.") as mock_summarize,
+        patch("src.llm_client.call_fast_async", return_value=final) as mock_fast,
+    ):
+        segments, rss, report = await _summarize_with_cache(grouped, budgets, order, show=show)
+    user_message = mock_summarize.call_args.kwargs["user_message"]
+    assert "Budget Deal" in user_message
+    assert "AI Update" not in user_message
+    # The changed segment is summarized alone; one final pass covers every segment
+    assert "---RSS_SUMMARY---" not in user_message
+    assert mock_fast.call_count == 1
+    assert "AI prose." in mock_fast.call_args.args[1]
+    assert segments[Topic.TECH_AI.value] == "AI prose."
+    assert segments[Topic.US_POLITICS.value] == "Budget prose."
+    assert rss == "A budget deal"
+    assert report["overall_score"] == 85
+
+
+# --- Streaming segment parsing ---
+
+
+def test_stream_parser_emits_segments_as_headers_close():
+    from src.digest_compiler import SegmentStreamParser
+
+    emitted = []
+    parser = SegmentStreamParser(lambda topic, text: emitted.append((topic, text)))
+    response = (
+        "## SEGMENT 1: Latest in Tech\nAI prose.\n\n---\n\n"
+        "## SEGMENT 2: US Politics\nSenate prose.\n---RSS_SUMMARY---\nSummary"
+    )
+    chunks = [response[i:i + 7] for i in range(0, len(response), 7)]
+    split = response.index("## SEGMENT 2") + 5
+    for i, chunk in enumerate(chunks):
+        parser.feed(chunk)
+        if (i + 1) * 7 <= split:
+            # Second header not seen yet — nothing can be complete
+            assert emitted == []
+    assert emitted[0] == (Topic.TECH_AI.value, "AI prose.\n\n---")
+    assert parser.close() == {
+        Topic.TECH_AI.value: "AI prose.\n\n---",
+        Topic.US_POLITICS.value: "Senate prose.",
+    }
+
+
+async def test_streaming_summarization_reports_segments_live():
+    from unittest.mock import patch
+
+    from src.digest_compiler import _summarize_all_segments
+
+    grouped = {
+        Topic.TECH_AI.value: [_make_article(title="AI Update", topic=Topic.TECH_AI.value)],
+        Topic.US_POLITICS.value: [
+            _make_article(title="Senate Vote", topic=Topic.US_POLITICS.value),
+        ],
+    }
+    order = [Topic.TECH_AI.value, Topic.US_POLITICS.value]
+    chunks = [
+        "## SEGMENT 1: Latest in Tech\nAI ", "prose.\n## SEGMENT 2: US Politics\n",
+        "Senate prose.\n---RSS_SUMMARY---\nTech and the Senate\n",
+        '---QUALITY_REPORT---\n{"overall_score": 70, "issues": []}',
+    ]
+    async def stream(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    live = []
+    with patch("src.llm_client.stream_summarize_async", side_effect=stream):
+        segments, rss, report = await _summarize_all_segments(
+            grouped, {}, order, on_segment=lambda t, text: live.append(t),
+        )
+    assert live == order
+    assert segments[Topic.US_POLITICS.value] == "Senate prose."
+    assert rss == "Tech and the Senate"
+    assert report["overall_score"] == 70
+
+
+# --- Async preparation path ---
+
+
+async def test_compile_async_runs_segments_concurrently(tmp_path):
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    from src.digest_compiler import compile_async
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_summarize(system, user_message, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "Segment prose."
+
+    async def fake_fast(system, user_message, **kwargs):
+        return '---RSS_SUMMARY---\nTonight\n---QUALITY_REPORT---\n{"overall_score": 75}'
+
+    async def no_weather():
+        return ""
+
+    show = SimpleNamespace(db_path=tmp_path / "test.db", output_dir=tmp_path,
+                           podcast_title="The Hootline", format=None)
+    live = []
+    with (
+        patch("src.digest_compiler.settings.digest_parallel_segments", True),
+        patch("src.llm_client.call_summarize_async", side_effect=fake_summarize),
+        patch("src.llm_client.call_fast_async", side_effect=fake_fast),
+        patch("src.digest_compiler._fetch_seattle_weather", side_effect=no_weather),
+    ):
+        result = await compile_async(_make_digest(), show=show,
+                                     on_segment=lambda t, text: live.append(t))
+
+    assert peak == 3
+    assert sorted(live) == sorted(result.segment_counts)
+    assert result.text.count("Segment prose.") == 3
+    assert result.rss_summary == "Tonight"
+    assert result.quality_report["overall_score"] == 75
+
+
+async def test_compile_async_empty_digest_raises():
+    from src.digest_compiler import compile_async
+
+    with pytest.raises(DigestCompileError):
+        await compile_async(_make_digest(articles=[]))
@@ -0,0 +1,115 @@
+"""Tests for the local Gemini stand-in, driven through the real clients."""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from src import audio_transcriber, llm_client
+from src.fake_gemini import FakeGeminiServer, FaultConfig
+
+
+@pytest.fixture
+def fake_gemini():
+    """Yield a factory that starts a fake server and points the app at it."""
+    servers = []
+
+    def start(**kwargs) -> FakeGeminiServer:
+        server = FakeGeminiServer(**kwargs).start()
+        servers.append(server)
+        return server
+
+    with (
+        patch("config.settings.gemini_api_key", "fake-key"),
+        patch("src.llm_client.RETRY_BACKOFF", [0]),
+    ):
+        yield start
+    for server in servers:
+        server.stop()
+
+
+def _use(server: FakeGeminiServer):
+    return patch("config.settings.gemini_api_base", server.base_url)
+
+
+def test_record_then_replay(fake_gemini, tmp_path):
+    recordings = tmp_path / "recordings.jsonl"
+    upstream = fake_gemini(responder=lambda model, payload: "Recorded answer")
+    recorder = fake_gemini(mode="record", recordings_path=recordings, upstream=upstream.base_url)
+    with _use(recorder):
+        assert llm_client.call_fast("sys", "question") == "Recorded answer"
+    assert recorder.stats()["recorded"] == 1
+    assert recordings.exists()
+
+    # Offline replay: no upstream, no responder
+    replay = fake_gemini(recordings_path=recordings)
+    with _use(replay):
+        assert llm_client.call_fast("sys", "question") == "Recorded answer"
+        with pytest.raises(llm_client.LLMAPIError):
+            llm_client.call_fast("sys", "never recorded")
+    assert replay.stats()["replayed"] == 1
+
+
+def test_record_mode_does_not_forward_file_requests(fake_gemini, tmp_path):
+    upstream = fake_gemini(responder=lambda model, payload: "Upstream answer")
+    recorder = fake_gemini(mode="record", recordings_path=tmp_path / "recordings.jsonl",
+                           upstream=upstream.base_url)
+    payload = {"contents": [{"parts": [
+        {"file_data": {"mime_type": "audio/mpeg", "file_uri": f"{recorder.base_url}/f"}},
+        {"text": "Transcribe this"},
+    ]}]}
+    with pytest.raises(LookupError):
+        recorder.generate("gemini-test", payload, {}, {})
+    assert upstream.stats().get("generate", 0) == 0
+    assert recorder.stats().get("recorded", 0) == 0
+
+
+def test_streaming_and_error_injection(fake_gemini):
+    server = fake_gemini(responder=lambda model, payload: "abcdefghij",
+                         faults=FaultConfig(stream_chunk_chars=4))
+    server.fail_next(429)
+    with _use(server):
+        chunks = list(llm_client.stream_summarize("sys", "summarize"))
+        assert chunks == ["abcd", "efgh", "ij"]
+        server.fail_next(503)
+        assert llm_client.call_summarize("sys", "summarize") == "abcdefghij"
+    stats = server.stats()
+    assert stats["errors_429"] == 1
+    assert stats["errors_503"] == 1
+
+
+def test_files_upload_poll_delete(fake_gemini, tmp_path):
+    server = fake_gemini(faults=FaultConfig(processing_polls=1))
+    mp3 = tmp_path / "episode.mp3"
+    mp3.write_bytes(b"ID3" + b"\0" * 1024)
+    with _use(server), patch("src.audio_transcriber.FILE_POLL_INTERVAL", 0):
+        file_name, file_uri = audio_transcriber.upload_to_gemini(mp3)
+        assert file_name.startswith("files/")
+        assert file_uri.startswith(server.base_url)
+        audio_transcriber.delete_from_gemini(file_name)
+    stats = server.stats()
+    assert stats["upload_finish"] == 1
+    assert stats["file_poll"] == 2  # one PROCESSING, then ACTIVE
+    assert stats["file_delete"] == 1
+
+
+def test_chunked_upload_resumes_from_server_offset(fake_gemini, tmp_path):
+    server = fake_gemini(faults=FaultConfig(processing_polls=0))
+    mp3 = tmp_path / "episode.mp3"
+    data = bytes(range(256)) * 40  # 10 KiB
+    mp3.write_bytes(data)
+    server.interrupt_next_upload()
+    with (
+        _use(server),
+        patch("src.audio_transcriber.UPLOAD_CHUNK_BYTES", 4096),
+        patch("src.audio_transcriber.RETRY_BACKOFF", [0]),
+    ):
+        file_name, _ = audio_transcriber.upload_to_gemini(mp3)
+    # The interrupted first chunk kept 2048 bytes; the upload resumed there
+    # instead of restarting, so the stored file matches the original bytes
+    assert file_name == f"files/{hashlib.sha256(data).hexdigest()[:16]}"
+    stats = server.stats()
+    assert stats["upload_interrupted"] == 1
+    assert stats["upload_query"] == 1
+    assert stats["upload_chunk"] == 3  # interrupted 0→4096, then 2048→6144, 6144→10240
+    assert stats["upload_finish"] == 1
@@ -1,15 +1,26 @@
 """Tests for feed_builder module."""
 
+import gzip
 import json
+import re
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import brotli
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
 from config import ShowConfig
+from routers.episodes import _serve_feed
 from src.feed_builder import (
     _build_feed_generator,
     _load_episode_catalog,
     _save_episode_catalog,
     add_episode,
+    build_feed,
+    get_feed_bytes,
 )
 from src.models import EpisodeMetadata
 
@@ -102,3 +113,92 @@ def test_add_episode_replaces_same_date(tmp_path):
 
         catalog = json.loads(show.episodes_json_path.read_text())
         assert len(catalog) == 1
+
+
+def _feed_client(show: ShowConfig) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/feed.xml")
+    async def feed(request: Request):
+        return _serve_feed(show, request)
+
+    return TestClient(app)
+
+
+def test_unchanged_catalog_rebuilds_to_the_same_cached_feed(tmp_path):
+    show = _make_show(tmp_path)
+    assert get_feed_bytes(show) is None
+    with patch("src.feed_builder.database.save_episode"):
+        add_episode(_make_metadata("2026-02-16", tmp_path=tmp_path), show=show)
+    first = get_feed_bytes(show)
+    mtime = show.feed_path.stat().st_mtime_ns
+
+    build_feed(show)
+    # Same bytes, same validators, file untouched
+    assert get_feed_bytes(show) is first
+    assert show.feed_path.stat().st_mtime_ns == mtime
+    assert gzip.decompress(first.encoded["gzip"]) == first.body == show.feed_path.read_bytes()
+
+
+def _last_build_date(feed: bytes) -> datetime:
+    return parsedate_to_datetime(re.search(rb"<lastBuildDate>(.+?)<", feed).group(1).decode())
+
+
+def test_last_build_date_follows_content_changes(tmp_path):
+    show = _make_show(tmp_path)
+    episode = {"file_size_bytes": 5_000_000, "duration_seconds": 1200,
+               "duration_formatted": "00:20:00", "rss_summary": "First take."}
+    # No "published" on the older episode: its date stands in, not the build time
+    _save_episode_catalog([
+        {**episode, "date": "2026-02-16"},
+        {**episode, "date": "2026-02-17", "published": "2026-02-17T18:30:00+00:00"},
+    ], show=show)
+    build_feed(show)
+
+    # Pretend the feed was last built a while ago; an unchanged rebuild keeps it
+    old = re.sub(rb"<lastBuildDate>.+?<", b"<lastBuildDate>Mon, 16 Feb 2026 20:00:00 +0000<",
+                 show.feed_path.read_bytes())
+    show.feed_path.write_bytes(old)
+    build_feed(show)
+    assert show.feed_path.read_bytes() == old == get_feed_bytes(show).body
+
+    # Editing the older episode is a change, even though the newest is untouched
+    catalog = _load_episode_catalog(show)
+    catalog[0]["rss_summary"] = "Corrected take."
+    _save_episode_catalog(catalog, show=show)
+    build_feed(show)
+    rebuilt = get_feed_bytes(show)
+    assert b"Corrected take." in rebuilt.body
+    assert abs((datetime.now(UTC) - _last_build_date(rebuilt.body)).total_seconds()) < 60
+    assert brotli.decompress(rebuilt.encoded["br"]) == rebuilt.body
+
+
+def test_feed_conditional_get_and_compression(tmp_path):
+    show = _make_show(tmp_path)
+    with patch("src.feed_builder.database.save_episode"):
+        add_episode(_make_metadata("2026-02-16", tmp_path=tmp_path), show=show)
+    client = _feed_client(show)
+
+    full = client.get("/feed.xml", headers={"Accept-Encoding": "identity"})
+    assert full.status_code == 200
+    assert full.content == show.feed_path.read_bytes()
+    assert full.headers["Cache-Control"].startswith("public")
+    etag, last_modified = full.headers["ETag"], full.headers["Last-Modified"]
+
+    assert client.get("/feed.xml", headers={"If-None-Match": etag}).status_code == 304
+    not_modified = client.get("/feed.xml", headers={"If-Modified-Since": last_modified})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+
+    zipped = client.get("/feed.xml", headers={"Accept-Encoding": "gzip"})
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert int(zipped.headers["Content-Length"]) < len(full.content) / 2
+    assert zipped.content == full.content  # decoded by the client
+    assert client.get("/feed.xml", headers={"Accept-Encoding": "gzip",
+                                            "If-None-Match": zipped.headers["ETag"]}
+                      ).status_code == 304
+
+    # A new episode changes the validators
+    with patch("src.feed_builder.database.save_episode"):
+        add_episode(_make_metadata("2026-02-17", tmp_path=tmp_path), show=show)
+    changed = client.get("/feed.xml", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
@@ -0,0 +1,68 @@
+"""Tests for episode hosting and DB sync against the local storage backend."""
+
+import os
+
+import pytest
+
+from config import settings
+from src import database, gcs_storage, storage_backend
+from src.storage_backend import LocalBackend
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    backend = LocalBackend(tmp_path / "storage", "http://test")
+    monkeypatch.setattr(settings, "storage_backend", "local")
+    monkeypatch.setattr(storage_backend, "_backend", backend)
+    return backend
+
+
+@pytest.fixture
+def bucket(backend):
+    return backend.bucket
+
+
+def _mp3(tmp_path, size: int):
+    path = tmp_path / "episode.mp3"
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def test_identical_republish_is_skipped(tmp_path, bucket):
+    mp3 = _mp3(tmp_path, 200_000)
+    url = gcs_storage.upload_episode(mp3, "2099-01-01", show_id="hootline")
+    assert url == "http://test/storage/episodes/hootline/noctua-2099-01-01.mp3"
+    assert bucket.bytes_uploaded == 200_000
+
+    assert gcs_storage.upload_episode(mp3, "2099-01-01", show_id="hootline") == url
+    assert bucket.bytes_uploaded == 200_000
+
+    # Changed audio of the same size is uploaded again
+    mp3.write_bytes(os.urandom(200_000))
+    gcs_storage.upload_episode(mp3, "2099-01-01", show_id="hootline")
+    assert bucket.bytes_uploaded == 400_000
+
+
+def test_large_episode_is_composed_from_slices(tmp_path, bucket, monkeypatch):
+    monkeypatch.setattr(gcs_storage, "COMPOSITE_UPLOAD_THRESHOLD", 100_000)
+    monkeypatch.setattr(gcs_storage, "COMPOSITE_SLICE_BYTES", 30_000)
+    mp3 = _mp3(tmp_path, 250_001)
+
+    gcs_storage.upload_episode(mp3, "2099-01-02", show_id="hootline")
+
+    blob = bucket.get_blob("episodes/hootline/noctua-2099-01-02.mp3")
+    assert blob.path.read_bytes() == mp3.read_bytes()
+    # Slices are cleaned up; only the composed episode remains
+    assert [b.name for b in bucket.list_blobs("episodes/")] == [blob.name]
+    assert bucket.bytes_uploaded == 250_001
+
+
+def test_db_upload_and_download_round_trip(tmp_path, backend):
+    db_path = tmp_path / "noctua.db"
+    database.save_digest("2099-01-03", "Stored", 1, 1, "Topics", db_path=db_path)
+    assert gcs_storage.upload_db(db_path, "hootline") is True
+
+    restored = tmp_path / "restored" / "noctua.db"
+    assert gcs_storage.download_db(restored, "hootline") is True
+    assert database.get_digest("2099-01-03", db_path=restored)["markdown_text"] == "Stored"
+    assert gcs_storage.download_db(restored, "other-show") is False
@@ -0,0 +1,31 @@
+"""Tests for the shared HTTP client."""
+
+from unittest.mock import MagicMock, patch
+
+from src import http_client
+
+
+def test_session_is_shared_and_pooled():
+    http_client.close()
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+    adapter = session.get_adapter("https://generativelanguage.googleapis.com")
+    assert adapter._pool_maxsize == http_client.POOL_MAXSIZE
+    http_client.close()
+
+
+def test_request_applies_default_timeout():
+    with patch("requests.Session.request", return_value=MagicMock()) as mock_request:
+        http_client.post("https://example.com/api", json={})
+    assert mock_request.call_args.kwargs["timeout"] == http_client.DEFAULT_TIMEOUT
+    http_client.close()
+
+
+def test_pool_stats_reports_hosts():
+    http_client.close()
+    assert http_client.pool_stats()["hosts"] == {}
+    http_client.get_session()
+    http_client._adapter.poolmanager.connection_from_url("https://example.com")
+    stats = http_client.pool_stats()
+    assert stats["hosts"]["https://example.com:443"]["connections_opened"] == 0
+    http_client.close()
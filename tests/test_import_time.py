@@ -0,0 +1,31 @@
+"""Import-time regression test: heavy dependencies stay out of app startup.
+
+See scripts/import_time_audit.py for the full audit (timings, first /health).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Loaded on first use (GCS, Gmail, HTML parsing, MP3 metadata, feed building)
+DEFERRED_MODULES = ("google.cloud", "google.api_core", "googleapiclient", "google_crc32c",
+                    "bs4", "lxml", "mutagen", "feedgen")
+
+
+def _imported_modules(module: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    return {line.split("|")[-1].strip() for line in out.splitlines()
+            if line.startswith("import time:")}
+
+
+def test_app_import_defers_heavy_dependencies():
+    modules = _imported_modules("main")
+    assert "main" in modules
+    loaded = sorted(name for name in modules
+                    if any(name == d or name.startswith(d + ".") for d in DEFERRED_MODULES))
+    assert loaded == []
@@ -0,0 +1,124 @@
+"""Tests for the persistent background job queue."""
+
+import asyncio
+import time
+
+import pytest
+
+from src import job_queue
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "jobs.db"
+
+
+def test_claim_retry_and_fail(db):
+    job_id = job_queue.enqueue("transcribe", {"date": "2099-01-01"}, max_attempts=2, db_path=db)
+
+    job = job_queue.claim("transcribe", "w1", db_path=db)
+    assert (job.id, job.payload, job.attempts) == (job_id, {"date": "2099-01-01"}, 1)
+    # Leased: nobody else gets it
+    assert job_queue.claim("transcribe", "w2", db_path=db) is None
+
+    assert job_queue.fail(job, "boom", db_path=db) is True
+    # Backoff: not due yet
+    assert job_queue.claim("transcribe", "w2", db_path=db) is None
+
+    conn = job_queue._connect(db)
+    conn.execute("UPDATE jobs SET run_after = 0")
+    conn.close()
+    job = job_queue.claim("transcribe", "w2", db_path=db)
+    assert job.attempts == 2 and job.final_attempt
+    assert job_queue.fail(job, "boom again", db_path=db) is False
+    assert job_queue.stats(db_path=db)["jobs"] == {"transcribe": {"failed": 1}}
+
+
+def test_dedupe_coalesces_queued_jobs_only(db):
+    first = job_queue.enqueue("gcs_sync", {"show_id": "a"}, dedupe_key="a", db_path=db)
+    assert job_queue.enqueue("gcs_sync", {"show_id": "a"}, dedupe_key="a", db_path=db) == first
+    assert job_queue.enqueue("gcs_sync", {"show_id": "b"}, dedupe_key="b", db_path=db) != first
+
+    job_queue.claim("gcs_sync", "w1", db_path=db)
+    # The running sync may already have read the DB: a new one is queued
+    assert job_queue.enqueue("gcs_sync", {"show_id": "a"}, dedupe_key="a", db_path=db) != first
+
+
+def test_stalled_leases_are_reclaimed(db):
+    job_queue.enqueue("transcribe", {"date": "2099-01-01"}, db_path=db)
+    job = job_queue.claim("transcribe", "dead-worker", lease_seconds=60, db_path=db)
+
+    # Lease still valid: left alone unless reclaiming at startup
+    assert job_queue.reclaim_stalled(db_path=db) == 0
+    assert job_queue.heartbeat(job, db_path=db) is True
+    assert job_queue.reclaim_stalled(expired_only=False, db_path=db) == 1
+
+    # The old owner lost the lease; the job resumes on a new worker
+    assert job_queue.heartbeat(job, db_path=db) is False
+    resumed = job_queue.claim("transcribe", "new-worker", db_path=db)
+    assert resumed.id == job.id and resumed.attempts == 2
+    job_queue.complete(job, db_path=db)  # stale owner: ignored
+    assert job_queue.stats(db_path=db)["jobs"] == {"transcribe": {"running": 1}}
+
+
+async def test_worker_pool_caps_concurrency_per_type(db):
+    running = {"transcribe": 0, "gcs_sync": 0}
+    peak = dict(running)
+    done = []
+
+    def handler(job_type):
+        async def run(job):
+            running[job_type] += 1
+            peak[job_type] = max(peak[job_type], running[job_type])
+            await asyncio.sleep(0.05)
+            running[job_type] -= 1
+            done.append(job.id)
+            if job.payload.get("fail"):
+                raise RuntimeError("nope")
+        return run
+
+    pool = job_queue.WorkerPool(
+        handlers={"transcribe": handler("transcribe"), "gcs_sync": handler("gcs_sync")},
+        concurrency={"transcribe": 2}, db_path=db,
+    )
+    pool.start()
+    try:
+        for i in range(5):
+            job_queue.enqueue("transcribe", {"n": i}, db_path=db)
+        for i in range(3):
+            job_queue.enqueue("gcs_sync", {"fail": i == 0}, max_attempts=1, db_path=db)
+        deadline = time.monotonic() + 5
+        while len(done) < 8 and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+    finally:
+        await pool.stop()
+
+    assert len(done) == 8
+    assert peak == {"transcribe": 2, "gcs_sync": 1}
+    jobs = job_queue.stats(db_path=db)["jobs"]
+    assert jobs == {"transcribe": {"done": 5}, "gcs_sync": {"done": 2, "failed": 1}}
+
+
+async def test_drain_flushes_debounced_syncs(db):
+    uploads = []
+
+    async def upload(job):
+        uploads.append(job.payload["show_id"])
+
+    pool = job_queue.WorkerPool(handlers={"gcs_sync": upload}, concurrency={}, db_path=db)
+    pool.start()
+    try:
+        # Several writes inside the debounce window share one upload
+        for _ in range(3):
+            job_queue.enqueue("gcs_sync", {"show_id": "a"}, dedupe_key="a",
+                              delay_seconds=60, db_path=db)
+        job_queue.enqueue("gcs_sync", {"show_id": "b"}, dedupe_key="b",
+                          delay_seconds=60, db_path=db)
+        await asyncio.sleep(0.1)
+        assert uploads == []
+
+        # Shutdown flush: delayed uploads run now
+        assert await pool.drain("gcs_sync", timeout=5) is True
+    finally:
+        await pool.stop()
+    assert sorted(uploads) == ["a", "b"]
@@ -0,0 +1,76 @@
+"""Tests for the Gemini response cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import llm_cache, llm_client
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    with patch("src.llm_cache.settings.llm_cache_path", str(tmp_path / "llm_cache.db")):
+        yield tmp_path / "llm_cache.db"
+
+
+def _ok_response(text: str) -> MagicMock:
+    resp = MagicMock(status_code=200)
+    resp.json.return_value = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    return resp
+
+
+def test_request_key_covers_generation_config():
+    payload = {"contents": [{"parts": [{"text": "hi"}]}],
+               "generationConfig": {"temperature": 0.0}}
+    changed = {**payload, "generationConfig": {"temperature": 0.3}}
+    assert llm_cache.request_key("m", payload) == llm_cache.request_key("m", dict(payload))
+    assert llm_cache.request_key("m", payload) != llm_cache.request_key("m", changed)
+    assert llm_cache.request_key("m", payload) != llm_cache.request_key("other", payload)
+
+
+def test_readwrite_records_and_replays(cache_db):
+    with (
+        patch("src.llm_cache.NOCTUA_LLM_CACHE", "readwrite"),
+        patch("src.llm_client.settings.gemini_api_key", "test-key"),
+        patch("src.http_client.post", return_value=_ok_response("Tech")) as mock_post,
+    ):
+        assert llm_client.call_fast("sys", "classify", cache_site="classify") == "Tech"
+        assert llm_client.call_fast("sys", "classify", cache_site="classify") == "Tech"
+        # Calls without a call site are never cached
+        llm_client.call_fast("sys", "classify")
+        assert llm_cache.stats()["call_sites"] == {"classify": {"entries": 1, "bytes": 4}}
+    assert mock_post.call_count == 2
+
+
+def test_readonly_and_off_modes(cache_db):
+    key = llm_cache.request_key("m", {"x": 1})
+    with patch("src.llm_cache.NOCTUA_LLM_CACHE", "readonly"):
+        llm_cache.put(key, "recorded", "classify")
+        assert llm_cache.get(key) is None  # readonly never writes
+        assert not cache_db.exists()  # ...nor creates the cache file
+    with patch("src.llm_cache.NOCTUA_LLM_CACHE", "readwrite"):
+        llm_cache.put(key, "recorded", "classify")
+    with patch("src.llm_cache.NOCTUA_LLM_CACHE", "readonly"):
+        assert llm_cache.get(key) == "recorded"
+        assert llm_cache.stats()["call_sites"]["classify"]["entries"] == 1
+    with patch("src.llm_cache.NOCTUA_LLM_CACHE", "off"):
+        assert llm_cache.get(key) is None
+
+
+def test_ttl_and_lru_eviction(cache_db):
+    with (
+        patch("src.llm_cache.NOCTUA_LLM_CACHE", "readwrite"),
+        patch("src.llm_cache.settings.llm_cache_max_mb", 1),
+        patch.dict(llm_cache.CALL_SITE_TTLS, {"short": -1}),
+    ):
+        llm_cache.put("expired", "x", "short")
+        assert llm_cache.get("expired") is None
+
+        big = "x" * 400_000
+        llm_cache.put("a", big, "classify")
+        llm_cache.put("b", big, "classify")
+        assert llm_cache.get("a") == big  # touch "a" so "b" is least recently used
+        llm_cache.put("c", big, "classify")  # over 1 MB → evict "b"
+        assert llm_cache.get("b") is None
+        assert llm_cache.get("a") == big
+        assert llm_cache.get("c") == big
@@ -0,0 +1,71 @@
+"""Tests for the async Gemini client."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src import http_client, llm_client
+from src.exceptions import LLMAPIError
+
+
+def _gemini_response(text: str) -> dict:
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def test_call_fast_async_retries_on_429():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, text="slow down")
+        return httpx.Response(200, json=_gemini_response("Tech"))
+
+    client = _mock_client(handler)
+    with (
+        patch("src.llm_client.settings.gemini_api_key", "test-key"),
+        patch("src.llm_client.RETRY_BACKOFF", [0]),
+        patch.object(http_client, "get_async_client", return_value=client),
+    ):
+        assert await llm_client.call_fast_async("system", "classify") == "Tech"
+    assert len(calls) == 2
+    assert calls[0].headers["x-goog-api-key"] == "test-key"
+    await client.aclose()
+
+
+async def test_call_async_raises_on_client_error():
+    client = _mock_client(lambda request: httpx.Response(400, text="bad request"))
+    with (
+        patch("src.llm_client.settings.gemini_api_key", "test-key"),
+        patch.object(http_client, "get_async_client", return_value=client),
+        pytest.raises(LLMAPIError),
+    ):
+        await llm_client.call_summarize_async("system", "summarize")
+    await client.aclose()
+
+
+async def test_stream_summarize_async_yields_sse_chunks():
+    body = "".join(
+        f'data: {{"candidates": [{{"content": {{"parts": [{{"text": "{t}"}}]}}}}]}}\n\n'
+        for t in ("Hello ", "world")
+    )
+    client = _mock_client(lambda request: httpx.Response(200, text=body))
+    with (
+        patch("src.llm_client.settings.gemini_api_key", "test-key"),
+        patch.object(http_client, "get_async_client", return_value=client),
+    ):
+        chunks = [c async for c in llm_client.stream_summarize_async("system", "summarize")]
+    assert chunks == ["Hello ", "world"]
+    await client.aclose()
+
+
+async def test_async_client_is_reused_within_a_loop():
+    client = http_client.get_async_client()
+    assert http_client.get_async_client() is client
+    await http_client.aclose_async_client()
+    assert client.is_closed
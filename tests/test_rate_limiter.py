@@ -0,0 +1,62 @@
+"""Tests for the client-side Gemini rate limiter."""
+
+import threading
+import time
+
+from src.rate_limiter import ModelLimiter, Priority
+
+
+def test_queued_calls_are_served_by_priority():
+    limiter = ModelLimiter("test", rpm=6000, tpm=10**6, max_concurrency=1)
+    order = []
+
+    def worker(priority: Priority) -> None:
+        with limiter.slot(10, priority):
+            order.append(priority)
+
+    with limiter.slot(10, Priority.PREPARATION):
+        threads = []
+        for priority in (Priority.WEEKLY_TRENDS, Priority.TRANSCRIPTION, Priority.PREPARATION):
+            t = threading.Thread(target=worker, args=(priority,))
+            t.start()
+            threads.append(t)
+            # Let each waiter enqueue before the next one arrives
+            while limiter.stats()["queue_depth"] < len(threads):
+                time.sleep(0.005)
+        assert limiter.stats()["queue_by_priority"]["weekly_trends"] == 1
+    for t in threads:
+        t.join(timeout=5)
+
+    assert order == [Priority.PREPARATION, Priority.TRANSCRIPTION, Priority.WEEKLY_TRENDS]
+    assert limiter.stats()["queue_depth"] == 0
+
+
+def test_token_bucket_throttles_and_settle_refunds():
+    limiter = ModelLimiter("test", rpm=6000, tpm=6000, max_concurrency=4)  # 100 tokens/s
+
+    with limiter.slot(6000) as permit:
+        permit.settle(5950)  # response used fewer tokens than reserved
+    assert limiter.stats()["tokens_available"] >= 50
+
+    # 50 tokens short at 100 tokens/s
+    start = time.monotonic()
+    with limiter.slot(100):
+        pass
+    waited = time.monotonic() - start
+    assert 0.3 < waited < 1.5
+    stats = limiter.stats()
+    assert stats["granted"] == 2
+    assert stats["throttled"] == 1
+    assert stats["max_wait_seconds"] > 0.2
+
+
+def test_pause_holds_new_calls():
+    limiter = ModelLimiter("test", rpm=6000, tpm=10**6, max_concurrency=4)
+    with limiter.slot(1) as permit:
+        permit.pause(0.3)
+    assert limiter.stats()["paused_seconds"] > 0
+
+    start = time.monotonic()
+    with limiter.slot(1):
+        pass
+    assert time.monotonic() - start >= 0.25
@@ -0,0 +1,77 @@
+"""Tests for parallel per-show startup and readiness gating."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+import main
+from config import ShowConfig
+from src import feed_builder, gcs_storage
+
+
+def _show(tmp_path, show_id: str) -> ShowConfig:
+    return ShowConfig(
+        show_id=show_id,
+        podcast_title=f"Show {show_id}",
+        podcast_description="Test",
+        gmail_credentials_json="",
+        gmail_token_json="",
+        gmail_label="",
+        notebooklm_notebook_url="",
+        google_account_email="",
+        google_account_password="",
+        output_dir=tmp_path / show_id,
+    )
+
+
+class _Workers:
+    started = False
+
+    def start(self):
+        self.started = True
+
+
+async def test_shows_initialize_in_parallel_and_serve_when_ready(tmp_path, monkeypatch):
+    states = {sid: main.ShowState(show=_show(tmp_path, sid), ready=False)
+              for sid in ("slow", "b", "c")}
+    monkeypatch.setattr(main, "_show_states", states)
+    monkeypatch.setattr(main.settings, "startup_concurrency", 2)
+    monkeypatch.setattr(main, "_missed_todays_run", lambda state: False)
+    monkeypatch.setattr(feed_builder, "sync_catalog_from_db", lambda show: None)
+
+    lock = threading.Lock()
+    running = peak = 0
+
+    def download(db_path, show_id):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.4 if show_id == "slow" else 0.05)
+        with lock:
+            running -= 1
+        return False
+
+    monkeypatch.setattr(gcs_storage, "download_db", download)
+    workers = _Workers()
+    task = asyncio.create_task(main._deferred_startup(workers))
+
+    # The fast shows serve while the slow one is still downloading
+    deadline = time.monotonic() + 5
+    while not (states["b"].ready and states["c"].ready) and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    assert states["b"].ready and states["c"].ready
+    assert main._resolve_show("b") is states["b"]
+    with pytest.raises(HTTPException) as exc:
+        main._resolve_show("slow")
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == str(main.STARTUP_RETRY_AFTER_SECONDS)
+    assert main._resolve_show("slow", require_ready=False) is states["slow"]
+    assert not workers.started
+
+    await task
+    assert states["slow"].ready and workers.started
+    assert peak == 2
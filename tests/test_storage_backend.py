@@ -0,0 +1,72 @@
+"""Tests for the object storage interface and the local backend."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import settings
+from routers.episodes import router
+from src import storage_backend
+from src.storage_backend import LocalBackend
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    backend = LocalBackend(tmp_path / "storage", "http://test", signing_key="secret")
+    monkeypatch.setattr(settings, "storage_backend", "local")
+    monkeypatch.setattr(storage_backend, "_backend", backend)
+    return backend
+
+
+def test_object_operations(tmp_path, backend):
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"0123456789")
+
+    info = backend.put("a/whole", src, "application/octet-stream")
+    assert (info.key, info.size) == ("a/whole", 10)
+    backend.put("a/tail", src, offset=6)
+    backend.put("a/middle", src, offset=2, length=3)
+    backend.put_bytes("b/note", b"hi")
+
+    assert backend.stat("a/middle").size == 3
+    assert backend.stat("missing") is None
+    assert [o.key for o in backend.list_objects("a/")] == ["a/middle", "a/tail", "a/whole"]
+
+    composed = backend.compose("c/joined", ["a/middle", "a/tail"])
+    assert backend.get_bytes("c/joined") == b"2346789"
+    assert composed.crc32c == backend.stat("c/joined").crc32c
+
+    backend.get("a/whole", tmp_path / "out" / "whole.bin")
+    assert (tmp_path / "out" / "whole.bin").read_bytes() == b"0123456789"
+    with pytest.raises(FileNotFoundError):
+        backend.get("missing", tmp_path / "out" / "missing.bin")
+    assert not (tmp_path / "out" / "missing.bin").exists()
+
+    assert backend.delete("b/note") is True
+    assert backend.delete("b/note") is False
+
+
+def test_signed_urls_gate_private_objects(backend):
+    backend.put_bytes("db/hootline/noctua.db", b"sqlite")
+    backend.put_bytes("episodes/hootline/noctua-2099-01-01.mp3", b"mp3")
+    client = TestClient(_app())
+
+    # Episodes are public, like the GCS bucket
+    episode = backend.public_url("episodes/hootline/noctua-2099-01-01.mp3")
+    assert client.get(episode.removeprefix("http://test")).content == b"mp3"
+
+    private = backend.public_url("db/hootline/noctua.db").removeprefix("http://test")
+    assert client.get(private).status_code == 403
+    signed = backend.signed_url("db/hootline/noctua.db", expires_seconds=60)
+    assert client.get(signed.removeprefix("http://test")).content == b"sqlite"
+
+    expired = backend.signed_url("db/hootline/noctua.db", expires_seconds=-1)
+    assert client.get(expired.removeprefix("http://test")).status_code == 403
+    # Public prefix can't be used to reach outside it
+    assert backend.path("episodes/../db/hootline/noctua.db") is None
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    return app
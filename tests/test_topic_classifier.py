@@ -273,3 +273,96 @@ def test_classify_badminton():
         content="PV Sindhu and Lakshya Sen won their BWF Super 750 badminton matches.",
     )
     assert classify_article(article) == Topic.BADMINTON
+
+
+# --- Learned sender routes ---
+
+
+def test_stable_sender_routed_without_gemini(tmp_path):
+    from unittest.mock import patch
+
+    from src import database
+    from src.topic_classifier import classify_articles_batch
+
+    db_path = tmp_path / "test.db"
+    database.record_sender_topics(
+        [("lenny's newsletter", Topic.PRODUCT_MANAGEMENT.value)] * 20, db_path=db_path,
+    )
+    # Mixed-topic sender stays with Gemini
+    database.record_sender_topics(
+        [("the hindu", Topic.INDIAN_POLITICS.value)] * 8
+        + [("the hindu", Topic.INDIAN_CRICKET.value)] * 4,
+        db_path=db_path,
+    )
+
+    articles = [
+        _make_article(source="Lenny’s Newsletter", title="Roadmaps"),
+        _make_article(source="The Hindu", title="Kohli century"),
+    ]
+    with patch("src.llm_client.call_fast", return_value='{"1": "Indian Cricket"}') as mock_call:
+        results = classify_articles_batch(articles, db_path=db_path)
+
+    assert results == {0: Topic.PRODUCT_MANAGEMENT, 1: Topic.INDIAN_CRICKET}
+    user_message = mock_call.call_args[0][1]
+    assert "Roadmaps" not in user_message
+    # Gemini's decision was added to the sender's distribution
+    stats = database.get_sender_topic_stats(db_path=db_path)
+    assert stats["the hindu"][Topic.INDIAN_CRICKET.value] == 5
+    assert stats["lenny's newsletter"] == {Topic.PRODUCT_MANAGEMENT.value: 20}
+
+
+def test_audited_route_is_revoked_when_sender_changes_focus(tmp_path):
+    from unittest.mock import patch
+
+    from src import database
+    from src.topic_classifier import _load_sender_routes, classify_articles_batch
+
+    db_path = tmp_path / "test.db"
+    database.record_sender_topics(
+        [("the neuron", Topic.TECH_AI.value)] * 200, db_path=db_path,
+    )
+    assert _load_sender_routes(db_path) == {"the neuron": Topic.TECH_AI.value}
+
+    answers = []
+    with (
+        patch("src.topic_classifier.SENDER_ROUTE_AUDIT_EVERY", 1),
+        patch("src.llm_client.call_fast", return_value='{"0": "Entertainment"}') as mock_call,
+    ):
+        for n in range(3):
+            article = _make_article(source="The Neuron", title=f"Box office {n}")
+            answers.append(classify_articles_batch([article], db_path=db_path)[0])
+
+    # Every routed article was audited; Gemini's answer wins over the route
+    assert mock_call.call_count == 3
+    assert answers == [Topic.ENTERTAINMENT] * 3
+    # A long history doesn't outweigh a few disagreeing audits
+    assert _load_sender_routes(db_path) == {}
+    stats = database.get_sender_topic_stats(db_path=db_path)
+    assert round(sum(stats["the neuron"].values())) == 50
+
+
+async def test_async_batch_keeps_local_work_off_the_event_loop():
+    import asyncio
+    import time
+    from unittest.mock import patch
+
+    from src.topic_classifier import classify_articles_batch_async
+
+    def slow_prepare(articles, db_path):
+        time.sleep(0.2)  # stands in for model inference and sqlite reads
+        return {0: Topic.SEATTLE}, [], {}
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    with patch("src.topic_classifier._prepare_batch", side_effect=slow_prepare):
+        results = await classify_articles_batch_async([_make_article()])
+    task.cancel()
+    assert results == {0: Topic.SEATTLE}
+    assert ticks > 5
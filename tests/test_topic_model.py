@@ -0,0 +1,142 @@
+"""Tests for the local topic model and its use in topic_classifier."""
+
+from unittest.mock import patch
+
+from src import database, topic_model
+from src.models import Article
+from src.topic_classifier import Topic, classify_articles_batch
+from src.topic_model import SKIP_LABEL, TopicModel, _softmax, evaluate, model_text, train
+
+
+def _samples() -> list[tuple[str, str]]:
+    tech = [
+        ("The Neuron", "OpenAI ships a new model",
+         "The AI lab released a GPT model for developers"),
+        ("TLDR", "Startup raises Series B",
+         "The software startup building LLM tooling raised funding"),
+        ("The Verge", "New chip for AI",
+         "Nvidia announced a GPU aimed at machine learning workloads"),
+    ]
+    pm = [
+        ("Lenny's Newsletter", "How to run user research",
+         "Product managers should interview users weekly"),
+        ("The Product Compass", "Prioritization frameworks",
+         "RICE scoring helps product teams prioritize roadmaps"),
+        ("Aakash Gupta", "PM interview guide",
+         "Product sense questions test roadmap and metrics thinking"),
+    ]
+    f1 = [
+        ("Google Alerts (f1)", "Verstappen takes pole",
+         "Red Bull driver wins Grand Prix qualifying"),
+        ("Autosport", "McLaren upgrade",
+         "The Formula 1 team brings a new floor to the Grand Prix"),
+        ("Google Alerts (formula 1)", "Hamilton podium",
+         "Ferrari driver finishes third at the Grand Prix"),
+    ]
+    promo = [
+        ("Shop Deals", "50% off everything",
+         "Limited time sale use code SAVE50 at checkout today"),
+        ("Shop Deals", "Last chance sale", "Sale ends tonight free shipping on all orders"),
+    ]
+    samples = []
+    for rows, label in ((tech, Topic.TECH_AI.value), (pm, Topic.PRODUCT_MANAGEMENT.value),
+                        (f1, Topic.F1.value), (promo, SKIP_LABEL)):
+        for source, title, content in rows:
+            samples.append((model_text(source, title, content), label))
+    return samples * 5
+
+
+def test_train_and_predict():
+    model = train(_samples())
+    label, confidence = model.predict(
+        model_text("The Neuron", "AI model launch", "OpenAI released a new GPT model")
+    )
+    assert label == Topic.TECH_AI.value
+    assert 0 < confidence <= 1
+    assert abs(sum(model.predict_proba("anything").values()) - 1.0) < 1e-9
+
+
+def test_predict_matches_training_vectors(monkeypatch):
+    samples = _samples()
+    # Prune hard, so some features lose all their weights
+    monkeypatch.setattr(topic_model, "PRUNE_WEIGHT", 0.5)
+    seen = {}
+    vectorize = TopicModel.vectorize
+
+    def record(model, text):
+        seen[text] = vectorize(model, text)
+        return seen[text]
+
+    with patch.object(TopicModel, "vectorize", autospec=True, side_effect=record):
+        model = train(samples)
+    assert sum(len(w) for w in model.weights) < len(model.idf)
+
+    # Inference sees the same vector, so the same probability, as training did
+    for text, _ in samples:
+        assert model.vectorize(text) == seen[text]
+        assert model.predict_proba(text) == dict(zip(model.labels,
+                                                     _softmax(model._scores(seen[text]))))
+
+
+def test_model_json_roundtrip():
+    model = train(_samples())
+    restored = TopicModel.from_json(model.to_json())
+    text = model_text("Lenny's Newsletter", "Roadmaps", "Product teams and user research")
+    assert restored.predict(text)[0] == model.predict(text)[0]
+    assert restored.sample_count == model.sample_count
+
+
+def test_evaluate_reports_coverage():
+    samples = _samples()
+    model = train(samples)
+    metrics = evaluate(model, samples, confidence=0.5)
+    assert metrics["accuracy"] > 0.9
+    assert 0 <= metrics["coverage"] <= 1
+
+
+def _article(source: str, title: str, content: str) -> Article:
+    return Article(source=source, title=title, content=content,
+                   estimated_words=len(content.split()))
+
+
+def test_classifier_skips_gemini_for_confident_articles(tmp_path):
+    db_path = tmp_path / "test.db"
+    model = train(_samples(), epochs=20)
+    database.save_topic_model(model.to_json(), model.sample_count, db_path=db_path)
+
+    articles = [
+        _article("The Neuron", "OpenAI ships a new model",
+                 "The AI lab released a GPT model for developers"),
+        _article("Seattle Times", "Ferry schedule changes", "Puget Sound ferries adjust routes"),
+    ]
+    with (
+        patch("src.topic_classifier.LOCAL_MODEL_CONFIDENCE", 0.5),
+        patch("src.llm_client.call_fast", return_value='{"1": "Seattle"}') as mock_call,
+    ):
+        results = classify_articles_batch(articles, db_path=db_path)
+
+    assert results[0] == Topic.TECH_AI
+    assert results[1] == Topic.SEATTLE
+    # Only the ambiguous article was sent to Gemini
+    user_message = mock_call.call_args[0][1]
+    assert "Ferry schedule" in user_message
+    assert "OpenAI ships" not in user_message
+    # Gemini's answer was recorded as training data
+    labels = database.get_article_labels(db_path=db_path)
+    assert [lb["topic"] for lb in labels] == [Topic.SEATTLE.value]
+
+
+def test_classifier_falls_back_to_local_model_when_gemini_fails(tmp_path):
+    db_path = tmp_path / "test.db"
+    model = train(_samples(), epochs=20)
+    database.save_topic_model(model.to_json(), model.sample_count, db_path=db_path)
+
+    articles = [_article("Lenny's Newsletter", "User research tips",
+                         "Product managers should interview users weekly")]
+    with (
+        patch("src.topic_classifier.LOCAL_MODEL_CONFIDENCE", 1.1),
+        patch("src.llm_client.call_fast", side_effect=Exception("offline")),
+    ):
+        results = classify_articles_batch(articles, db_path=db_path)
+
+    assert results[0] == Topic.PRODUCT_MANAGEMENT